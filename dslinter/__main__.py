@@ -0,0 +1,4 @@
+"""Run the dslinter command with 'python -m dslinter'."""
+from dslinter.run import main
+
+main()
@@ -2,6 +2,7 @@
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 from typing import Dict
 
 from dslinter.utils.exception_handler import ExceptionHandler
@@ -24,8 +25,10 @@ class ChainIndexingPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [subscript node name, inferred type of object the function is called on]
-    _subscript_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [subscript node name, inferred type of object the function is called on]
+        self._subscript_types: Dict[str, str] = {}
 
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which libraries the variables are from. """
@@ -53,3 +56,7 @@ class ChainIndexingPandasChecker(BaseChecker):
                 self.add_message("chain-indexing-pandas", node=subscript_node)
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, subscript_node)
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget the inferred types of the subscripted variables of the module."""
+        self._subscript_types = {}
@@ -1,7 +1,7 @@
 """Checker which check whether df.values is used for dataframe conversion."""
-from typing import Dict
 import astroid
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 from pylint.checkers import BaseChecker
 
 from dslinter.utils.exception_handler import ExceptionHandler
@@ -23,9 +23,9 @@ class DataframeConversionPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [variable name, inferred type of object the function is called on]
-    _call_types: Dict[str, str] = {}
-    _imported_pandas = False
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._imported_pandas = False
 
     def visit_import(self, import_node: astroid.Import):
         """Visit import node to see whether pandas is imported."""
@@ -52,3 +52,7 @@ class DataframeConversionPandasChecker(BaseChecker):
                     return
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, call_node)
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget whether pandas is imported, the next module is checked for its own import."""
+        self._imported_pandas = False
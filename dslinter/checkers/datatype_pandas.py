@@ -3,6 +3,7 @@ import astroid as astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
 
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
 
 
@@ -23,7 +24,9 @@ class DatatypePandasChecker(BaseChecker):
     options = ()
 
     _data_import_functions = ["read_csv", "read_table", "read_excel"]
+    CALL_NAMES = frozenset(_data_import_functions)
 
+    @CallRouter.routed
     def visit_call(self, call_node: astroid.Call):
         """
         Vist call node and see whether datatype is set when a dataframe is imported from data.
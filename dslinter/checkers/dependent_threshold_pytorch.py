@@ -7,6 +7,7 @@ from pylint.interfaces import IAstroidChecker
 from pylint.checkers import BaseChecker
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 
 
 class DependentThresholdPytorchChecker(BaseChecker):
@@ -19,6 +20,7 @@ class DependentThresholdPytorchChecker(BaseChecker):
 
     name = "dependent-threshold-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W5521": (
             "The F1 Score is used but AUC is not used in the PyTorch code.",
@@ -29,6 +31,7 @@ class DependentThresholdPytorchChecker(BaseChecker):
 
     options = ()
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module: astroid.Module):
         """
         When a module node is visited, check whether there is f1 score function called.
@@ -7,6 +7,7 @@ from pylint.interfaces import IAstroidChecker
 from pylint.checkers import BaseChecker
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 
 
 class DependentThresholdScikitLearnChecker(BaseChecker):
@@ -18,6 +19,7 @@ class DependentThresholdScikitLearnChecker(BaseChecker):
 
     name = "dependent-threshold-scikitlearn"
     priority = -1
+    LIBRARIES = ("sklearn",)
     msgs = {
         "W5519": (
             "The F1 Score is used but AUC is not used in the Scikit-learn code.",
@@ -28,6 +30,7 @@ class DependentThresholdScikitLearnChecker(BaseChecker):
 
     options = ()
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module):
         """
         When a module node is visited, check whether there is f1 score function called.
@@ -7,6 +7,7 @@ from pylint.interfaces import IAstroidChecker
 import astroid
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 
 
 class DependentThresholdTensorflowChecker(BaseChecker):
@@ -19,6 +20,7 @@ class DependentThresholdTensorflowChecker(BaseChecker):
 
     name = "dependent-threshold-tensorflow"
     priority = -1
+    LIBRARIES = ("tensorflow",)
     msgs = {
         "W5520": (
             "The F1 Score is used but AUC is not used in the Tensorflow code.",
@@ -29,6 +31,7 @@ class DependentThresholdTensorflowChecker(BaseChecker):
 
     options = ()
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module):
         """
         When a module node is visited, check whether there is f1 score function called.
@@ -4,6 +4,7 @@ from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 
 
 class ModeTogglingPytorchChecker(BaseChecker):
@@ -13,6 +14,7 @@ class ModeTogglingPytorchChecker(BaseChecker):
 
     name = "mode-toggling-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W9998": (
             "The training mode did not toggle back in time in the pytorch code.",
@@ -22,6 +24,7 @@ class ModeTogglingPytorchChecker(BaseChecker):
     }
     options = ()
 
+    @ModuleImports.requires_libraries
     def visit_for(self, for_node: astroid.For):
         """
         When a For node is visited, check whether it violated the rule in this checker.
@@ -4,6 +4,7 @@ from pylint.interfaces import IAstroidChecker
 from pylint.checkers import BaseChecker
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.randomness_control_helper import check_main_module, has_import
 
 
@@ -14,6 +15,7 @@ class DeterministicAlgorithmChecker(BaseChecker):
 
     name = "deterministic-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W5507": (
             "The torch.use_deterministic_algorithm()  is not used or not set to True",
@@ -34,6 +36,7 @@ class DeterministicAlgorithmChecker(BaseChecker):
         ),
     )
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module: astroid.Module):
         """
         Check whether there is a rule violation.
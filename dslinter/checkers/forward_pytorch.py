@@ -2,8 +2,11 @@
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.randomness_control_helper import has_import
 
 
@@ -14,6 +17,7 @@ class ForwardPytorchChecker(BaseChecker):
 
     name = "forward-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W5516": (
             "The self.net.forward() is used in the code rather than self.net().",
@@ -23,12 +27,19 @@ class ForwardPytorchChecker(BaseChecker):
     }
     options = ()
 
-    _import_torch = False
+    CALL_NAMES = frozenset(["forward"])
 
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._import_torch = False
+
+    @ModuleImports.requires_libraries
     def visit_import(self, import_node: astroid.Import):
         if self._import_torch is False:
             self._import_torch = has_import(import_node, "torch")
 
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, call_node: astroid.Call):
         """
         When a Call node is visited, check whether it violated the rule in this checker.
@@ -65,5 +76,6 @@ class ForwardPytorchChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, call_node)
 
-    def leave_module(self, module: astroid.Module):
+    def leave_module(self, _module: astroid.Module):
+        """Forget whether torch is imported, so it is looked up again in the next module."""
         self._import_torch = False
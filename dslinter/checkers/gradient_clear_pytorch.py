@@ -4,6 +4,7 @@ from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 
 
 class GradientClearPytorchChecker(BaseChecker):
@@ -13,6 +14,7 @@ class GradientClearPytorchChecker(BaseChecker):
 
     name = "gradient-clear-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W5517": (
             "The optimizer.zero_grad() is not used in pytorch code when loss_fn.backward() and optimizer.step() are used.",
@@ -22,6 +24,7 @@ class GradientClearPytorchChecker(BaseChecker):
     }
     options = ()
 
+    @ModuleImports.requires_libraries
     def visit_for(self, for_node: astroid.For):
         """
         When a For node is visited, check whether it violated the rule in this checker.
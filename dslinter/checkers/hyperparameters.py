@@ -1,10 +1,12 @@
 """Hyperparameter checker checks whether all hyperparameters for learning algorithms are set."""
-from typing import List, Dict
+from typing import Collection, List, Dict, Tuple
 import astroid
 from pylint.lint import PyLinter
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.resources import Resources
 
 
@@ -16,18 +18,18 @@ class HyperparameterChecker(BaseChecker):
     def __init__(self, linter: PyLinter = None) -> None:
         super().__init__(linter)
         self.HYPERPARAMETERS_MAIN = {}
-        self.HYPERPARAMETER_RESOURCE = ""
         self.MESSAGE = ""
         self.LIBRARY = ""
-        self.call_types = {}
+        self.CALL_NAMES = frozenset()
+        self.LIBRARIES = ()
 
-    def visit_importfrom(self, node: astroid.ImportFrom):
-        try:
-            for name, _ in node.names:
-                self.call_types[name] = node.modname.split('.')[0]
-        except:
-            ExceptionHandler.handle(self, node)
+    def open(self):
+        """Route the calls to the learning algorithms of the imported library to this checker."""
+        self.CALL_NAMES = Resources.get_hyperparameter_registry(self.LIBRARY).classes
+        self.LIBRARIES = tuple(Resources.get_library_imports(self.LIBRARY))
 
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, node: astroid.Call):
         """
         When a Call node is visited, check whether hyperparameters are set.
@@ -50,21 +52,21 @@ class HyperparameterChecker(BaseChecker):
     def hyperparameter_in_class(self, node: astroid.Call, function_name: str):
         """Cheches whether the required hyperparameters are used in the class."""
 
-        hyperparams_all = Resources.get_hyperparameters(self.HYPERPARAMETER_RESOURCE)
+        hyperparams_all = Resources.get_hyperparameter_registry(self.LIBRARY)
 
         strict_hyperparameters = ""
         if self.LIBRARY == "scikitlearn": # strict mode
             strict_hyperparameters = self.config.strict_hyperparameters_scikitlearn
         elif self.LIBRARY == "tensorflow":
             strict_hyperparameters = self.config.strict_hyperparameters_tensorflow
-            if function_name in self.call_types and self.call_types[function_name] not in ["tf", "tensorflow"]:
+            if not self.may_be_from_library(node, function_name, ("tf", "tensorflow")):
                 return
         elif self.LIBRARY == "pytorch":
             strict_hyperparameters = self.config.strict_hyperparameters_pytorch
-            if function_name in self.call_types and self.call_types[function_name] != "torch":
+            if not self.may_be_from_library(node, function_name, ("torch",)):
                 return
 
-        if function_name in hyperparams_all:  # pylint: disable=unsupported-membership-test
+        if function_name in hyperparams_all:
             if strict_hyperparameters:
                 if not self.has_required_hyperparameters(node, hyperparams_all, function_name):
                     self.add_message(self.MESSAGE, node=node)
@@ -78,6 +80,22 @@ class HyperparameterChecker(BaseChecker):
                 elif len(node.args) == 0 and node.keywords is None:
                     self.add_message(self.MESSAGE, node=node)
 
+    @staticmethod
+    def may_be_from_library(
+        node: astroid.Call, function_name: str, libraries: Tuple[str, ...]
+    ) -> bool:
+        """
+        Check whether a learning class can be imported from one of the libraries.
+
+        :param node: Call node of the learning class.
+        :param function_name: Name of the learning class.
+        :param libraries: Names the library is imported as, e.g., ('tf', 'tensorflow').
+        :return: True unless the class is imported from another library.
+        """
+        return ModuleImports.resolve(node, function_name) is None or ModuleImports.from_library(
+            node, function_name, libraries
+        )
+
     def has_required_hyperparameters(self, node: astroid.Call, hyperparameters: Dict, name: str):
         """
         Evaluate whether a function call has all required hyperparameters defined.
@@ -91,7 +109,7 @@ class HyperparameterChecker(BaseChecker):
         )
 
     @staticmethod
-    def has_keywords(keywords: List[astroid.Keyword], keywords_goal: List[str]) -> bool:
+    def has_keywords(keywords: List[astroid.Keyword], keywords_goal: Collection[str]) -> bool:
         """
         Check if a list of keywords contains certain keywords.
 
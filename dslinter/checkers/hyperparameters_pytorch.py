@@ -33,7 +33,6 @@ class HyperparameterPyTorchChecker(HyperparameterChecker):
 
     def __init__(self, linter: PyLinter = HyperparameterChecker):
         super().__init__(linter)
-        self.HYPERPARAMETER_RESOURCE = "hyperparameters_pytorch_dict.pickle"
         self.MESSAGE = "hyperparameters-pytorch"
         self.HYPERPARAMETERS_MAIN = {
             # dataloader
@@ -34,7 +34,6 @@ class HyperparameterScikitLearnChecker(HyperparameterChecker):
 
     def __init__(self, linter: PyLinter = HyperparameterChecker):
         super().__init__(linter)
-        self.HYPERPARAMETER_RESOURCE = "hyperparameters_scikitlearn_dict.pickle"
         self.MESSAGE = "hyperparameters-scikitlearn"
         self.LIBRARY = "scikitlearn"
         # Main hyperparameters of learning algorithms, as defined in research.
@@ -3,8 +3,9 @@ import astroid
 from pylint.interfaces import IAstroidChecker
 from pylint.lint import PyLinter
 from dslinter.checkers.hyperparameters import HyperparameterChecker
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
-from dslinter.utils.hyperparameters_helper import check_module_with_library
+from dslinter.utils.module_imports import ModuleImports
 
 
 class HyperparameterTensorflowChecker(HyperparameterChecker):
@@ -36,7 +37,6 @@ class HyperparameterTensorflowChecker(HyperparameterChecker):
 
     def __init__(self, linter: PyLinter = HyperparameterChecker):
         super().__init__(linter)
-        self.HYPERPARAMETER_RESOURCE = "hyperparameters_tensorflow_dict.pickle"
         self.MESSAGE = "hyperparameters-tensorflow"
         self.HYPERPARAMETERS_MAIN = {
             # training
@@ -66,6 +66,13 @@ class HyperparameterTensorflowChecker(HyperparameterChecker):
             },
         }
 
+    def open(self):
+        """Route the calls to the learning algorithms and functions of tensorflow to the checker."""
+        super().open()
+        self.CALL_NAMES = self.CALL_NAMES | frozenset(self.hyperparams_all_in_function)
+
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, node: astroid.Call):
         """
         When a Call node is visited, check whether hyperparameters are set.
@@ -83,7 +90,7 @@ class HyperparameterTensorflowChecker(HyperparameterChecker):
             ):
                 self.hyperparameter_in_class(node, node.func.name)
             if(
-                check_module_with_library(node, "tensorflow")
+                ModuleImports.imports_package(node, "tensorflow")
                 and hasattr(node, "func")
                 and hasattr(node.func, "attrname")
                 and node.func.attrname == "fit"
@@ -3,9 +3,10 @@ from typing import Dict
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.inplace_helper import inplace_is_true
-from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_inference import ModuleTypeInference
 
 
 class InPlacePandasChecker(BaseChecker):
@@ -24,9 +25,6 @@ class InPlacePandasChecker(BaseChecker):
     }
     options = ()
 
-    # [node, inferred type of object the function is called on]
-    _call_types: Dict[astroid.Call, str] = {}
-
     # Whitelisted functions for which a DataFrame does not have to be assigned.
     WHITELISTED = [
         "all",
@@ -75,6 +73,11 @@ class InPlacePandasChecker(BaseChecker):
         "to_***",
     ]
 
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [node, inferred type of object the function is called on]
+        self._call_types: Dict[astroid.Call, str] = {}
+
     def visit_module(self, module: astroid.Module):
         """
         When an Module node is visited, scan for Call nodes and get type the function is called on.
@@ -82,9 +85,9 @@ class InPlacePandasChecker(BaseChecker):
         :param module: Node which is visited.
         """
         try:
-            # noinspection PyTypeChecker
-            # pylint: disable = line-too-long
-            self._call_types = TypeInference.infer_types(module, astroid.Call, lambda x: x.func.expr.name)
+            self._call_types = ModuleTypeInference.get_types(
+                module, ModuleTypeInference.CALL_RECEIVER
+            )
         except:  # pylint: disable=bare-except
             ExceptionHandler.handle(self, module)
 
@@ -159,3 +162,7 @@ class InPlacePandasChecker(BaseChecker):
             # it means the DataFrame is lost.
             and isinstance(node.parent, astroid.Expr)
         )
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget the receiver types of the calls, which are keyed on nodes of the module."""
+        self._call_types = {}
@@ -1,9 +1,14 @@
 """Checker which checks whether there are possible invalid value unmasked."""
+from typing import Dict, List
+
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.type_inference import TypeInference
 
 
@@ -14,6 +19,7 @@ class MaskMissingPytorchChecker(BaseChecker):
 
     name = "missing-mask-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W5514": (
             "The variable in torch.log() isn't wrapped with torch.clip() or torch.clamp().",
@@ -24,14 +30,21 @@ class MaskMissingPytorchChecker(BaseChecker):
 
     options = ()
 
-    _variables_with_processing_operation = {}
+    CALL_NAMES = frozenset(["log"])
+
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._variables_with_processing_operation: Dict[str, List[str]] = {}
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module: astroid.Module):
         try:
             self._variables_with_processing_operation = TypeInference.infer_variable_full_types(module)
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, call_node: astroid.Call):
         """
         Visit call node to see whether there are rules violations.
@@ -74,3 +87,7 @@ class MaskMissingPytorchChecker(BaseChecker):
                 self.add_message(msgid="missing-mask-pytorch", node=call_node)
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, call_node)
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget which operations were applied to each variable of the module."""
+        self._variables_with_processing_operation = {}
@@ -2,7 +2,9 @@
 from typing import Dict
 import astroid
 from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.type_inference import TypeInference
 
 
@@ -11,12 +13,13 @@ class MemoryReleaseTensorflowChecker(BaseChecker):
 
     name = "memory-release-tensorflow"
     priority = -1
+    LIBRARIES = ("tensorflow",)
     msgs = {
-        "W5506":{
+        "W5506": (
             "The memory has not freed in time.",
             "memory-release-tensorflow",
             "The `clean_session()` can be used to free memory in the loop."
-        }
+        )
     }
     options = ()
 
@@ -25,9 +28,12 @@ class MemoryReleaseTensorflowChecker(BaseChecker):
         "Model"
     ]
 
-    # [variable name, inferred type of object the function is called on]
-    _variable_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._variable_types: Dict[str, str] = {}
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which library the variables are from. """
         try:
@@ -35,6 +41,7 @@ class MemoryReleaseTensorflowChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    @ModuleImports.requires_libraries
     def visit_for(self, node: astroid.For):
         """Evaluate whether memory is freed in a loop with model creation."""
         try:
@@ -81,3 +88,7 @@ class MemoryReleaseTensorflowChecker(BaseChecker):
         :return: True when meeting the requirements
         """
         return name in self._variable_types and self._variable_types[name] in ["tf", "tensorflow"]
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget which variables hold the tensorflow module."""
+        self._variable_types = {}
@@ -1,9 +1,11 @@
 """Checker which checks whether the parameters for merge operations are set."""
 import astroid as astroid
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 from pylint.checkers import BaseChecker
 from typing import Dict
 
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.type_inference import TypeInference
 
@@ -24,8 +26,12 @@ class MergeParameterPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [variable name, inferred type of object the function is called on]
-    _subscript_types: Dict[str, str] = {}
+    CALL_NAMES = frozenset(["merge"])
+
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._subscript_types: Dict[str, str] = {}
 
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which library the variables are from. """
@@ -34,6 +40,7 @@ class MergeParameterPandasChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    @CallRouter.routed
     def visit_call(self, call_node: astroid.Call):
         """Visit call node and check whether the parameters are set."""
         # call on pandas dataframe object && name "merge" && check parameter
@@ -57,3 +64,7 @@ class MergeParameterPandasChecker(BaseChecker):
                     self.add_message("merge-parameter-pandas", node=call_node)
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, call_node)
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget the inferred types of the variables merges are called on."""
+        self._subscript_types = {}
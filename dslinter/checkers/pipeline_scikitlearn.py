@@ -1,12 +1,14 @@
 """Checker which checks rules for preventing data leakage between training and test data."""
-from typing import List
+from typing import FrozenSet, List
 
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
 
 from dslinter.utils.ast import AssignUtil
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.resources import Resources
 
 
@@ -17,6 +19,7 @@ class PipelineScikitLearnChecker(BaseChecker):
 
     name = "pipeline-not-used-scikitlearn"
     priority = -1
+    LIBRARIES = ("sklearn",)
     msgs = {
         "W5518": (
             "There are both preprocessing and estimation operations in the code, but they are not used in a pipeline.",
@@ -35,6 +38,8 @@ class PipelineScikitLearnChecker(BaseChecker):
         "transform",
     ]
 
+    CALL_NAMES = frozenset(LEARNING_FUNCTIONS)
+
     PREPROCESSING_CLASSES = [
         "FunctionTransformer",
         "KBinsDiscretizer",
@@ -54,6 +59,8 @@ class PipelineScikitLearnChecker(BaseChecker):
         "SelectKBest",
     ]
 
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, call_node: astroid.Call):
         """
         When a Call node is visited, check whether it violated the rules in this checker.
@@ -124,20 +131,16 @@ class PipelineScikitLearnChecker(BaseChecker):
         )
 
     @staticmethod
-    def _get_estimator_classes() -> List[str]:
+    def _get_estimator_classes() -> FrozenSet[str]:
         """
         Get all estimator classes.
 
-        The list contains all learning classes which do something in the
+        The set contains all learning classes which do something in the
         fit function from sklearn.
 
-        :return: List of estimator classes.
+        :return: Set of estimator classes.
         """
-        # pylint: disable = line-too-long
-        learning_classes = list(Resources.get_hyperparameters("hyperparameters_scikitlearn_dict.pickle").keys())
-        estimator_classes = learning_classes
-        assert None not in estimator_classes
-        return estimator_classes
+        return Resources.get_hyperparameter_registry("scikitlearn").classes
 
     def _call_initiates_preprocessor(self, call: astroid.Call) -> bool:
         """
@@ -1,9 +1,12 @@
 """Checker which checks whether random seed is set in pytorch dataloader"""
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 from pylint.checkers import BaseChecker
 import astroid
 
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 
 
 class RandomnessControlDataloaderPytorchChecker(BaseChecker):
@@ -12,6 +15,7 @@ class RandomnessControlDataloaderPytorchChecker(BaseChecker):
 
     name = "randomness-control-dataloader-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W5512": (
             "The worker_init_fn() and generator is not set in PyTorch DataLoader API",
@@ -21,8 +25,13 @@ class RandomnessControlDataloaderPytorchChecker(BaseChecker):
     }
     options = ()
 
-    _import_dataloader = False
+    CALL_NAMES = frozenset(["DataLoader"])
 
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._import_dataloader = False
+
+    @ModuleImports.requires_libraries
     def visit_importfrom(self, importfrom_node: astroid.ImportFrom):
         """
         Check whether there is DataLoader imported.
@@ -39,6 +48,8 @@ class RandomnessControlDataloaderPytorchChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, importfrom_node)
 
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, node: astroid.Call):
         """
         Check whether there is a rule violation.
@@ -81,3 +92,7 @@ class RandomnessControlDataloaderPytorchChecker(BaseChecker):
             if full_expr[:-1] == "torch.utils.data.DataLoader":
                 return True
         return False
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget whether the module imports DataLoader."""
+        self._import_dataloader = False
@@ -4,6 +4,7 @@ from pylint.checkers import BaseChecker
 import astroid
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.randomness_control_helper import check_main_module, has_import
 
 
@@ -13,6 +14,7 @@ class RandomnessControlPytorchChecker(BaseChecker):
 
     name = "randomness-control-pytorch"
     priority = -1
+    LIBRARIES = ("torch",)
     msgs = {
         "W5511": (
             "The torch.manual_seed() is not set in PyTorch program",
@@ -33,6 +35,7 @@ class RandomnessControlPytorchChecker(BaseChecker):
         ),
     )
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module: astroid.Module):
         """
         Check whether there is a rule violation.
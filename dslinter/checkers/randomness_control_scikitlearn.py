@@ -4,8 +4,9 @@ import traceback
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
-from dslinter.utils.resources import Resources
+from dslinter.utils.module_imports import ModuleImports
 
 
 class RandomnessControlScikitLLearnChecker(BaseChecker):
@@ -15,6 +16,7 @@ class RandomnessControlScikitLLearnChecker(BaseChecker):
 
     name = "randomness-control-scikitlearn"
     priority = -1
+    LIBRARIES = ("sklearn",)
     msgs = {
         "W5509": (
             "The 'random_state' should be set in estimators or cross-validation splitters.",
@@ -47,9 +49,10 @@ class RandomnessControlScikitLLearnChecker(BaseChecker):
         # "TimeSeriesSplit"
     ]
 
-    _HYPERPARAMETER_RESOURCE = "hyperparameters_scikitlearn_dict.pickle"
-    _estimators_all = Resources.get_hyperparameters(_HYPERPARAMETER_RESOURCE)
+    CALL_NAMES = frozenset(SPLITTER_FUNCTIONS + SPLITTER_CLASSES)
 
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, node: astroid.Call):
         """
         When a Call node is visited, check whether it violated the rules in this checker.
@@ -65,7 +68,6 @@ class RandomnessControlScikitLLearnChecker(BaseChecker):
                 and hasattr(node.func, "name")
                 and (node.func.name in self.SPLITTER_FUNCTIONS
                      or node.func.name in self.SPLITTER_CLASSES)
-                     #or node.func.name in self.estimators_all)
             ):
                 if node.keywords is not None:
                     _has_random_state_keyword = False
@@ -4,8 +4,10 @@ from typing import List
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from dslinter.utils.call_router import CallRouter
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.ast import AssignUtil
+from dslinter.utils.module_imports import ModuleImports
 
 
 class ScalerMissingScikitLearnChecker(BaseChecker):
@@ -15,6 +17,7 @@ class ScalerMissingScikitLearnChecker(BaseChecker):
 
     name = "scaler-missing-scikitlearn"
     priority = -1
+    LIBRARIES = ("sklearn",)
     msgs = {
         "W5505": (
             "Scaler is not used before scaling-sensitive operation",
@@ -56,8 +59,10 @@ class ScalerMissingScikitLearnChecker(BaseChecker):
         "transform",
     ]
 
-    Variables = []
+    CALL_NAMES = frozenset(PIPELINE + LEARNING_FUNCTIONS)
 
+    @CallRouter.routed
+    @ModuleImports.requires_libraries
     def visit_call(self, node: astroid.Call):
         """
         When a node is visited, add a message if the rule is violated.
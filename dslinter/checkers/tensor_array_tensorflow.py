@@ -2,8 +2,10 @@
 import astroid
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.type_inference import TypeInference
 from typing import Dict
 
@@ -15,6 +17,7 @@ class TensorArrayTensorflowChecker(BaseChecker):
 
     name = "tensor-array-tensorflow"
     priority = -1
+    LIBRARIES = ("tensorflow",)
     msgs = {
         "W5515": (
             "The tf.constant() variable is assigned or growing in the loop.",
@@ -25,8 +28,12 @@ class TensorArrayTensorflowChecker(BaseChecker):
     options = ()
 
      # [variable name, inferred type of object the function is called on]
-    _variable_types: Dict[str, str] = {}
 
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self._variable_types: Dict[str, str] = {}
+
+    @ModuleImports.requires_libraries
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which libraries the variables are from."""
         try:
@@ -34,6 +41,7 @@ class TensorArrayTensorflowChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    @ModuleImports.requires_libraries
     def visit_for(self, for_node: astroid.For):
         """Visit for node and see whether the rule is violated."""
         try:
@@ -64,3 +72,7 @@ class TensorArrayTensorflowChecker(BaseChecker):
         if hasattr(call, "name"):
             call_expression = call.name + call_expression
         return call_expression
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget the first inferred types of the variables of the module."""
+        self._variable_types = {}
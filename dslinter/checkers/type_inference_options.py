@@ -0,0 +1,258 @@
+"""Checker which holds the type inference options shared by the checkers using mypy."""
+from typing import List, Sequence, Tuple
+
+import astroid
+from pylint.checkers import BaseChecker
+from pylint.exceptions import EmptyReportError
+from pylint.interfaces import IAstroidChecker
+from pylint.lint.expand_modules import expand_modules
+from pylint.lint.utils import fix_import_path
+from pylint.reporters.ureports.nodes import Table
+from pylint.utils import get_global_option
+
+from dslinter.utils.module_lifecycle import ModuleLifecycle
+from dslinter.utils.project_type_inference import ProjectTypeInference
+from dslinter.utils.type_inference import ModuleTypeInference, TypeInference
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+from dslinter.utils.type_inference_prefetch import TypeInferencePrefetch
+
+
+def report_type_inference_stats(sect, stats, _):
+    """
+    Report the number of modules of which the types are guessed because mypy exceeded the budget.
+
+    :param sect: Section to add the report to.
+    :param stats: Statistics of the current run.
+    """
+    degraded = stats.by_msg.get("type-inference-timeout", 0)
+    if degraded == 0:
+        raise EmptyReportError()
+    lines = ["budget (seconds)", "modules over budget", str(TypeInference.timeout), str(degraded)]
+    sect.append(Table(children=lines, cols=2, rheaders=1))
+
+
+class TypeInferenceChecker(BaseChecker):
+    """Checker which holds the options of the type inference with mypy and reports on it."""
+
+    __implements__ = IAstroidChecker
+
+    name = "type-inference"
+    # Lower than the priority of the other checkers of the plugin, so it leaves the modules last and
+    # releases the caches they share.
+    priority = -2
+    msgs = {
+        "I5501": (
+            "Type inference exceeded the time budget of %s seconds, "
+            "types are guessed from assignments",
+            "type-inference-timeout",
+            "mypy did not finish within the time budget on this module, so the checkers which use "
+            "the inferred types only know the DataFrames created by pandas functions.",
+        ),
+    }
+    reports = (("RP5501", "Type inference", report_type_inference_stats),)
+    options = (
+        (
+            "type_inference_backend",
+            {
+                "default": "mypy",
+                "type": "choice",
+                "choices": list(TypeInference.BACKENDS),
+                "metavar": "<mypy_daemon_or_build>",
+                "help": "Run mypy from scratch for every module (mypy), keep one warm mypy build "
+                        "manager for the whole run (daemon) or read the types from the TypeMap of "
+                        "the mypy build API without adding reveal_type() calls (build).",
+            },
+        ),
+        (
+            "type_inference_project_batch",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y_or_n>",
+                "help": "Infer the types of all linted modules in a single mypy build before the "
+                        "checkers run.",
+            },
+        ),
+        (
+            "type_inference_timeout",
+            {
+                "default": 0,
+                "type": "float",
+                "metavar": "<seconds>",
+                "help": "Wall-clock budget for running mypy on a module. When it is exceeded, mypy "
+                        "is stopped and the types are guessed from assignments. 0 means no budget.",
+            },
+        ),
+        (
+            "type_inference_force",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y_or_n>",
+                "help": "Infer the types in all modules, also in modules which do not import "
+                        "pandas or pyspark, e.g., when DataFrames are passed between modules.",
+            },
+        ),
+        (
+            "type_inference_cache",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y_or_n>",
+                "help": "Cache the types inferred by mypy on disk, so unchanged modules are not "
+                        "type checked again in the next run.",
+            },
+        ),
+        (
+            "type_inference_cache_dir",
+            {
+                "default": TypeInferenceCache.directory,
+                "type": "string",
+                "metavar": "<directory>",
+                "help": "Directory the type inference cache is stored in.",
+            },
+        ),
+        (
+            "type_inference_cache_max_size",
+            {
+                "default": TypeInferenceCache.max_size // (1024 * 1024),
+                "type": "int",
+                "metavar": "<megabytes>",
+                "help": "Maximum size of the type inference cache in megabytes. The least recently "
+                        "used entries are removed when the cache grows larger.",
+            },
+        ),
+        (
+            "type_inference_prefetch",
+            {
+                "default": 0,
+                "type": "int",
+                "metavar": "<processes>",
+                "help": "Number of background processes which run mypy on the next modules while "
+                        "the current module is checked. 0 runs mypy when a module is checked. Not "
+                        "used with the project batch or parallel jobs.",
+            },
+        ),
+    )
+
+    def leave_module(self, module: astroid.Module):
+        """
+        When a Module node is left, add a message if its types are guessed instead of inferred.
+
+        The other checkers of the plugin have left the module already, so the caches they share are
+        released for it afterwards.
+
+        :param module: Node which is left.
+        """
+        if ModuleTypeInference.pop_degraded(module):
+            self.add_message("type-inference-timeout", node=module, args=(TypeInference.timeout,))
+        ModuleLifecycle.release(module)
+
+    def close(self):
+        """Release the caches when the linter is done, also of a module which is not left."""
+        ModuleLifecycle.clear()
+
+    def walk_every_module(self):
+        """
+        Walk this checker for every module, also when its message and report are disabled.
+
+        pylint only walks the checkers with an enabled message or report, so it leaves this one out
+        with, e.g., '--disable=all --enable=<smells> --reports=n'. The caches are released in
+        leave_module and close, so the prepare_checkers method of the linter is wrapped to always
+        add this checker, like the check method is wrapped for the project-wide type inference.
+        """
+        linter = self.linter
+        prepare_checkers = linter.prepare_checkers
+
+        def prepare_checkers_with_type_inference():
+            checkers = prepare_checkers()
+            if self in checkers:
+                return checkers
+            # Sorted by priority like pylint does, so this checker still leaves the modules last.
+            return sorted(checkers + [self], key=lambda checker: checker.priority, reverse=True)
+
+        linter.prepare_checkers = prepare_checkers_with_type_inference
+
+    def apply_configuration(self):
+        """Apply the loaded options to the type inference utilities."""
+        TypeInference.backend = self.config.type_inference_backend
+        ModuleTypeInference.force = self.config.type_inference_force
+        TypeInference.timeout = self.config.type_inference_timeout
+        TypeInferenceCache.configure(
+            self.config.type_inference_cache,
+            self.config.type_inference_cache_dir,
+            self.config.type_inference_cache_max_size * 1024 * 1024,
+        )
+        if self.config.type_inference_project_batch:
+            self._infer_project_types_before_check()
+        elif self.config.type_inference_prefetch > 0 and TypeInferencePrefetch.is_supported():
+            self._prefetch_types_during_check(self.config.type_inference_prefetch)
+
+    def _get_linted_modules(self, files_or_modules: Sequence[str]) -> List[Tuple[str, str]]:
+        """
+        Get the modules the linter will check, in the order it checks them.
+
+        :param files_or_modules: Files or modules the linter is asked to check.
+        :return: (module name, file path) Tuples of the modules.
+        """
+        linter = self.linter
+        # Errors are ignored, pylint reports them when it expands the modules itself.
+        modules, _ = expand_modules(
+            files_or_modules,
+            linter.config.black_list,
+            linter.config.black_list_re,
+            get_global_option(linter, "ignore-paths"),
+        )
+        return [
+            (module["name"], module["path"])
+            for module in modules
+            if linter.should_analyze_file(
+                module["name"], module["path"], is_argument=module["isarg"]
+            )
+        ]
+
+    def _infer_project_types_before_check(self):
+        """
+        Run the project-wide type inference when the linter starts checking.
+
+        pylint does not share the modules it will check with its checkers, so the check method
+        of the linter is wrapped to get them.
+        """
+        linter = self.linter
+        check = linter.check
+
+        def check_with_project_types(files_or_modules: Sequence[str]):
+            if not linter.config.from_stdin:
+                with fix_import_path(files_or_modules):
+                    modules = self._get_linted_modules(files_or_modules)
+                    ProjectTypeInference.infer_project_types(modules)
+            check(files_or_modules)
+
+        linter.check = check_with_project_types
+
+    def _prefetch_types_during_check(self, processes: int):
+        """
+        Run mypy on the next modules in background processes while the linter checks the module.
+
+        Like for the project-wide type inference, the check method of the linter is wrapped to get
+        the modules it will check. Parallel jobs check the modules in other processes, in an order
+        which is not known here, so nothing is prefetched for them.
+
+        :param processes: Number of processes running mypy.
+        """
+        linter = self.linter
+        check = linter.check
+
+        def check_with_prefetch(files_or_modules: Sequence[str]):
+            if linter.config.from_stdin or linter.config.jobs != 1:
+                check(files_or_modules)
+                return
+            with fix_import_path(files_or_modules):
+                modules = self._get_linted_modules(files_or_modules)
+            TypeInferencePrefetch.start(processes, ModuleTypeInference.upcoming_runs(modules))
+            try:
+                check(files_or_modules)
+            finally:
+                TypeInferencePrefetch.stop()
+
+        linter.check = check_with_prefetch
@@ -3,10 +3,11 @@ from typing import List
 from typing import Dict
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 import astroid
 from dslinter.utils.exception_handler import ExceptionHandler
 from dslinter.utils.ast import AssignUtil
-from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_inference import ModuleTypeInference
 
 
 class UnnecessaryIterationPandasChecker(BaseChecker):
@@ -29,8 +30,10 @@ class UnnecessaryIterationPandasChecker(BaseChecker):
     }
     options = ()
 
-    # [node, inferred type of object the function is called on]
-    _call_types: Dict[astroid.Call, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [node, inferred type of object the function is called on]
+        self._call_types: Dict[astroid.Call, str] = {}
 
     def visit_module(self, node: astroid.Module):
         """
@@ -39,10 +42,9 @@ class UnnecessaryIterationPandasChecker(BaseChecker):
         :param node: Node which is visited.
         """
         try:
-            # noinspection PyTypeChecker
-            self._call_types = TypeInference.infer_types(node,
-                                                         astroid.Call,
-                                                         lambda x: x.func.expr.name)
+            self._call_types = ModuleTypeInference.get_types(
+                node, ModuleTypeInference.CALL_RECEIVER
+            )
         except:  # pylint: disable=bare-except
             ExceptionHandler.handle(self, node)
 
@@ -117,3 +119,7 @@ class UnnecessaryIterationPandasChecker(BaseChecker):
         elif isinstance(node.target, astroid.AssignName):
             target_names.append(node.target.name)
         return target_names
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget the inferred types of the objects the calls of the module are made on."""
+        self._call_types = {}
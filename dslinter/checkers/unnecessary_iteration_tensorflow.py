@@ -2,8 +2,10 @@
 from typing import Dict
 from pylint.checkers import BaseChecker
 from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
 import astroid
 from dslinter.utils.exception_handler import ExceptionHandler
+from dslinter.utils.module_imports import ModuleImports
 from dslinter.utils.type_inference import TypeInference
 
 
@@ -13,18 +15,22 @@ class UnnecessaryIterationTensorflowChecker(BaseChecker):
 
     name = "unnecessary-iteration-tensorflow"
     priority = -1
+    LIBRARIES = ("tensorflow",)
     msgs = {
-        "R5502": {
+        "R5502": (
             "There is an unnecessary iteration in the tensorflow code.",
             "unnecessary-iteration-tensorflow",
             "There is a efficient solution(Vectorization or Reduction) to replace the iteration.",
-        }
+        )
     }
     options = ()
 
-    # [variable name, inferred type of object the function is called on]
-    _variable_types: Dict[str, str] = {}
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        # [variable name, inferred type of object the function is called on]
+        self._variable_types: Dict[str, str] = {}
 
+    @ModuleImports.requires_libraries
     def visit_module(self, module: astroid.Module):
         """Visit module and infer which library the variables are from. """
         try:
@@ -32,6 +38,7 @@ class UnnecessaryIterationTensorflowChecker(BaseChecker):
         except: # pylint: disable = bare-except
             ExceptionHandler.handle(self, module)
 
+    @ModuleImports.requires_libraries
     def visit_for(self, node: astroid.For):
         """Evaluate whether there is an augmented assign in the loop, it can be replaced
             by a reduction operation, which is faster."""
@@ -72,3 +79,7 @@ class UnnecessaryIterationTensorflowChecker(BaseChecker):
         :return: True when meeting the requirements
         """
         return name in self._variable_types and self._variable_types[name] in ["tf", "tensorflow"]
+
+    def leave_module(self, _module: astroid.Module):
+        """Forget the variables bound to tensorflow, the next module binds its own."""
+        self._variable_types = {}
@@ -34,6 +34,7 @@ from dslinter.checkers.hyperparameters_tensorflow import HyperparameterTensorflo
 from dslinter.checkers.hyperparameters_scikitlearn import HyperparameterScikitLearnChecker
 from dslinter.checkers.nan_numpy import NanNumpyChecker
 from dslinter.checkers.scaler_missing_scikitlearn import ScalerMissingScikitLearnChecker
+from dslinter.checkers.type_inference_options import TypeInferenceChecker
 
 
 def register(linter):
@@ -42,6 +43,9 @@ def register(linter):
 
     :param linter: Linter to add the checkers to.
     """
+    type_inference = TypeInferenceChecker(linter)
+    linter.register_checker(type_inference)
+    type_inference.walk_every_module()
     linter.register_checker(ImportChecker(linter))
     linter.register_checker(InPlacePandasChecker(linter))
     linter.register_checker(InPlaceNumpyChecker(linter))
@@ -75,3 +79,14 @@ def register(linter):
     linter.register_checker(ForwardPytorchChecker(linter))
     linter.register_checker(ModeTogglingPytorchChecker(linter))
     linter.register_checker(GradientClearPytorchChecker(linter))
+
+
+def load_configuration(linter):
+    """
+    Apply the loaded configuration which is shared by multiple checkers of the plugin.
+
+    :param linter: Linter with the loaded configuration.
+    """
+    for checker in linter.get_checkers():
+        if isinstance(checker, TypeInferenceChecker):
+            checker.apply_configuration()
@@ -0,0 +1 @@
+"""Package which contains the hyperparameters of the learning classes, per library and submodule."""
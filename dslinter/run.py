@@ -0,0 +1,143 @@
+"""Standalone dslinter command, which runs the checkers of the plugin without the ones of pylint."""
+import os
+import sys
+from typing import Iterator, Optional
+
+from pylint import reporters
+from pylint.lint import PyLinter
+from pylint.lint import Run as PylintRun
+from pylint.typing import FileItem
+
+
+class DslinterLinter(PyLinter):
+    """
+    Linter which only registers the checkers of the plugin.
+
+    Everything else, e.g., the configuration files, the options and the output formats, is the same
+    as for pylint. The linted code is usually linted with pylint as well, so the messages of
+    pylint's checkers in its pylint pragmas and configuration files are ignored.
+    """
+
+    # Message of pylint's checkers which pylint's Run enables itself.
+    RUN_ENABLED = "c-extension-no-member"
+
+    # Messages which are enabled by default, the smells listed in the README and the message of the
+    # modules of which the types are guessed because mypy exceeds its time budget.
+    DEFAULT_ENABLED = (
+        "import",
+        "unnecessary-iteration-pandas",
+        "unnecessary-iteration-tensorflow",
+        "nan-numpy",
+        "chain-indexing-pandas",
+        "merge-parameter-pandas",
+        "dataframe-conversion-pandas",
+        "scaler-missing-scikitlearn",
+        "hyperparameters-scikitlearn",
+        "hyperparameters-tensorflow",
+        "hyperparameters-pytorch",
+        "memory-release-tensorflow",
+        "deterministic-pytorch",
+        "randomness-control-numpy",
+        "randomness-control-scikitlearn",
+        "randomness-control-tensorflow",
+        "randomness-control-pytorch",
+        "randomness-control-dataloader-pytorch",
+        "missing-mask-tensorflow",
+        "missing-mask-pytorch",
+        "tensor-array-tensorflow",
+        "forward-pytorch",
+        "pipeline-not-used-scikitlearn",
+        "dependent-threshold-scikitlearn",
+        "dependent-threshold-tensorflow",
+        "dependent-threshold-pytorch",
+        "type-inference-timeout",
+    )
+
+    def load_default_plugins(self):
+        """Register the reporters of pylint and the checkers of the plugin, instead of pylint's."""
+        reporters.initialize(self)
+        # The default reporter is set before the reporters are registered.
+        if not self.reporter:
+            self._load_reporters()
+        self.load_plugin_modules(["dslinter"])
+        for checker in self.get_checkers():
+            if checker is not self:
+                for msgid, definition in checker.msgs.items():
+                    if (
+                        definition[1] not in self.DEFAULT_ENABLED
+                        and checker.name not in self.DEFAULT_ENABLED
+                    ):
+                        self.disable(msgid)
+        self.disable("bad-option-value")
+        # Defaults which are overridden by the configuration files and the command line.
+        self.set_option("jobs", 0)
+        self.set_option("persistent", False)
+
+    def enable(
+        self,
+        msgid: str,
+        scope: str = "package",
+        line: Optional[int] = None,
+        ignore_unknown: bool = False,
+    ):
+        """Enable a message like PyLinter, but without failing on the one pylint's Run enables."""
+        super().enable(msgid, scope, line, ignore_unknown or msgid == self.RUN_ENABLED)
+
+    def read_config_file(self, config_file=None, verbose=None):
+        """
+        Apply the default messages of the command and read the configuration file like PyLinter.
+
+        pylint's Run sets its own defaults for the messages before it reads the configuration, which
+        disables all informational messages, e.g., type-inference-timeout. DEFAULT_ENABLED is
+        applied on top of them, so the configuration files and the command line still override it.
+        """
+        for msgid in self.DEFAULT_ENABLED:
+            super().enable(msgid)
+        super().read_config_file(config_file, verbose)
+
+    def _iterate_file_descrs(self, files_or_modules) -> Iterator[FileItem]:
+        """
+        Get the modules to check, the largest first when they are checked in parallel jobs.
+
+        This is a size-ordered dispatch, not a scheduler of its own: pylint's pool hands the next
+        module to a job when it is done with the previous one, so handing out the largest modules
+        first keeps a large module from being checked alone at the end.
+
+        :param files_or_modules: Files or modules the linter is asked to check.
+        :return: Iterator over the modules to check.
+        """
+        # The modules are only expanded when the first one is taken, after the linter is opened.
+        file_descrs = super()._iterate_file_descrs(files_or_modules)
+        if self.config.jobs == 1:
+            yield from file_descrs
+        else:
+            yield from sorted(
+                file_descrs, key=lambda file_descr: -DslinterLinter.get_size(file_descr.filepath)
+            )
+
+    @staticmethod
+    def get_size(path: str) -> int:
+        """
+        Get the size of a file in bytes, or 0 when it cannot be read.
+
+        :param path: Path of the file.
+        :return: Size of the file.
+        """
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+
+class Run(PylintRun):
+    """Run the dslinter command with the arguments like pylint's Run does."""
+
+    LinterClass = DslinterLinter
+
+
+def main():
+    """Entry point of the dslinter command."""
+    try:
+        Run(sys.argv[1:])
+    except KeyboardInterrupt:
+        sys.exit(1)
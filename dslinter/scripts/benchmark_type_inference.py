@@ -0,0 +1,56 @@
+"""Benchmark matching nodes with the types inferred by mypy on large generated modules."""
+import sys
+import timeit
+
+import astroid
+
+from dslinter.utils.type_inference import TypeInference
+
+
+def combine_nodes_with_inferred_types_nested_loop(nodes, types):
+    """Match nodes with their types like before the line index, for comparison."""
+    unseen_types = types.copy()
+    nodes_with_types = {}
+    for node in nodes:
+        for line, type_inferred in unseen_types:
+            if TypeInference.line_to_add_call(node) == line:
+                nodes_with_types[node] = type_inferred
+                unseen_types.remove((line, type_inferred))
+    return nodes_with_types
+
+
+def generate_module(lines: int) -> astroid.Module:
+    """Generate a module like a notebook export, with calls in blocks and several calls per line."""
+    code = ["import pandas as pd", "df = pd.DataFrame()"]
+    while len(code) < lines:
+        code.append("df = df.abs(); df.head()")
+        code.append("for row in df.iterrows():")
+        code.append("    print(row)")
+    return astroid.parse("\n".join(code))
+
+
+def benchmark(lines: int):
+    """Compare the line index with the nested loop on a generated module with a number of lines."""
+    module = generate_module(lines)
+    nodes = list(module.nodes_of_class(astroid.Call))
+    # One revealed type per node, in the order mypy reports them.
+    types = sorted(
+        ((TypeInference.line_to_add_call(node), f"type{i}") for i, node in enumerate(nodes)),
+        key=lambda t: t[0],
+    )
+
+    index = TypeInference.combine_nodes_with_inferred_types
+    indexed = timeit.timeit(lambda: index(nodes, types), number=1)
+    assert index(nodes, types) == combine_nodes_with_inferred_types_nested_loop(nodes, types)
+    nested_loop = timeit.timeit(
+        lambda: combine_nodes_with_inferred_types_nested_loop(nodes, types), number=1
+    )
+    print(
+        f"{lines:>6} lines, {len(nodes):>6} nodes: "
+        f"line index {indexed:.4f}s, nested loop {nested_loop:.4f}s"
+    )
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or [1000, 5000, 20000]:
+        benchmark(size)
@@ -1,12 +1,18 @@
-"""Functions for getting the signatures of Classes."""
+"""Functions for getting the signatures of Classes and writing them to the knowledge base."""
 # pylint: disable = line-too-long
 import inspect
+import json
+import os
 import pickle
-from typing import List
+from typing import Dict, List
 
+# Directory of the knowledge base, relative to this directory.
+KNOWLEDGE_BASE = "../resources/hyperparameters"
+MANIFEST = "manifest.json"
 
-def save_hyperparameter(classes: List, path: str):
-    """Functions for getting the signatures of Classes."""
+
+def get_hyperparameters(classes: List) -> Dict[str, Dict]:
+    """Get the hyperparameters of classes from their signatures."""
     # Collect all signatures of the learning classes.
     signatures = []
     for c in classes:
@@ -21,15 +27,74 @@ def save_hyperparameter(classes: List, path: str):
         keywords_amount = len(signature.parameters)
         keywords = list(signature.parameters.keys())
         hyperparameters[class_name] = {"positional": keywords_amount, "keywords": keywords}
+    return hyperparameters
 
-    print(hyperparameters)
 
-    # Write the pickled hyperparameters dict to disk and verify it.
-    with open(path, "wb") as file_handler:
-        pickle.dump(hyperparameters, file_handler)
-        print("The pickle with all hyperparameters is written to disk.")
-    with open(path, "rb") as file_handler:
-        hyperparameters_loaded = pickle.load(file_handler)
-        assert hyperparameters == hyperparameters_loaded
+def save_hyperparameter(
+    library: str,
+    imports: List[str],
+    learning_classes: Dict[str, List],
+    directory: str = KNOWLEDGE_BASE,
+):
+    """
+    Save the hyperparameters of the learning classes of a library to the knowledge base.
 
+    :param library: Name of the library in the knowledge base, e.g., 'scikitlearn'.
+    :param imports: Names of the top-level modules of the library, e.g., ['sklearn'].
+    :param learning_classes: Dict with the submodules the classes are imported from as keys and the
+        classes as values.
+    :param directory: Directory of the knowledge base.
+    """
+    shards = {
+        submodule: get_hyperparameters(classes) for submodule, classes in learning_classes.items()
+    }
+    print(shards)
+    write_knowledge_base(library, imports, shards, directory)
     print("Done!")
+
+
+def write_knowledge_base(
+    library: str,
+    imports: List[str],
+    shards: Dict[str, Dict[str, Dict]],
+    directory: str = KNOWLEDGE_BASE,
+):
+    """
+    Write the shards of a library to the knowledge base and record them in its manifest.
+
+    Every submodule is written to its own pickle. The manifest maps every library to the modules it
+    is imported as and to its shards with the names of their classes, so the linter only reads a
+    shard when one of its classes is used. The entries of other libraries in the manifest are kept.
+
+    :param library: Name of the library in the knowledge base, e.g., 'scikitlearn'.
+    :param imports: Names of the top-level modules of the library, e.g., ['sklearn'].
+    :param shards: Dict with the submodules as keys and the hyperparameters of their classes as
+        values.
+    :param directory: Directory of the knowledge base.
+    """
+    manifest_path = os.path.join(directory, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as file_handler:
+            manifest = json.load(file_handler)
+
+    # Remove the shards of an earlier version of the library.
+    for shard in manifest.get(library, {}).get("shards", {}).values():
+        if os.path.exists(os.path.join(directory, shard["file"])):
+            os.remove(os.path.join(directory, shard["file"]))
+
+    entry = {"imports": sorted(imports), "shards": {}}
+    for submodule, hyperparameters in sorted(shards.items()):
+        file = submodule + ".pickle"
+        # Write the pickled hyperparameters dict to disk and verify it.
+        with open(os.path.join(directory, file), "wb") as file_handler:
+            pickle.dump(hyperparameters, file_handler)
+        with open(os.path.join(directory, file), "rb") as file_handler:
+            assert hyperparameters == pickle.load(file_handler)
+        entry["shards"][submodule] = {"file": file, "classes": sorted(hyperparameters)}
+    manifest[library] = entry
+
+    with open(manifest_path, "w", encoding="utf-8") as file_handler:
+        json.dump(manifest, file_handler, indent=2, sort_keys=True)
+        file_handler.write("\n")
+    print(f"The shards of {library} are written to the knowledge base.")
@@ -5,9 +5,9 @@ from torch.utils.data import DataLoader
 from torch.optim import Adadelta, Adagrad, Adam, AdamW, SparseAdam, Adamax, ASGD, LBFGS, NAdam, RAdam, RMSprop, Rprop, SGD
 from dslinter.scripts.hyperparameters import save_hyperparameter
 
-learning_classes = []
-learning_classes.extend([DataLoader])  # dataloader
-learning_classes.extend([Adadelta, Adagrad, Adam, AdamW, SparseAdam, Adamax, ASGD, LBFGS, NAdam, RAdam, RMSprop, Rprop, SGD]) #optimizer
+learning_classes = {}
+learning_classes["torch.utils.data"] = [DataLoader]
+learning_classes["torch.optim"] = [Adadelta, Adagrad, Adam, AdamW, SparseAdam, Adamax, ASGD, LBFGS, NAdam, RAdam, RMSprop, Rprop, SGD]
 
 if __name__ == "__main__":
-    save_hyperparameter(learning_classes, "../resources/hyperparameters_pytorch_dict.pickle")
+    save_hyperparameter("pytorch", ["torch"], learning_classes)
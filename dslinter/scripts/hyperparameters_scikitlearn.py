@@ -27,29 +27,29 @@ from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor, ExtraTre
 # Collect learning classes. A class is a learning class if it is described in section '1. Supervised learning' or '2. Unsupervised learning' of the scikit-learn user guide.
 from dslinter.scripts.hyperparameters import save_hyperparameter
 
-learning_classes = []
-learning_classes.extend([CalibratedClassifierCV])  # calibration
-learning_classes.extend([AffinityPropagation, AgglomerativeClustering, Birch, DBSCAN, FeatureAgglomeration, KMeans, MiniBatchKMeans, MeanShift, OPTICS, SpectralClustering, SpectralBiclustering, SpectralCoclustering])  # cluster
-learning_classes.extend([EmpiricalCovariance, EllipticEnvelope, GraphicalLasso, GraphicalLassoCV, LedoitWolf, MinCovDet, OAS, ShrunkCovariance])  # covariance
-learning_classes.extend([CCA, PLSCanonical, PLSRegression, PLSSVD])  # cross_decomposition
-learning_classes.extend([DictionaryLearning, FactorAnalysis, FastICA, IncrementalPCA, KernelPCA, LatentDirichletAllocation, MiniBatchDictionaryLearning, MiniBatchSparsePCA, NMF, PCA, SparsePCA, SparseCoder, TruncatedSVD])  # decomposition
-learning_classes.extend([LinearDiscriminantAnalysis, QuadraticDiscriminantAnalysis])  # discriminant_analysis
-learning_classes.extend([AdaBoostClassifier, AdaBoostRegressor, BaggingClassifier, BaggingRegressor, ExtraTreesClassifier, ExtraTreesRegressor, GradientBoostingClassifier, GradientBoostingRegressor, IsolationForest, RandomForestClassifier, RandomForestRegressor, RandomTreesEmbedding, StackingClassifier, StackingRegressor, VotingClassifier, VotingRegressor, HistGradientBoostingClassifier, HistGradientBoostingRegressor])  # ensemble
-learning_classes.extend([GenericUnivariateSelect, SelectPercentile, SelectKBest, SelectFpr, SelectFdr, SelectFromModel, SelectFwe, RFE, RFECV, VarianceThreshold])  # feature_selection
-learning_classes.extend([GaussianProcessClassifier, GaussianProcessRegressor])  # gaussian_process
-learning_classes.extend([IsotonicRegression])  # isotonic
-learning_classes.extend([KernelRidge])  # kernel_ridge
-learning_classes.extend([LogisticRegression, LogisticRegressionCV, PassiveAggressiveClassifier, Perceptron, RidgeClassifier, RidgeClassifierCV, SGDClassifier, LinearRegression, Ridge, RidgeCV, SGDRegressor, ElasticNet, ElasticNetCV, Lars, LarsCV, Lasso, LassoCV, LassoLars, LassoLarsCV, LassoLarsIC, OrthogonalMatchingPursuit, OrthogonalMatchingPursuitCV, ARDRegression, BayesianRidge, MultiTaskElasticNet, MultiTaskElasticNetCV, MultiTaskLasso, MultiTaskLassoCV, HuberRegressor, RANSACRegressor, TheilSenRegressor, PassiveAggressiveRegressor])  # linear_model
-learning_classes.extend([Isomap, LocallyLinearEmbedding, MDS, SpectralEmbedding, TSNE])  # manifold
-learning_classes.extend([BayesianGaussianMixture, GaussianMixture])  # mixture_classes
-learning_classes.extend([OneVsRestClassifier, OneVsOneClassifier, OutputCodeClassifier])  # multiclass
-learning_classes.extend([ClassifierChain, MultiOutputRegressor, MultiOutputClassifier, RegressorChain])  # multioutput
-learning_classes.extend([BernoulliNB, CategoricalNB, ComplementNB, GaussianNB, MultinomialNB])  # naive_bayes
-learning_classes.extend([BallTree, DistanceMetric, KDTree, KernelDensity, KNeighborsClassifier, KNeighborsRegressor, KNeighborsTransformer, LocalOutlierFactor, RadiusNeighborsClassifier, RadiusNeighborsRegressor, RadiusNeighborsTransformer, NearestCentroid, NearestNeighbors, NeighborhoodComponentsAnalysis])  # neighbors
-learning_classes.extend([BernoulliRBM, MLPClassifier, MLPRegressor])  # neural_network
-learning_classes.extend([LabelPropagation, LabelSpreading])  # semi_supervised
-learning_classes.extend([LinearSVC, LinearSVR, NuSVC, NuSVR, OneClassSVM, SVC, SVR])  # svm_classes
-learning_classes.extend([DecisionTreeClassifier, DecisionTreeRegressor, ExtraTreeClassifier, ExtraTreeRegressor])  # tree
+learning_classes = {}
+learning_classes["sklearn.calibration"] = [CalibratedClassifierCV]
+learning_classes["sklearn.cluster"] = [AffinityPropagation, AgglomerativeClustering, Birch, DBSCAN, FeatureAgglomeration, KMeans, MiniBatchKMeans, MeanShift, OPTICS, SpectralClustering, SpectralBiclustering, SpectralCoclustering]
+learning_classes["sklearn.covariance"] = [EmpiricalCovariance, EllipticEnvelope, GraphicalLasso, GraphicalLassoCV, LedoitWolf, MinCovDet, OAS, ShrunkCovariance]
+learning_classes["sklearn.cross_decomposition"] = [CCA, PLSCanonical, PLSRegression, PLSSVD]
+learning_classes["sklearn.decomposition"] = [DictionaryLearning, FactorAnalysis, FastICA, IncrementalPCA, KernelPCA, LatentDirichletAllocation, MiniBatchDictionaryLearning, MiniBatchSparsePCA, NMF, PCA, SparsePCA, SparseCoder, TruncatedSVD]
+learning_classes["sklearn.discriminant_analysis"] = [LinearDiscriminantAnalysis, QuadraticDiscriminantAnalysis]
+learning_classes["sklearn.ensemble"] = [AdaBoostClassifier, AdaBoostRegressor, BaggingClassifier, BaggingRegressor, ExtraTreesClassifier, ExtraTreesRegressor, GradientBoostingClassifier, GradientBoostingRegressor, IsolationForest, RandomForestClassifier, RandomForestRegressor, RandomTreesEmbedding, StackingClassifier, StackingRegressor, VotingClassifier, VotingRegressor, HistGradientBoostingClassifier, HistGradientBoostingRegressor]
+learning_classes["sklearn.feature_selection"] = [GenericUnivariateSelect, SelectPercentile, SelectKBest, SelectFpr, SelectFdr, SelectFromModel, SelectFwe, RFE, RFECV, VarianceThreshold]
+learning_classes["sklearn.gaussian_process"] = [GaussianProcessClassifier, GaussianProcessRegressor]
+learning_classes["sklearn.isotonic"] = [IsotonicRegression]
+learning_classes["sklearn.kernel_ridge"] = [KernelRidge]
+learning_classes["sklearn.linear_model"] = [LogisticRegression, LogisticRegressionCV, PassiveAggressiveClassifier, Perceptron, RidgeClassifier, RidgeClassifierCV, SGDClassifier, LinearRegression, Ridge, RidgeCV, SGDRegressor, ElasticNet, ElasticNetCV, Lars, LarsCV, Lasso, LassoCV, LassoLars, LassoLarsCV, LassoLarsIC, OrthogonalMatchingPursuit, OrthogonalMatchingPursuitCV, ARDRegression, BayesianRidge, MultiTaskElasticNet, MultiTaskElasticNetCV, MultiTaskLasso, MultiTaskLassoCV, HuberRegressor, RANSACRegressor, TheilSenRegressor, PassiveAggressiveRegressor]
+learning_classes["sklearn.manifold"] = [Isomap, LocallyLinearEmbedding, MDS, SpectralEmbedding, TSNE]
+learning_classes["sklearn.mixture"] = [BayesianGaussianMixture, GaussianMixture]
+learning_classes["sklearn.multiclass"] = [OneVsRestClassifier, OneVsOneClassifier, OutputCodeClassifier]
+learning_classes["sklearn.multioutput"] = [ClassifierChain, MultiOutputRegressor, MultiOutputClassifier, RegressorChain]
+learning_classes["sklearn.naive_bayes"] = [BernoulliNB, CategoricalNB, ComplementNB, GaussianNB, MultinomialNB]
+learning_classes["sklearn.neighbors"] = [BallTree, DistanceMetric, KDTree, KernelDensity, KNeighborsClassifier, KNeighborsRegressor, KNeighborsTransformer, LocalOutlierFactor, RadiusNeighborsClassifier, RadiusNeighborsRegressor, RadiusNeighborsTransformer, NearestCentroid, NearestNeighbors, NeighborhoodComponentsAnalysis]
+learning_classes["sklearn.neural_network"] = [BernoulliRBM, MLPClassifier, MLPRegressor]
+learning_classes["sklearn.semi_supervised"] = [LabelPropagation, LabelSpreading]
+learning_classes["sklearn.svm"] = [LinearSVC, LinearSVR, NuSVC, NuSVR, OneClassSVM, SVC, SVR]
+learning_classes["sklearn.tree"] = [DecisionTreeClassifier, DecisionTreeRegressor, ExtraTreeClassifier, ExtraTreeRegressor]
 
 if __name__ == "__main__":
-    save_hyperparameter(learning_classes, "../resources/hyperparameters_scikitlearn_dict.pickle")
+    save_hyperparameter("scikitlearn", ["sklearn"], learning_classes)
@@ -4,9 +4,8 @@
 from tensorflow.keras.optimizers import Adadelta, Adagrad, Adam, Adamax, Ftrl, Nadam, RMSprop, SGD
 from dslinter.scripts.hyperparameters import save_hyperparameter
 
-learning_classes = []
-# learning_classes.extend([])  # fit
-learning_classes.extend([Adadelta, Adagrad, Adam, Adamax, Ftrl, Nadam, RMSprop, SGD]) #optimizer
+learning_classes = {}
+learning_classes["tensorflow.keras.optimizers"] = [Adadelta, Adagrad, Adam, Adamax, Ftrl, Nadam, RMSprop, SGD]
 
 if __name__ == "__main__":
-    save_hyperparameter(learning_classes, "../resources/hyperparameters_tensorflow_dict.pickle")
+    save_hyperparameter("tensorflow", ["tensorflow"], learning_classes)
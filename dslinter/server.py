@@ -0,0 +1,393 @@
+"""Long-running dslinter server, which keeps the caches warm for editors and pre-commit hooks."""
+import argparse
+import functools
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import astroid
+import pylint
+from astroid import MANAGER
+from astroid.inference_tip import clear_inference_tip_cache
+from pylint.lint.utils import fix_import_path
+from pylint.message import Message
+from pylint.reporters import CollectingReporter
+
+from dslinter.run import DslinterLinter
+from dslinter.utils.module_imports import ModuleImports
+
+
+class PylintAdapter:
+    """
+    Adapter for the private APIs of pylint and astroid the server uses.
+
+    They can change in any release, so the server only runs with the versions it is written for,
+    the ones pinned in pyproject.toml.
+    """
+
+    # (major, minor) versions of pylint and astroid of which the private APIs are used.
+    PYLINT_VERSION = (2, 12)
+    ASTROID_VERSION = (2, 9)
+
+    @staticmethod
+    def check_versions():
+        """
+        Check whether the installed pylint and astroid are the versions the adapter is written for.
+
+        :raises RuntimeError: When another version of pylint or astroid is installed.
+        """
+        for name, version, supported in (
+            ("pylint", pylint.__version__, PylintAdapter.PYLINT_VERSION),
+            ("astroid", astroid.__version__, PylintAdapter.ASTROID_VERSION),
+        ):
+            if tuple(int(part) for part in version.split(".")[:2]) != supported:
+                raise RuntimeError(
+                    f"The server needs {name} {'.'.join(map(str, supported))}.x, "
+                    f"{name} {version} is installed"
+                )
+
+    @staticmethod
+    def check_code(linter: DslinterLinter, path: str, code: str) -> str:
+        """
+        Check the unsaved code of a file, like pylint does for code from the standard input.
+
+        :param linter: Linter which checks the code.
+        :param path: Path of the file.
+        :param code: Unsaved code of the file.
+        :return: Name of the module of the code.
+        """
+        # pylint: disable=protected-access
+        file_descr = linter._get_file_descr_from_stdin(path)
+        linter.initialize()
+        with fix_import_path([path]):
+            linter._check_files(functools.partial(linter.get_ast, data=code), [file_descr])
+        return file_descr.name
+
+    @staticmethod
+    def clear_module_files():
+        """Forget the files astroid found for module names, so new files can resolve imports."""
+        MANAGER._mod_file_cache.clear()  # pylint: disable=protected-access
+
+
+class LintServer(socketserver.UnixStreamServer):
+    """
+    Server which lints modules on request over a Unix socket, like the dslinter command does.
+
+    Everything stays loaded between requests: the linter with its configuration, the resources, the
+    modules parsed by astroid and the mypy daemon. A client connects for every request, which is a
+    JSON request on a line and gets a JSON response on a line of its own:
+
+    - {"paths": [...], "sources": {path: code}, "cwd": directory} lints the files or modules in
+      paths and the unsaved code of the files in sources. Relative paths are relative to cwd. The
+      response is {"messages": [...]}, with the messages like the json output format of pylint.
+    - {"command": "shutdown"} stops the server, the response is {}.
+
+    A malformed request gets {"error": message}. Modules parsed by astroid are parsed again when
+    their file is changed after they are parsed, together with the modules which import them. The
+    server stops when it gets no request for the idle timeout.
+    """
+
+    # Margin for file systems which store the modification times in seconds, so a file which is
+    # changed in the same second as it is parsed is parsed again.
+    MTIME_MARGIN = 2 * 10 ** 9
+
+    # Seconds a client gets to send its request after it connects, so a client which stays connected
+    # does not keep the server from answering the other clients.
+    REQUEST_TIMEOUT = 10
+
+    def __init__(self, path: str, linter: DslinterLinter, idle_timeout: float):
+        """
+        Create a server listening on a Unix socket.
+
+        :param path: Path of the Unix socket.
+        :param linter: Configured linter which checks the modules.
+        :param idle_timeout: Seconds without requests after which the server stops, 0 to never stop.
+        """
+        # Only the user can connect to the socket, from the moment it is bound.
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, LintRequestHandler)
+        finally:
+            os.umask(umask)
+        self.linter = linter
+        self.timeout = idle_timeout if idle_timeout > 0 else None
+        self.stopped = False
+        # [name of the module, (file of the module, time before it is parsed in nanoseconds,
+        # names of the modules it can import)]
+        self._parsed: Dict[str, Tuple[str, int, FrozenSet[str]]] = {}
+
+    def serve_until_idle(self):
+        """Handle requests until the server is idle for the timeout or is asked to shut down."""
+        try:
+            while not self.stopped:
+                self.handle_request()
+        finally:
+            self.server_close()
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+
+    def handle_timeout(self):
+        """Stop the server when no request is received within the idle timeout."""
+        self.stopped = True
+
+    def handle(self, request: Dict) -> Dict:
+        """
+        Handle a request.
+
+        :param request: Request of a client.
+        :return: Response to the request.
+        """
+        if request.get("command", "lint") == "shutdown":
+            self.stopped = True
+            return {}
+        if request.get("command", "lint") != "lint":
+            return {"error": f"Unknown command: {request['command']}"}
+        cwd = request.get("cwd", os.getcwd())
+        paths = [os.path.join(cwd, path) for path in request.get("paths", [])]
+        sources = {
+            os.path.join(cwd, path): code for path, code in request.get("sources", {}).items()
+        }
+        messages = self.lint(paths, sources)
+        return {"messages": [LintServer.serialize(message) for message in messages]}
+
+    def lint(self, paths: List[str], sources: Dict[str, str]) -> List[Message]:
+        """
+        Lint files or modules and the unsaved code of files.
+
+        :param paths: Files or modules to lint.
+        :param sources: Dict with the files as keys and their unsaved code as values.
+        :return: The messages of the linter.
+        """
+        self.invalidate_changed_modules()
+        started = time.time_ns()
+        reporter = CollectingReporter()
+        self.linter.set_reporter(reporter)
+        if paths:
+            self.linter.check(paths)
+        for path, code in sources.items():
+            name = PylintAdapter.check_code(self.linter, path, code)
+            # The module of the unsaved code must not be used for the file.
+            MANAGER.astroid_cache.pop(name, None)
+        for name, module in MANAGER.astroid_cache.items():
+            if name not in self._parsed and module.file is not None and os.path.isfile(module.file):
+                imported = frozenset(ModuleImports.importable_modules(module))
+                self._parsed[name] = (module.file, started, imported)
+        return reporter.messages
+
+    def invalidate_changed_modules(self):
+        """
+        Drop the modules of which the file is changed or removed since it is parsed from astroid's
+        cache, together with the modules which import them.
+
+        A module can hold what is inferred from the modules it imports, directly or through other
+        modules, so these are parsed again as well. The other modules stay parsed.
+        """
+        # Files which are created can resolve imports which did not resolve before.
+        PylintAdapter.clear_module_files()
+        changed = {
+            name
+            for name, (path, parsed, _) in self._parsed.items()
+            if not os.path.isfile(path)
+            or os.stat(path).st_mtime_ns + LintServer.MTIME_MARGIN >= parsed
+        }
+        if not changed:
+            return
+        importers: Dict[str, List[str]] = {}
+        for name, (_, _, imported) in self._parsed.items():
+            for imported_name in imported:
+                importers.setdefault(imported_name, []).append(name)
+        invalid = set(changed)
+        stack = list(changed)
+        while stack:
+            for name in importers.get(stack.pop(), ()):
+                if name not in invalid:
+                    invalid.add(name)
+                    stack.append(name)
+        for name in invalid:
+            MANAGER.astroid_cache.pop(name, None)
+            del self._parsed[name]
+        clear_inference_tip_cache()
+
+    @staticmethod
+    def serialize(message: Message) -> Dict:
+        """
+        Serialize a message like the json output format of pylint.
+
+        :param message: Message to serialize.
+        :return: Dict which can be dumped as JSON.
+        """
+        return {
+            "type": message.category,
+            "module": message.module,
+            "obj": message.obj,
+            "line": message.line,
+            "column": message.column,
+            "endLine": message.end_line,
+            "endColumn": message.end_column,
+            "path": message.path,
+            "symbol": message.symbol,
+            "message": message.msg or "",
+            "message-id": message.msg_id,
+        }
+
+    @staticmethod
+    def create_linter(args: List[str], rcfile: Optional[str] = None) -> DslinterLinter:
+        """
+        Create the linter of the dslinter command and configure it like pylint's Run does.
+
+        The modules are checked in the process of the server, so its caches are used, and the mypy
+        daemon is the default type inference backend.
+
+        :param args: Options of the dslinter command.
+        :param rcfile: Configuration file, None to look for one like pylint does.
+        :return: The configured linter.
+        :raises ValueError: When args contains other arguments than options.
+        """
+        linter = DslinterLinter(pylintrc=rcfile)
+        linter.load_default_plugins()
+        linter.global_set_option("type_inference_backend", "daemon")
+        # Like pylint's Run, which only disables the noisy informational messages of pylint with
+        # this linter.
+        linter.disable("I")
+        linter.enable(DslinterLinter.RUN_ENABLED)
+        linter.read_config_file()
+        linter.load_config_file()
+        remaining = linter.load_command_line_configuration(args)
+        if remaining:
+            raise ValueError(f"The server does not take modules to lint: {' '.join(remaining)}")
+        linter.set_option("jobs", 1)
+        linter.load_plugin_configuration()
+        return linter
+
+    @staticmethod
+    def get_default_socket() -> str:
+        """
+        Get the default path of the socket, which is private to the user.
+
+        Without a runtime directory, the socket is in a directory of the user in the temporary
+        directory. It is created when it does not exist. Another user can create it first, so it is
+        only used when it belongs to the user and nobody else can access it.
+
+        :return: Path in the runtime directory of the user, or in the directory of the user in the
+            temporary directory when there is none.
+        :raises PermissionError: When the directory in the temporary directory is not private.
+        """
+        runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_directory:
+            return os.path.join(runtime_directory, f"dslinter-{os.getuid()}.sock")
+        directory = os.path.join(tempfile.gettempdir(), f"dslinter-{os.getuid()}")
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+        status = os.lstat(directory)
+        if (
+            not stat.S_ISDIR(status.st_mode)
+            or status.st_uid != os.getuid()
+            or stat.S_IMODE(status.st_mode) & 0o077
+        ):
+            raise PermissionError(f"{directory} is not a directory private to the user")
+        return os.path.join(directory, "dslinter.sock")
+
+    @staticmethod
+    def request(path: str, request: Dict, timeout: Optional[float] = None) -> Dict:
+        """
+        Send a request to a running server and wait for the response.
+
+        :param path: Path of the Unix socket of the server.
+        :param request: Request to send.
+        :param timeout: Seconds to wait for the response, None to wait until it is received.
+        :return: Response of the server.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(path)
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile("rb") as response:
+                return json.loads(response.readline())
+
+
+class LintRequestHandler(socketserver.StreamRequestHandler):
+    """Handler answering the request of a client, one JSON request and response per connection."""
+
+    def setup(self):
+        """Close connections which send no request within the request timeout of the server."""
+        self.timeout = LintServer.REQUEST_TIMEOUT
+        super().setup()
+
+    def handle(self):
+        """Answer the request of the client, the server handles the next connection afterwards."""
+        try:
+            line = self.rfile.readline()
+        except socket.timeout:
+            return
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object")
+            response = self.server.handle(request)
+        except Exception as ex:  # pylint: disable=broad-except
+            response = {"error": f"{type(ex).__name__}: {ex}"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+def main(args: Optional[List[str]] = None):
+    """
+    Entry point of the dslinter server.
+
+    :param args: Arguments of the server, the ones of this process by default.
+    """
+    parser = argparse.ArgumentParser(
+        prog="dslinter-server",
+        description="Lint modules on request over a Unix socket. Other options are passed to the "
+        "linter like to the dslinter command.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Path of the Unix socket (default: in the runtime directory of the user).",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=15 * 60,
+        help="Seconds without requests after which the server stops, 0 to never stop "
+        "(default: 900).",
+    )
+    parser.add_argument("--rcfile", default=None, help="Configuration file of the linter.")
+    options, linter_args = parser.parse_known_args(args)
+    try:
+        PylintAdapter.check_versions()
+        socket_path = options.socket or LintServer.get_default_socket()
+        linter = LintServer.create_linter(linter_args, options.rcfile)
+    except (ValueError, RuntimeError, PermissionError) as ex:
+        print(ex, file=sys.stderr)
+        sys.exit(32)
+
+    if os.path.exists(socket_path):
+        try:
+            LintServer.request(socket_path, {"command": "lint"}, timeout=5)
+        except OSError:
+            # The socket of a server which did not stop cleanly.
+            os.unlink(socket_path)
+        else:
+            print(f"A server is already listening on {socket_path}", file=sys.stderr)
+            sys.exit(32)
+    server = LintServer(socket_path, linter, options.idle_timeout)
+    try:
+        server.serve_until_idle()
+    except KeyboardInterrupt:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
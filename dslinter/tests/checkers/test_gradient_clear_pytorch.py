@@ -13,6 +13,7 @@ class TestGradientClearPytorchChecker(pylint.testutils.CheckerTestCase):
     def test_gradient_not_clear(self):
         """Message should be added if the optimizer.zero_grad() is not used in pytorch code when loss_fn.backward() and optimizer.step() are used."""
         script = """
+            import torch
             for epoch in range(2):  # loop over the dataset multiple times
             
                 running_loss = 0.0
@@ -48,6 +48,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when all keywords are set in strict mode."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(n_clusters=8, init='k-means++', n_init=10, max_iter=300, tol=0.0001, \
             precompute_distances='auto', verbose=0, random_state=None, copy_x=True, n_jobs=None, \
             algorithm='auto') #@
@@ -61,6 +62,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when all arguments are set in strict mode."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(8, 'k-means++', 10, 300, 0.0001, 'auto', 0, None, True, None, 'auto') #@
             """
         )
@@ -72,6 +74,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """Violation when no keywords or arguments are set in strict mode."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans() #@
             """
         )
@@ -83,6 +86,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """Violation when not all keywords are set in strict mode."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(n_clusters=8, init='k-means++') #@
             """
         )
@@ -94,6 +98,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """Violation when not all arguments are set in strict mode."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(8, 'k-means++') #@
             """
         )
@@ -105,6 +110,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when all keywords are set in non-strict mode, function from main list."""
         call_node = astroid.extract_node(
             """
+            from sklearn.neighbors import NearestNeighbors
             NearestNeighbors(n_neighbors=5, radius=1.0, algorithm='auto', leaf_size=30, \
             metric='minkowski', p=2, metric_params=None, n_jobs=None) #@
             """
@@ -117,6 +123,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when only required keywords are set in non-strict mode, main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.neighbors import NearestNeighbors
             NearestNeighbors(n_neighbors=5) #@
             """
         )
@@ -128,6 +135,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when all arguments are set in non-strict mode, function from main list."""
         call_node = astroid.extract_node(
             """
+            from sklearn.neighbors import NearestNeighbors
             NearestNeighbors(5, 1.0, 'auto', 30, 'minkowski', 2, None, None) #@
             """
         )
@@ -139,6 +147,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """Violation when no keywords or arguments are set in non-strict mode, main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.neighbors import NearestNeighbors
             NearestNeighbors() #@
             """
         )
@@ -150,6 +159,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """Violation when not all required keywords are set in non-strict mode, main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.linear_model import ElasticNet
             ElasticNet(alpha=1.0) #@
             """
         )
@@ -161,6 +171,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """Violation when not all required arguments are set in non-strict mode, main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.linear_model import ElasticNet
             ElasticNet(1.0) #@
             """
         )
@@ -172,6 +183,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when all keywords are set in non-strict mode, no main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(n_clusters=8, init='k-means++', n_init=10, max_iter=300, tol=0.0001, \
             precompute_distances='auto', verbose=0, random_state=None, copy_x=True, n_jobs=None, \
             algorithm='auto') #@
@@ -185,6 +197,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when one keyword is set in non-strict mode, no main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(n_neighbors=5) #@
             """
         )
@@ -196,6 +209,7 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when all arguments are set in non-strict mode, no main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(8, 'k-means++', 10, 300, 0.0001, 'auto', 0, None, True, None, 'auto') #@
             """
         )
@@ -207,12 +221,25 @@ class TestHyperparameterScikitLearnChecker(pylint.testutils.CheckerTestCase):
         """No violation when one arguments is set in non-strict mode,no main function."""
         call_node = astroid.extract_node(
             """
+            from sklearn.cluster import KMeans
             KMeans(5) #@
             """
         )
         with self.assertNoMessages():
             self.checker.visit_call(call_node)
 
+    @set_config(strict_hyperparameters_scikitlearn=True)
+    def test_strict_empty_without_import(self):
+        """No violation in a module which does not import sklearn, also in strict mode."""
+        call_node = astroid.extract_node(
+            """
+            from cluster import KMeans
+            KMeans() #@
+            """
+        )
+        with self.assertNoMessages():
+            self.checker.visit_call(call_node)
+
     # @set_config(strict_hyperparameters=False)
     # def test_non_strict_non_main_empty(self):
     #     """Violation when no keywords or arguments are set in non-strict mode, no main function."""
@@ -12,6 +12,7 @@ class TestMaskMissingPytorchChecker(pylint.testutils.CheckerTestCase):
 
     def test_missing_mask_1(self):
         script = """
+        import torch
         action_mask = torch.log(action_mask) #@
         """
         module = astroid.parse(script)
@@ -23,6 +24,7 @@ class TestMaskMissingPytorchChecker(pylint.testutils.CheckerTestCase):
 
     def test_missing_mask_2(self):
         script = """
+        import torch
         action_mask = torch.log(action_mask + 1e-9) #@
         """
         module = astroid.parse(script)
@@ -32,6 +34,18 @@ class TestMaskMissingPytorchChecker(pylint.testutils.CheckerTestCase):
             self.checker.visit_module(module)
             self.checker.visit_call(call_node)
 
+    def test_missing_mask_without_import(self):
+        """Message should not be added in a module which does not import torch."""
+        script = """
+        action_mask = torch.log(action_mask) #@
+        """
+        module = astroid.parse(script)
+        node = astroid.extract_node(script)
+        call_node = node.value
+        with self.assertNoMessages():
+            self.checker.visit_module(module)
+            self.checker.visit_call(call_node)
+
     def test_with_mask_1(self):
         script = """
         action_mask = torch.log(torch.clip(action_mask, FLOAT_MIN, FLOAT_MAX))
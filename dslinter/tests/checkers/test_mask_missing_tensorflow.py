@@ -12,6 +12,7 @@ class TestMaskMissingTensorflowChecker(pylint.testutils.CheckerTestCase):
 
     def test_missing_mask_1(self):
         script = """
+        import tensorflow as tf
         cross_entropy = tf.reduce_mean(-tf.reduce_sum(y_*tf.log(y_conv),reduction_indices=[1])) #@
         """
         module = astroid.parse(script)
@@ -23,6 +24,7 @@ class TestMaskMissingTensorflowChecker(pylint.testutils.CheckerTestCase):
 
     def test_missing_mask_2(self):
         script = """
+        import tensorflow as tf
         cross_entropy = tf.reduce_mean(-tf.reduce_sum(y_*tf.log(y_conv + 1e-9),reduction_indices=[1])) #@
         """
         module = astroid.parse(script)
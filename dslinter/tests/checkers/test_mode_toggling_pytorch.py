@@ -13,6 +13,7 @@ class TestModeTogglingPytorchChecker(pylint.testutils.CheckerTestCase):
     def test_mode_improper_toggling(self):
         """Message will be added when the training mode is not toggling back in time."""
         script = """
+        import torch
         for epoch in range(2):  # loop over the dataset multiple times 
             running_loss = 0.0
             net.train()
@@ -58,6 +58,7 @@ class TestDataLeakageScikitLearnChecker(pylint.testutils.CheckerTestCase):
     def test_pipeline_violation_outside_block(self):
         """Test whether sk-pipeline violation is found when assignment is done outside block."""
         script = """
+        from sklearn.preprocessing import StandardScaler
         scaler = StandardScaler()
         X_train = scaler.fit_transform(X_train)        
         model = KMeans()
@@ -71,6 +72,7 @@ class TestDataLeakageScikitLearnChecker(pylint.testutils.CheckerTestCase):
     def test_pipeline_violation_on_name(self):
         """Message should be added when learning function is called directly on a learning class."""
         script = """
+        from sklearn.preprocessing import StandardScaler
         scaler = StandardScaler()
         X_train = scaler.fit_transform(X_train)          
         kmeans = KMeans()
@@ -83,6 +85,7 @@ class TestDataLeakageScikitLearnChecker(pylint.testutils.CheckerTestCase):
     def test_pipeline_violation_on_name_twice(self):
         """Test calling an estimator by multiple assignments."""
         script = """
+        from sklearn.preprocessing import StandardScaler
         scaler = StandardScaler()
         X_train = scaler.fit_transform(X_train)          
         kmeans = KMeans()
@@ -96,6 +99,7 @@ class TestDataLeakageScikitLearnChecker(pylint.testutils.CheckerTestCase):
     def test_pipeline_violation_in_function(self):
         """Test whether sk-pipeline violation is found when assignment is a function argument."""
         script = """
+        from sklearn.preprocessing import StandardScaler
         scaler = StandardScaler()
         X_train = scaler.fit_transform(X_train)          
         def f(model):
@@ -109,6 +113,7 @@ class TestDataLeakageScikitLearnChecker(pylint.testutils.CheckerTestCase):
     def test_pipeline_violation_in_function_arg_assigned(self):
         """Test calling an estimator within a function, where the argument is assigned."""
         script = """
+        from sklearn.preprocessing import StandardScaler
         scaler = StandardScaler()
         X_train = scaler.fit_transform(X_train)             
         def f(model):
@@ -123,6 +128,7 @@ class TestDataLeakageScikitLearnChecker(pylint.testutils.CheckerTestCase):
     def test_pipeline_violation_in_second_function_argument(self):
         """Test calling an estimator with a second function argument."""
         script = """
+        from sklearn.preprocessing import StandardScaler
         scaler = StandardScaler()
         X_train = scaler.fit_transform(X_train)        
         def f(x, model):
@@ -0,0 +1,108 @@
+"""Class which tests the TypeInferenceChecker."""
+import astroid
+import pylint.testutils
+from pylint.lint import PyLinter
+from pylint.testutils import set_config
+
+import dslinter
+from dslinter.checkers.type_inference_options import TypeInferenceChecker
+from dslinter.utils.module_imports import ModuleImports
+from dslinter.utils.project_type_inference import ProjectTypeInference
+from dslinter.utils.type_inference import ModuleTypeInference, TypeInference
+from dslinter.utils.type_inference_prefetch import TypeInferencePrefetch
+
+
+class TestTypeInferenceChecker(pylint.testutils.CheckerTestCase):
+    """Class which tests the TypeInferenceChecker."""
+
+    CHECKER_CLASS = dslinter.plugin.TypeInferenceChecker
+
+    def test_default_backend(self):
+        """Test whether mypy is ran from scratch for every module by default."""
+        self.checker.apply_configuration()
+        assert TypeInference.backend == "mypy"
+
+    @set_config(type_inference_backend="daemon")
+    def test_daemon_backend(self):
+        """Test whether the daemon backend is applied when it is configured."""
+        self.checker.apply_configuration()
+        assert TypeInference.backend == "daemon"
+        TypeInference.backend = "mypy"
+
+    def test_project_batch(self, monkeypatch):
+        """Test whether the linted modules are inferred before the linter checks them."""
+        linter = PyLinter()
+        checker = TypeInferenceChecker(linter)
+        linter.register_checker(checker)
+        linter.global_set_option("type_inference_project_batch", True)
+        checked = []
+        monkeypatch.setattr(linter, "check", checked.append)
+        monkeypatch.setattr(
+            ProjectTypeInference,
+            "infer_project_types",
+            lambda modules: checked.append(list(modules)),
+        )
+        checker.apply_configuration()
+        linter.check(["dslinter/plugin.py"])
+        assert checked == [[("dslinter.plugin", "dslinter/plugin.py")], ["dslinter/plugin.py"]]
+
+    def test_prefetch(self, monkeypatch):
+        """Test whether mypy is ran on the linted modules in the background during the check."""
+        linter = PyLinter()
+        checker = TypeInferenceChecker(linter)
+        linter.register_checker(checker)
+        linter.global_set_option("type_inference_prefetch", 2)
+        checked = []
+        monkeypatch.setattr(linter, "check", checked.append)
+        monkeypatch.setattr(TypeInferencePrefetch, "is_supported", lambda: True)
+        monkeypatch.setattr(ModuleTypeInference, "upcoming_runs", list)
+        monkeypatch.setattr(
+            TypeInferencePrefetch,
+            "start",
+            lambda processes, runs: checked.append((processes, runs)),
+        )
+        monkeypatch.setattr(TypeInferencePrefetch, "stop", lambda: checked.append("stop"))
+        checker.apply_configuration()
+        linter.check(["dslinter/plugin.py"])
+        modules = [("dslinter.plugin", "dslinter/plugin.py")]
+        assert checked == [(2, modules), ["dslinter/plugin.py"], "stop"]
+
+        # Parallel jobs check the modules in other processes.
+        checked.clear()
+        linter.config.jobs = 2
+        linter.check(["dslinter/plugin.py"])
+        assert checked == [["dslinter/plugin.py"]]
+
+    @set_config(type_inference_force=True)
+    def test_force(self):
+        """Test whether inference is forced in all modules when it is configured."""
+        self.checker.apply_configuration()
+        assert ModuleTypeInference.force
+        ModuleTypeInference.force = False
+
+    @set_config(type_inference_timeout=2.5)
+    def test_timeout(self, monkeypatch):
+        """Test whether the time budget is applied and the modules which exceed it get a message."""
+        self.checker.apply_configuration()
+        assert TypeInference.timeout == 2.5
+        module = astroid.parse("import pandas as pd")
+        monkeypatch.setattr(ModuleTypeInference, "_degraded", {module})
+        with self.assertAddsMessages(
+            pylint.testutils.MessageTest(msg_id="type-inference-timeout", node=module, args=(2.5,))
+        ):
+            self.checker.leave_module(module)
+        with self.assertNoMessages():
+            self.checker.leave_module(module)
+        TypeInference.timeout = 0.0
+
+    def test_release(self):
+        """Test whether the caches are released when the module is left after the other checkers."""
+        linter = PyLinter()
+        dslinter.plugin.register(linter)
+        checkers = [checker for checker in linter.prepare_checkers() if checker is not linter]
+        assert isinstance(checkers[-1], TypeInferenceChecker)
+
+        module = astroid.parse("import pandas as pd")
+        ModuleImports.get(module)
+        self.checker.leave_module(module)
+        assert ModuleImports._module is None  # pylint: disable=protected-access
@@ -0,0 +1,148 @@
+"""Class which tests whether the plugin keeps memory bounded during long runs."""
+import gc
+import os
+import weakref
+
+from astroid import MANAGER
+from astroid.transforms import TransformVisitor
+from pylint.lint import PyLinter
+from pylint.reporters import BaseReporter
+
+import dslinter.plugin
+
+
+class CountingReporter(BaseReporter):
+    """Reporter which only counts the messages, so it does not grow with the number of modules."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def handle_message(self, msg):
+        self.count += 1
+
+    def _display(self, layout):
+        pass
+
+
+class TestMemory:
+    """Class which tests whether the plugin keeps memory bounded during long runs."""
+
+    WARM_UP_MODULES = 500
+    MODULES = 2500
+    # Growth of the resident set size allowed while the modules after the warm-up are linted.
+    RSS_MARGIN = 16 * 1024 * 1024
+
+    # Synthetic module which triggers most checkers without importing pandas, so mypy is not ran.
+    MODULE = """
+import torch
+import tensorflow as tf
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+from torch.utils.data import DataLoader
+
+def train_{i}(model, x, y):
+    scaler = StandardScaler()
+    x = scaler.fit_transform(x)
+    KMeans().fit(x)
+    loader = DataLoader(x)
+    out = model.forward(x)
+    loss = torch.log(out)
+    for batch in loader:
+        model.fit(batch, y)
+    return tf.log(loss)
+"""
+
+    @staticmethod
+    def get_rss() -> int:
+        """Get the resident set size of this process in bytes, or 0 when it is not available."""
+        try:
+            with open("/proc/self/statm", "r", encoding="utf-8") as file:
+                return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            return 0
+
+    @staticmethod
+    def get_linter() -> PyLinter:
+        """Get a linter with only the messages of the plugin enabled."""
+        linter = PyLinter()
+        dslinter.plugin.register(linter)
+        linter.disable("all")
+        for checker in linter.get_checkers():
+            if type(checker).__module__.startswith("dslinter"):
+                for msgid in checker.msgs:
+                    linter.enable(msgid)
+        return linter
+
+    def write_modules(self, directory, count: int) -> list:
+        """Write a number of synthetic modules to a directory and return their paths."""
+        paths = []
+        for i in range(count):
+            path = directory / f"module_{i}.py"
+            path.write_text(self.MODULE.format(i=i))
+            paths.append(str(path))
+        return paths
+
+    @staticmethod
+    def track_modules(linter: PyLinter, monkeypatch) -> list:
+        """Keep the parsed modules out of the astroid cache and return weak references to them."""
+        # pylint keeps every module in the astroid cache, it is removed to only measure the plugin.
+        modules = []
+        get_ast = linter.get_ast
+
+        def get_ast_uncached(filepath, modname, data=None):
+            module = get_ast(filepath, modname, data)
+            MANAGER.astroid_cache.pop(modname, None)
+            modules.append(weakref.ref(module))
+            return module
+
+        monkeypatch.setattr(linter, "get_ast", get_ast_uncached)
+        return modules
+
+    @staticmethod
+    def get_reachable(modules: list) -> list:
+        """Get the modules which are still reachable after the linter is done."""
+        # astroid keeps the last transformed nodes in a cache of a bounded size.
+        TransformVisitor._transform.cache_clear()  # pylint: disable=no-member,protected-access
+        gc.collect()
+        return [module for module in modules if module() is not None]
+
+    def test_modules_released(self, tmp_path, monkeypatch):
+        """Test whether no module stays reachable and the memory stays flat over many modules."""
+        paths = self.write_modules(tmp_path, self.WARM_UP_MODULES + self.MODULES)
+        linter = self.get_linter()
+        reporter = CountingReporter()
+        linter.set_reporter(reporter)
+        modules = self.track_modules(linter, monkeypatch)
+        with monkeypatch.context() as context:
+            context.syspath_prepend(str(tmp_path))
+            linter.check(paths[: self.WARM_UP_MODULES])
+            gc.collect()
+            rss = self.get_rss()
+            linter.check(paths[self.WARM_UP_MODULES :])
+            gc.collect()
+            growth = self.get_rss() - rss
+
+        assert len(modules) == len(paths)
+        assert reporter.count >= len(paths)
+        assert self.get_reachable(modules) == []
+        assert growth < self.RSS_MARGIN
+
+    def test_modules_released_smells_only(self, tmp_path, monkeypatch):
+        """Test whether no module stays reachable when only the messages of smells are enabled."""
+        paths = self.write_modules(tmp_path, 20)
+        linter = self.get_linter()
+        # Like --disable=all --enable=<smells> --reports=n, so pylint does not need the checker of
+        # the type inference for its message or report.
+        linter.disable("type-inference-timeout")
+        linter.set_option("reports", False)
+        reporter = CountingReporter()
+        linter.set_reporter(reporter)
+        modules = self.track_modules(linter, monkeypatch)
+        with monkeypatch.context() as context:
+            context.syspath_prepend(str(tmp_path))
+            linter.check(paths)
+
+        assert len(modules) == len(paths)
+        assert reporter.count >= len(paths)
+        assert self.get_reachable(modules) == []
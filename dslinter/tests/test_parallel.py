@@ -0,0 +1,94 @@
+"""Class which tests running the plugin in parallel pylint jobs."""
+import ast
+import glob
+import os
+import subprocess
+import sys
+import textwrap
+
+from pylint.lint import PyLinter
+
+import dslinter.plugin
+
+
+class TestParallel:
+    """Class which tests running the plugin in parallel pylint jobs."""
+
+    TESTS_DIRECTORY = os.path.join(os.path.dirname(__file__), "checkers")
+    ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+    # Modules which only give the same messages in every job when no state is kept between modules.
+    ORDER_DEPENDENT_MODULES = {
+        "a_import_dataloader.py": "import torch\nfrom torch.utils.data import DataLoader\n",
+        "b_use_dataloader.py": "import torch\nloader = DataLoader(dataset)\n",
+    }
+
+    @staticmethod
+    def get_scripts():
+        """Get the scripts of the checker tests, which are linted as modules."""
+        scripts = []
+        for path in sorted(glob.glob(os.path.join(TestParallel.TESTS_DIRECTORY, "test_*.py"))):
+            with open(path, "r", encoding="utf-8") as file:
+                tree = ast.parse(file.read())
+            for node in ast.walk(tree):
+                if (
+                    isinstance(node, ast.Assign)
+                    and any(
+                        isinstance(target, ast.Name) and target.id == "script"
+                        for target in node.targets
+                    )
+                    and isinstance(node.value, ast.Constant)
+                ):
+                    scripts.append(textwrap.dedent(node.value.value))
+        return scripts
+
+    @staticmethod
+    def get_messages():
+        """Get the symbols of the messages of the plugin."""
+        linter = PyLinter()
+        dslinter.plugin.register(linter)
+        return sorted(
+            definition[1]
+            for checker in linter.get_checkers()
+            if type(checker).__module__.startswith("dslinter")
+            for definition in checker.msgs.values()
+        )
+
+    def run_pylint(self, directory: str, jobs: int, cache_directory: str):
+        """Lint all modules in a directory in a number of jobs and return the sorted messages."""
+        paths = glob.glob(os.path.join(directory, "*.py"))
+        modules = sorted(os.path.basename(path) for path in paths)
+        command = [
+            sys.executable, "-m", "pylint", "--load-plugins=dslinter", "--disable=all",
+            "--enable=" + ",".join(self.get_messages()), f"--jobs={jobs}", "--score=n",
+            "--persistent=n", "--type_inference_backend=daemon", "--type_inference_cache=y",
+            "--type_inference_cache_dir=" + cache_directory,
+            "--msg-template={path}:{line}:{column}: {symbol}",
+        ]
+        env = dict(os.environ, PYTHONPATH=self.ROOT_DIRECTORY)
+        command += modules
+        result = subprocess.run(
+            command, capture_output=True, text=True, env=env, cwd=directory, check=False
+        )
+        assert result.stderr == ""
+        return sorted(line for line in result.stdout.splitlines() if not line.startswith("*"))
+
+    def test_parallel_jobs(self, tmp_path):
+        """Test whether the scripts of the checker tests give the same messages in 1 and 2 jobs."""
+        for i, script in enumerate(self.get_scripts()):
+            try:
+                ast.parse(script)
+            except SyntaxError:
+                continue
+            (tmp_path / f"script_{i:03d}.py").write_text(script)
+        for name, code in self.ORDER_DEPENDENT_MODULES.items():
+            (tmp_path / name).write_text(code)
+
+        messages = self.run_pylint(str(tmp_path), 1, str(tmp_path / "cache_1"))
+        assert len(messages) > 0
+        assert "b_use_dataloader.py:2:9: hyperparameters-pytorch" in messages
+        assert "b_use_dataloader.py:2:9: randomness-control-dataloader-pytorch" not in messages
+        # Every run has a cache of its own, so mypy runs in the jobs and their types are cached.
+        cache_directory = tmp_path / "cache_2"
+        assert self.run_pylint(str(tmp_path), 2, str(cache_directory)) == messages
+        assert len(list(cache_directory.glob("*/*.json"))) > 0
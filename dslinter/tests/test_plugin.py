@@ -0,0 +1,31 @@
+"""Class which tests importing the plugin."""
+import subprocess
+import sys
+
+
+class TestPlugin:
+    """Class which tests importing the plugin."""
+
+    # Seconds importing the plugin may take after pylint is imported. It takes less than 0.1 seconds
+    # on a developer machine, the margin is for slow CI runners.
+    IMPORT_TIME_BUDGET = 0.5
+
+    @staticmethod
+    def run_python(code: str) -> str:
+        """Run code in a new interpreter, where no module is imported yet, and return its output."""
+        command = [sys.executable, "-c", code]
+        return subprocess.run(command, check=True, capture_output=True, text=True).stdout
+
+    def test_import_time(self):
+        """Test whether importing the plugin stays within its budget in the best of three runs."""
+        code = (
+            "import time\nimport pylint.lint\nstart = time.perf_counter()\n"
+            "import dslinter.plugin\nprint(time.perf_counter() - start)"
+        )
+        import_time = min(float(self.run_python(code)) for _ in range(3))
+        assert import_time < self.IMPORT_TIME_BUDGET
+
+    def test_import_without_mypy_build(self):
+        """Test whether mypy's build is not imported until it is needed."""
+        code = "import sys\nimport dslinter.plugin\nprint('mypy.build' in sys.modules)"
+        assert self.run_python(code).strip() == "False"
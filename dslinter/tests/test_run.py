@@ -0,0 +1,113 @@
+"""Class which tests the standalone dslinter command."""
+import os
+import subprocess
+import sys
+
+from dslinter.run import DslinterLinter
+
+
+class TestRun:
+    """Class which tests the standalone dslinter command."""
+
+    ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+    # Modules which trigger checkers without importing pandas, so mypy is not ran.
+    MODULES = {
+        "train.py": (
+            "import torch\nfrom sklearn.cluster import KMeans\n"
+            "from torch.utils.data import DataLoader\n\n"
+            "def train(model, x):\n    KMeans().fit(x)\n"
+            "    loader = DataLoader(x)\n    return model.forward(loader)\n"
+        ),
+        # pylint's checkers are not registered, so their messages in pragmas are ignored.
+        "pragma.py": (
+            "import tensorflow as tf  # pylint: disable=missing-module-docstring\ntf.log(1)\n"
+        ),
+        "broken.py": "def f(:\n",
+    }
+
+    @staticmethod
+    def get_linter() -> DslinterLinter:
+        """Get a linter with the checkers and the defaults of the command."""
+        linter = DslinterLinter()
+        linter.load_default_plugins()
+        return linter
+
+    def run(self, command: list, directory: str) -> str:
+        """Run a command on all modules and return what it prints."""
+        env = dict(os.environ, PYTHONPATH=self.ROOT_DIRECTORY)
+        command = [sys.executable, "-m"] + command + sorted(self.MODULES)
+        result = subprocess.run(
+            command, capture_output=True, text=True, env=env, cwd=directory, check=False
+        )
+        assert result.stderr == ""
+        return result.stdout
+
+    def test_only_plugin_checkers(self):
+        """Test whether only the plugin's checkers are registered and the smells are enabled."""
+        linter = self.get_linter()
+        checkers = [checker for checker in linter.get_checkers() if checker is not linter]
+        assert len(checkers) > 0
+        assert all(type(checker).__module__.startswith("dslinter") for checker in checkers)
+
+        enabled = {
+            (checker.name, definition[1])
+            for checker in checkers
+            for msgid, definition in checker.msgs.items()
+            if linter.is_message_enabled(msgid)
+        }
+        assert ("hyperparameters-pytorch", "hyperparameters-pytorch") in enabled
+        assert ("import", "import-pandas") in enabled
+        # Checkers are enabled by their names, e.g., 'import'.
+        assert all({name, symbol} & set(DslinterLinter.DEFAULT_ENABLED) for name, symbol in enabled)
+        assert linter.config.jobs == 0
+
+    def test_type_inference_timeout_enabled(self, tmp_path):
+        """Test whether the plugin's informational message stays enabled after pylint's Run."""
+        rcfile = tmp_path / "pylintrc"
+        rcfile.write_text("")
+        linter = self.get_linter()
+        assert linter.is_message_enabled("type-inference-timeout")
+        # Like pylint's Run does before it loads the configuration.
+        linter.disable("I")
+        linter.enable(DslinterLinter.RUN_ENABLED)
+        linter.read_config_file(str(rcfile))
+        assert linter.is_message_enabled("type-inference-timeout")
+        assert not linter.is_message_enabled("locally-disabled")
+        linter.load_command_line_configuration(["--disable=type-inference-timeout"])
+        assert not linter.is_message_enabled("type-inference-timeout")
+
+    def test_largest_first(self, tmp_path):
+        """Test whether the largest modules are checked first in parallel jobs only."""
+        for name, size in (("small.py", 1), ("large.py", 100), ("medium.py", 10)):
+            (tmp_path / name).write_text("x = 1\n" * size)
+        paths = [str(tmp_path / name) for name in ("small.py", "large.py", "medium.py")]
+        linter = self.get_linter()
+        linter.open()
+
+        # pylint: disable=protected-access
+        linter.config.jobs = 2
+        largest_first = [paths[1], paths[2], paths[0]]
+        assert [item.filepath for item in linter._iterate_file_descrs(paths)] == largest_first
+        linter.config.jobs = 1
+        assert [item.filepath for item in linter._iterate_file_descrs(paths)] == paths
+
+    def test_same_output_as_pylint(self, tmp_path):
+        """Test whether the command prints what pylint prints with the plugin and its messages."""
+        for name, code in self.MODULES.items():
+            (tmp_path / name).write_text(code)
+        pylint = [
+            "pylint", "--load-plugins=dslinter", "--disable=all", "--persistent=n",
+            "--enable=" + ",".join(DslinterLinter.DEFAULT_ENABLED + ("syntax-error",)),
+        ]
+        for output_format in ("text", "json", "parseable"):
+            expected = self.run(pylint + ["--output-format=" + output_format], str(tmp_path))
+            assert "forward-pytorch" in expected
+            command = ["dslinter", "--jobs=1", "--output-format=" + output_format]
+            assert self.run(command, str(tmp_path)) == expected
+
+        template = "--msg-template={path}:{line}: {symbol}"
+        expected = self.run(pylint + [template, "--score=n"], str(tmp_path)).splitlines()
+        command = ["dslinter", "--jobs=2", template, "--score=n"]
+        actual = self.run(command, str(tmp_path)).splitlines()
+        assert sorted(actual) == sorted(expected)
@@ -0,0 +1,165 @@
+"""Class which tests the dslinter server."""
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
+
+import pylint
+import pytest
+from astroid import MANAGER
+
+from dslinter.server import LintServer, PylintAdapter
+from dslinter.utils.type_inference import TypeInference
+
+
+class TestServer:
+    """Class which tests the dslinter server."""
+
+    # Module which triggers a checker without importing pandas, so mypy is not ran.
+    MODULE = "import torch\n\ndef train(model, x):\n    return model.forward(x)\n"
+    FIXED_MODULE = "import torch\n\ndef train(model, x):\n    return model(x)\n"
+
+    @staticmethod
+    @pytest.fixture
+    def server(tmp_path, monkeypatch):
+        """Start a server in a thread and stop it after the test."""
+        # Creating the linter applies its type inference options to this process.
+        monkeypatch.setattr(TypeInference, "backend", TypeInference.backend)
+        linter = LintServer.create_linter(["--score=n"])
+        server = LintServer(str(tmp_path / "dslinter.sock"), linter, 30)
+        thread = threading.Thread(target=server.serve_until_idle)
+        thread.start()
+        yield server
+        if not server.stopped:
+            LintServer.request(server.server_address, {"command": "shutdown"})
+        thread.join(30)
+        assert not thread.is_alive()
+        assert not os.path.exists(server.server_address)
+
+    @staticmethod
+    def lint(server: LintServer, request: dict) -> list:
+        """Send a lint request to the server and return the symbols and lines of the messages."""
+        response = LintServer.request(server.server_address, request)
+        assert "error" not in response
+        return [(message["symbol"], message["line"]) for message in response["messages"]]
+
+    @staticmethod
+    def test_socket_private(server):
+        """Test whether only the user can connect to the socket."""
+        assert stat.S_IMODE(os.stat(server.server_address).st_mode) == 0o600
+
+    @staticmethod
+    def test_default_socket(tmp_path, monkeypatch):
+        """Test whether the socket is in a private directory when there is no runtime directory."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert LintServer.get_default_socket() == str(tmp_path / f"dslinter-{os.getuid()}.sock")
+
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        directory = tmp_path / f"dslinter-{os.getuid()}"
+        assert LintServer.get_default_socket() == str(directory / "dslinter.sock")
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+        assert LintServer.get_default_socket() == str(directory / "dslinter.sock")
+
+        # A directory which others can access can be created by another user first.
+        directory.chmod(0o755)
+        with pytest.raises(PermissionError):
+            LintServer.get_default_socket()
+        directory.rmdir()
+        directory.symlink_to(tmp_path)
+        with pytest.raises(PermissionError):
+            LintServer.get_default_socket()
+
+    @staticmethod
+    def test_check_versions(monkeypatch):
+        """Test whether the server refuses pylint versions of which it does not know the APIs."""
+        PylintAdapter.check_versions()
+        monkeypatch.setattr(pylint, "__version__", "2.13.0")
+        with pytest.raises(RuntimeError):
+            PylintAdapter.check_versions()
+
+    @staticmethod
+    def test_create_linter(monkeypatch):
+        """Test whether the linter runs in the server's process with the mypy daemon by default."""
+        monkeypatch.setattr(TypeInference, "backend", TypeInference.backend)
+        linter = LintServer.create_linter(["--enable=inplace-pandas"])
+        assert linter.config.jobs == 1
+        assert TypeInference.backend == "daemon"
+        assert linter.is_message_enabled("inplace-pandas")
+        assert linter.is_message_enabled("type-inference-timeout")
+        assert not linter.is_message_enabled("locally-disabled")
+        with pytest.raises(ValueError):
+            LintServer.create_linter(["module.py"])
+
+    def test_lint(self, server, tmp_path):
+        """Test whether files and unsaved code are linted and changed files are parsed again."""
+        path = tmp_path / "train.py"
+        path.write_text(self.MODULE)
+        request = {"paths": ["train.py"], "cwd": str(tmp_path)}
+        assert self.lint(server, request) == [("forward-pytorch", 4)]
+        assert self.lint(server, request) == [("forward-pytorch", 4)]
+
+        # The file is changed after it is parsed.
+        time.sleep(0.01)
+        path.write_text("\n" + self.MODULE)
+        assert self.lint(server, request) == [("forward-pytorch", 5)]
+
+        # Unsaved code is not used for the file afterwards.
+        assert self.lint(server, {"sources": {str(path): self.FIXED_MODULE}}) == []
+        assert self.lint(server, request) == [("forward-pytorch", 5)]
+
+        assert "error" in LintServer.request(server.server_address, ["train.py"])
+        assert "error" in LintServer.request(server.server_address, {"command": "restart"})
+        assert LintServer.request(server.server_address, {"command": "shutdown"}) == {}
+        assert server.stopped
+
+    @staticmethod
+    def test_idle_timeout(tmp_path, monkeypatch):
+        """Test whether the server stops when it gets no requests for the idle timeout."""
+        monkeypatch.setattr(TypeInference, "backend", TypeInference.backend)
+        server = LintServer(str(tmp_path / "dslinter.sock"), LintServer.create_linter([]), 0.1)
+        server.serve_until_idle()
+        assert server.stopped
+        assert not os.path.exists(str(tmp_path / "dslinter.sock"))
+
+    def test_connected_client(self, server, tmp_path, monkeypatch):
+        """Test whether a client which stays connected without a request does not block others."""
+        monkeypatch.setattr(LintServer, "REQUEST_TIMEOUT", 0.1)
+        (tmp_path / "train.py").write_text(self.MODULE)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(server.server_address)
+            request = {"paths": ["train.py"], "cwd": str(tmp_path)}
+            assert self.lint(server, request) == [("forward-pytorch", 4)]
+            assert self.lint(server, request) == [("forward-pytorch", 4)]
+
+    def test_invalidate_importers(self, tmp_path, monkeypatch):
+        """Test whether only a changed module and the modules importing it are parsed again."""
+        monkeypatch.setattr(TypeInference, "backend", TypeInference.backend)
+        modules = {
+            "helper_server.py": "def make(x):\n    return x\n",
+            "train_server.py": "from helper_server import make\n" + self.MODULE,
+            "other_server.py": self.MODULE,
+        }
+        for name, code in modules.items():
+            (tmp_path / name).write_text(code)
+            # The files are not changed right before they are parsed.
+            os.utime(tmp_path / name, ns=(0, 0))
+        paths = [str(tmp_path / name) for name in modules]
+        server = LintServer(str(tmp_path / "dslinter.sock"), LintServer.create_linter([]), 30)
+        try:
+            server.lint(paths, {})
+            parsed = dict(MANAGER.astroid_cache)
+            server.invalidate_changed_modules()
+            assert MANAGER.astroid_cache["train_server"] is parsed["train_server"]
+
+            (tmp_path / "helper_server.py").write_text("def make(x, y):\n    return x\n")
+            server.invalidate_changed_modules()
+            assert "helper_server" not in MANAGER.astroid_cache
+            assert "train_server" not in MANAGER.astroid_cache
+            assert MANAGER.astroid_cache["other_server"] is parsed["other_server"]
+        finally:
+            server.server_close()
+            for name in ("helper_server", "train_server", "other_server"):
+                MANAGER.astroid_cache.pop(name, None)
@@ -0,0 +1,45 @@
+"""Class which tests the AssignmentFacts utils class."""
+import astroid
+
+from dslinter.utils.assignment_facts import AssignmentFacts
+from dslinter.utils.type_inference import TypeInference
+
+
+class TestAssignmentFacts:
+    """Class which tests the AssignmentFacts utils class."""
+
+    def test_get(self):
+        """Test if the origins of the values assigned to every variable are recorded in order."""
+        code = (
+            "a = 1\na = tf.random.uniform()\na = b.c\n"
+            "b = pd.DataFrame()\ndef f():\n    b = torch.clip(b)"
+        )
+        module = astroid.parse(code)
+        expected = {"a": ["const", "tf.random.uniform"], "b": ["pd.DataFrame", "torch.clip"]}
+        assert AssignmentFacts.get(module) == expected
+        AssignmentFacts.clear()
+
+    def test_single_pass(self, monkeypatch):
+        """Test if the assignments of a module are walked once for all views."""
+        collected = []
+        collect = AssignmentFacts._collect
+        monkeypatch.setattr(
+            AssignmentFacts, "_collect", lambda module: collected.append(module) or collect(module)
+        )
+        module = astroid.parse("x = 1\nx = tf.constant(1)\ny = pd.DataFrame()\ny = 0")
+
+        full_types = TypeInference.infer_variable_full_types(module)
+        assert full_types == {"x": ["const", "tf.constant"], "y": ["const"]}
+        most_recent = TypeInference.infer_variable_most_recent_full_types(module)
+        assert most_recent == {"x": "tf.constant", "y": "const"}
+        native = TypeInference.infer_native_variable_most_recent_types(module)
+        assert native == {"x": "tf", "y": "const"}
+        library = TypeInference.infer_library_variable_most_recent_types(module)
+        assert library == {"x": "tf.constant"}
+        assert TypeInference.infer_library_variable_first_types(module) == {}
+        assert len(collected) == 1
+        assert TypeInference.infer_variable_full_types(module) is full_types
+
+        TypeInference.infer_variable_full_types(astroid.parse("z = 1"))
+        assert len(collected) == 2
+        AssignmentFacts.clear()
@@ -1,7 +1,9 @@
 """Class which tests the AST utils class."""
+import sys
+
 import astroid
 
-from dslinter.utils.ast import ASTUtil
+from dslinter.utils.ast import ASTUtil, AssignUtil
 
 
 class TestAST:
@@ -17,10 +19,101 @@ class TestAST:
                 return g.h(i)
             """
         )
-        found = ASTUtil.search_nodes(module_tree, astroid.Call)
+        found = list(ASTUtil.search_nodes(module_tree, astroid.Call))
         # noinspection PyUnresolvedReferences
         assert len(found) == 2 and found[0].func.attrname == "c" and found[1].func.attrname == "h"
 
+    def test_search_nodes_types(self):
+        """Test the search_nodes method with a Tuple of types, yielding children before parents."""
+        module_tree = astroid.parse("import a\nb = a.c(d())")
+        found = list(ASTUtil.search_nodes(module_tree, (astroid.Import, astroid.Call)))
+        assert [type(node) for node in found] == [astroid.Import, astroid.Call, astroid.Call]
+        assert found[1].func.name == "d"
+
+    def test_search_nodes_early_termination(self, monkeypatch):
+        """Test whether the search stops when no more nodes are requested."""
+        module_tree = astroid.parse("a = b()\nc = d()")
+        visited = []
+        get_children = astroid.Assign.get_children
+
+        def counting_get_children(node):
+            visited.append(node)
+            return get_children(node)
+
+        monkeypatch.setattr(astroid.Assign, "get_children", counting_get_children)
+        assert next(ASTUtil.search_nodes(module_tree, astroid.Call)).func.name == "b"
+        assert visited == [module_tree.body[0]]
+
+    def test_search_nodes_deeply_nested(self):
+        """Test whether deeply nested code does not exceed the recursion limit."""
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(20000)
+        try:
+            module_tree = astroid.parse("a = b" + ".c()" * 2000)
+        finally:
+            sys.setrecursionlimit(limit)
+        assert len(list(ASTUtil.search_nodes(module_tree, astroid.Call))) == 2000
+
+    def test_search_indexed_nodes(self):
+        """Test whether the index finds the nodes of search_nodes in the module and its subtrees."""
+        module_tree = astroid.parse(
+            """
+            a = b.c(d())
+
+            def e(f):
+                g = lambda: h(f)
+                return g.i(j)
+
+            class K:
+                async def l(self):
+                    m()
+            """
+        )
+        types = [astroid.Call, astroid.Lambda, (astroid.Assign, astroid.Return), astroid.Import]
+        subtrees = list(ASTUtil.search_nodes(module_tree, astroid.node_classes.NodeNG))
+        for node in [module_tree] + subtrees:
+            for type_searched in types:
+                expected = list(ASTUtil.search_nodes(node, type_searched))
+                assert ASTUtil.search_indexed_nodes(node, type_searched) == expected
+        ASTUtil.clear_index()
+
+    def test_position_of_and_scope_range(self):
+        """Test whether the positions follow search_nodes and a scope range covers a subtree."""
+        module_tree = astroid.parse("def f(a):\n    return g(a)\n\nh()\n")
+        nodes = list(ASTUtil.search_nodes(module_tree, astroid.node_classes.NodeNG))
+        assert [ASTUtil.position_of(node) for node in nodes] == list(range(len(nodes)))
+        function = module_tree.body[0]
+        first, last = ASTUtil.scope_range(function)
+        subtree = list(ASTUtil.search_nodes(function, astroid.node_classes.NodeNG))
+        assert [node for node in nodes if first <= ASTUtil.position_of(node) <= last] == subtree
+        assert ASTUtil.scope_range(module_tree) == (0, len(nodes) - 1)
+        ASTUtil.clear_index()
+
+    def test_index_module_once(self, monkeypatch):
+        """Test whether a module is indexed once until the index is cleared."""
+        module_tree = astroid.parse("a = b()\nc = d(a)\nif a:\n    e = f()")
+        indexed = []
+        get_children = astroid.Module.get_children
+        monkeypatch.setattr(
+            astroid.Module, "get_children", lambda node: indexed.append(node) or get_children(node)
+        )
+        assert len(ASTUtil.search_indexed_nodes(module_tree, astroid.Call)) == 3
+        assert len(ASTUtil.search_indexed_nodes(module_tree, astroid.Assign)) == 3
+        assert len(ASTUtil.search_indexed_nodes(module_tree.body[1], astroid.Name)) == 2
+        assert ASTUtil.search_nodes_on_line(module_tree, 2) == [
+            module_tree.body[1].targets[0],
+            module_tree.body[1].value.func,
+            module_tree.body[1].value.args[0],
+            module_tree.body[1].value,
+            module_tree.body[1],
+        ]
+        assert ASTUtil.search_body_parent(module_tree.body[2].body[0].value) == module_tree.body[2]
+        assert len(indexed) == 1
+        ASTUtil.clear_index()
+        ASTUtil.search_indexed_nodes(module_tree, astroid.Call)
+        assert len(indexed) == 2
+        ASTUtil.clear_index()
+
     def test_get_source_code(self):
         """Test the get_source_code method."""
         source_code = "a = b.c(d)"
@@ -57,3 +150,116 @@ class TestAST:
         )
         node = module_tree.body[0].body[0]
         assert ASTUtil.search_body_parent(node) == module_tree.body[0]
+
+
+class TestAssignUtil:
+    """Class which tests the AssignUtil utils class."""
+
+    @staticmethod
+    def assigned(node: astroid.node_classes.NodeNG) -> list:
+        """Get the code of the values assigned to a name."""
+        return [value.as_string() for value in AssignUtil.assignment_values(node)]
+
+    def test_assignment_values(self):
+        """Test whether the values assigned in the module or passed to a parameter are found."""
+        module_tree = astroid.parse(
+            """
+            x = a()
+            y: int = b()
+
+            def f(x, z):
+                y = c()
+                return g(x, y, z)
+
+            f(d(), z=e())
+            x = h()
+            g(x)
+            """
+        )
+        x_node, y_node, z_node = module_tree.body[2].body[1].value.args
+        assert [value.as_string() for value in AssignUtil.assignment_values(x_node)] == ["d()"]
+        assert [value.as_string() for value in AssignUtil.assignment_values(y_node)] == ["b()"]
+        assert [value.as_string() for value in AssignUtil.assignment_values(z_node)] == ["e()"]
+        x_module_node = module_tree.body[5].value.args[0]
+        values = AssignUtil.assignment_values(x_module_node)
+        assert [value.as_string() for value in values] == ["a()", "h()"]
+        AssignUtil.clear_index()
+
+    def test_index_def_use_once(self, monkeypatch):
+        """Test whether the definitions and uses of a module are indexed once for all lookups."""
+        module_tree = astroid.parse("a = b()\nc = d(a)\ne = f(a, c)")
+        indexed = []
+        index_def_use = AssignUtil.index_def_use
+        monkeypatch.setattr(
+            AssignUtil,
+            "index_def_use",
+            lambda module: indexed.append(module) or index_def_use(module),
+        )
+        for name_node in module_tree.body[2].value.args:
+            assert len(AssignUtil.assignment_values(name_node)) == 1
+        assert indexed == [module_tree]
+        AssignUtil.clear_index()
+
+    def test_assignment_values_variadic_and_keyword_only(self):
+        """Test whether the values passed to '*args' and keyword-only parameters are found."""
+        module_tree = astroid.parse(
+            """
+            def f(a, *b, c):
+                return g(a, b, c)
+
+            f(x(), y(), z(), c=w())
+            f(*v, c=u())
+            """
+        )
+        a_node, b_node, c_node = module_tree.body[0].body[0].value.args
+        assert self.assigned(a_node) == ["x()"]
+        assert self.assigned(b_node) == ["y()", "z()"]
+        assert self.assigned(c_node) == ["w()", "u()"]
+        AssignUtil.clear_index()
+
+    def test_assignment_values_method(self):
+        """Test whether the values passed to a parameter of a method are found at its call sites."""
+        module_tree = astroid.parse(
+            """
+            class A:
+                def f(self, a):
+                    return g(a)
+
+                @staticmethod
+                def h(b):
+                    return g(b)
+
+                def i(self):
+                    self.f(v())
+                    self.f(a=w())
+                    A.h(x())
+
+            instance = A()
+            instance.f(y())
+            A().h(z())
+            A.f(instance, u())
+            other.f(t())
+            """
+        )
+        a_node = module_tree.body[0].body[0].body[0].value.args[0]
+        b_node = module_tree.body[0].body[1].body[0].value.args[0]
+        assert self.assigned(a_node) == ["v()", "w()", "y()", "u()"]
+        assert self.assigned(b_node) == ["x()", "z()"]
+        AssignUtil.clear_index()
+
+    def test_assignment_values_scope(self):
+        """Test whether the call sites are the non-recursive calls in the scope of a function."""
+        module_tree = astroid.parse(
+            """
+            def f():
+                def g(a):
+                    g(a)
+                    return h(a)
+                g(x())
+
+            g(y())
+            """
+        )
+        a_node = module_tree.body[0].body[0].body[1].value.args[0]
+        assert self.assigned(a_node) == ["x()"]
+        AssignUtil.clear_index()
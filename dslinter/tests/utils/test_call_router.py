@@ -0,0 +1,177 @@
+"""Class which tests the CallRouter utils class."""
+import ast
+import inspect
+import textwrap
+from typing import List, Set
+
+import astroid
+from pylint.checkers import BaseChecker
+from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
+
+import dslinter.plugin
+from dslinter.utils.call_router import CallRouter
+
+
+class FitChecker(BaseChecker):
+    """Checker which records the calls to 'fit' it handles."""
+
+    __implements__ = IAstroidChecker
+
+    name = "fit-checker"
+    msgs = {"W9901": ("Fit is called.", "fit-called", "Fit is called.")}
+    CALL_NAMES = frozenset(["fit"])
+
+    def __init__(self, linter: PyLinter = None):
+        super().__init__(linter)
+        self.calls = []
+
+    @CallRouter.routed
+    def visit_call(self, call: astroid.Call):
+        self.calls.append(call)
+
+
+class MergeChecker(FitChecker):
+    """Checker which records the calls to 'merge' it handles."""
+
+    name = "merge-checker"
+    msgs = {"W9902": ("Merge is called.", "merge-called", "Merge is called.")}
+    CALL_NAMES = frozenset(["merge"])
+
+
+class TestCallRouter:
+    """Class which tests the CallRouter utils class."""
+
+    CODE = "model.fit(x)\ndf.merge(y)\nprint(z)\nf()()\n"
+
+    def test_call_name(self):
+        """Test whether the name of the called function or method is found."""
+        calls = list(astroid.parse(self.CODE).nodes_of_class(astroid.Call))
+        names = [CallRouter.call_name(call) for call in calls]
+        assert names == ["fit", "merge", "print", None, "f"]
+
+    def test_routed(self):
+        """Test whether every call is routed once, to the checkers which handle its name."""
+        linter = PyLinter()
+        fit_checker = FitChecker(linter)
+        merge_checker = MergeChecker(linter)
+        linter.register_checker(fit_checker)
+        linter.register_checker(merge_checker)
+        CallRouter.clear()
+
+        calls = list(astroid.parse(self.CODE).nodes_of_class(astroid.Call))
+        for call in calls:
+            fit_checker.visit_call(call)
+            merge_checker.visit_call(call)
+        assert fit_checker.calls == [calls[0]]
+        assert merge_checker.calls == [calls[1]]
+
+        # The calls are routed by the first checker which sees them.
+        merge = astroid.extract_node("df.merge(y)")
+        fit_checker.visit_call(merge)
+        assert merge_checker.calls == [calls[1], merge]
+        CallRouter.clear()
+
+    def test_routed_disabled(self):
+        """Test whether calls are not routed to checkers without enabled messages."""
+        linter = PyLinter()
+        fit_checker = FitChecker(linter)
+        merge_checker = MergeChecker(linter)
+        linter.register_checker(fit_checker)
+        linter.register_checker(merge_checker)
+        linter.disable("merge-called")
+        CallRouter.clear()
+
+        merge = astroid.extract_node("df.merge(y)")
+        fit_checker.visit_call(merge)
+        assert merge_checker.calls == []
+        CallRouter.clear()
+
+    @staticmethod
+    def get_routed_checkers() -> List[BaseChecker]:
+        """Get the opened routed checkers of the plugin, in the order pylint calls them in."""
+        linter = PyLinter()
+        dslinter.plugin.register(linter)
+        checkers = [
+            checker
+            for checker in linter.get_checkers()
+            if hasattr(getattr(checker, "visit_call", None), "routed_visit_call")
+        ]
+        for checker in checkers:
+            checker.open()
+        return checkers
+
+    @staticmethod
+    def compared_names(checker: BaseChecker, method=None, argument: int = 0) -> Set[str]:
+        """
+        Get the names a method compares the name of the function called by its Call node against.
+
+        Methods of the checker which visit_call passes its node to are followed as well.
+
+        :param checker: Routed checker to get the names of.
+        :param method: Method of the checker, visit_call by default.
+        :param argument: Index of the argument which is the Call node, after self.
+        :return: Names in comparisons with node.func.name or node.func.attrname.
+        """
+        method = method or inspect.unwrap(checker.visit_call.routed_visit_call)
+        function = ast.parse(textwrap.dedent(inspect.getsource(method))).body[0]
+        node = function.args.args[argument + 1].arg
+        names = set()
+        for child in ast.walk(function):
+            if (
+                isinstance(child, ast.Call)
+                and isinstance(child.func, ast.Attribute)
+                and isinstance(child.func.value, ast.Name)
+                and child.func.value.id == "self"
+            ):
+                for i, arg in enumerate(child.args):
+                    if isinstance(arg, ast.Name) and arg.id == node:
+                        names |= TestCallRouter.compared_names(
+                            checker, getattr(type(checker), child.func.attr), i
+                        )
+            if not (
+                isinstance(child, ast.Compare)
+                and isinstance(child.left, ast.Attribute)
+                and child.left.attr in ("name", "attrname")
+                and isinstance(child.left.value, ast.Attribute)
+                and child.left.value.attr == "func"
+                and isinstance(child.left.value.value, ast.Name)
+                and child.left.value.value.id == node
+            ):
+                continue
+            for operator, comparator in zip(child.ops, child.comparators):
+                if isinstance(operator, ast.Eq):
+                    names.add(ast.literal_eval(comparator))
+                elif isinstance(comparator, ast.Attribute):
+                    names.update(getattr(checker, comparator.attr))
+                else:
+                    names.update(ast.literal_eval(comparator))
+        return names
+
+    def test_call_names_compared(self):
+        """Test whether the names every routed checker compares calls against are routed to it."""
+        checkers = self.get_routed_checkers()
+        assert checkers
+        for checker in checkers:
+            assert self.compared_names(checker) <= checker.CALL_NAMES, checker.name
+
+    def test_routed_shared_call(self, monkeypatch):
+        """Test whether a call is dispatched once to every routed checker which handles it."""
+        checkers = self.get_routed_checkers()
+        dispatched = []
+        for checker in checkers:
+            visit_call = checker.visit_call.__func__
+            monkeypatch.setattr(
+                visit_call,
+                "routed_visit_call",
+                lambda checker, call: dispatched.append((checker, call)),
+            )
+        CallRouter.clear()
+
+        call = astroid.extract_node("model.fit(x, y)")
+        for checker in checkers:
+            checker.visit_call(call)
+        expected = [(checker, call) for checker in checkers if "fit" in checker.CALL_NAMES]
+        assert len(expected) > 1
+        assert dispatched == expected
+        CallRouter.clear()
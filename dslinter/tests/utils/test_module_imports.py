@@ -0,0 +1,117 @@
+"""Class which tests the ModuleImports utils class."""
+import astroid
+
+from dslinter.utils.module_imports import ModuleImports
+
+
+class LogChecker:
+    """Checker which records the nodes it visits in modules which import torch."""
+
+    LIBRARIES = ("torch",)
+
+    def __init__(self):
+        self.visited = []
+
+    @ModuleImports.requires_libraries
+    def visit_call(self, node: astroid.Call):
+        self.visited.append(node)
+
+
+class TestModuleImports:
+    """Class which tests the ModuleImports utils class."""
+
+    def test_get(self):
+        """Test whether the imports of a module are found, also when they are nested."""
+        module = astroid.parse(
+            """
+            import numpy as np, torch.nn as nn
+            from sklearn.cluster import KMeans
+            from . import utils
+            try:
+                import tensorflow
+            except ImportError:
+                pass
+            def f():
+                if True:
+                    import pandas
+            """
+        )
+        expected = {"numpy", "torch.nn", "sklearn.cluster", "tensorflow", "pandas"}
+        assert ModuleImports.get(module) == expected
+        ModuleImports.clear()
+
+    def test_importable_modules(self, tmp_path):
+        """Test whether relative imports are resolved and packages and submodules are included."""
+        # Relative imports are resolved from the package of the file.
+        (tmp_path / "project").mkdir()
+        (tmp_path / "project" / "__init__.py").write_text("")
+        module = astroid.parse(
+            """
+            import torch.nn
+            from sklearn import cluster
+            from . import utils
+            from .models import train
+            """,
+            module_name="project.pipeline",
+            path=str(tmp_path / "project" / "pipeline.py"),
+        )
+        expected = {
+            "torch",
+            "torch.nn",
+            "sklearn",
+            "sklearn.cluster",
+            "project",
+            "project.utils",
+            "project.models",
+            "project.models.train",
+        }
+        assert ModuleImports.importable_modules(module) == expected
+
+    def test_resolve(self):
+        """Test whether the names bound by imports resolve to the names they are imported as."""
+        node = astroid.extract_node(
+            """
+            import torch.nn
+            import tensorflow as tf
+            from sklearn.cluster import KMeans as Clustering
+            from keras.optimizers import SGD
+            from torch.optim import SGD
+            from numpy import *
+            x = 1 #@
+            """
+        )
+        assert ModuleImports.resolve(node, "torch") == "torch"
+        assert ModuleImports.resolve(node, "tf") == "tensorflow"
+        assert ModuleImports.resolve(node, "Clustering") == "sklearn.cluster.KMeans"
+        assert ModuleImports.resolve(node, "KMeans") is None
+        assert ModuleImports.resolve(node, "SGD") == "torch.optim.SGD"
+        assert ModuleImports.from_library(node, "SGD", ("torch",))
+        assert not ModuleImports.from_library(node, "SGD", ("keras",))
+        # Names which are not bound by an import can come from the star-import.
+        assert ModuleImports.from_library(node, "array", ("numpy",))
+        assert ModuleImports.imports_package(node, "torch")
+        assert not ModuleImports.imports_package(node, "pandas")
+
+        # Nothing is kept for the next module.
+        other = astroid.extract_node("import pandas as pd\nx = 1 #@\n")
+        assert ModuleImports.resolve(other, "tf") is None
+        assert not ModuleImports.from_library(other, "array", ("numpy",))
+        ModuleImports.clear()
+
+    def test_imports_library(self):
+        """Test whether a library is imported when its name is part of an imported module's name."""
+        node = astroid.extract_node("import torchvision\nimport sklearn.cluster\nx = 1 #@\n")
+        assert ModuleImports.imports_library(node, ("torch",))
+        assert ModuleImports.imports_library(node, ("tensorflow", "sklearn"))
+        assert not ModuleImports.imports_library(node, ("tensorflow",))
+        ModuleImports.clear()
+
+    def test_requires_libraries(self):
+        """Test whether a decorated visit method does nothing in modules without the libraries."""
+        checker = LogChecker()
+        without_import = astroid.extract_node("torch.log(x) #@\n")
+        with_import = astroid.extract_node("import torch\ntorch.log(x) #@\n")
+        checker.visit_call(without_import)
+        checker.visit_call(with_import)
+        assert checker.visited == [with_import]
+        ModuleImports.clear()
@@ -0,0 +1,47 @@
+"""Class which tests the MypyBuild utils class."""
+import astroid
+
+from dslinter.utils.mypy_build import MypyBuild
+
+
+class TestMypyBuild:
+    """Class which tests the MypyBuild utils class."""
+
+    def test_infer_types(self):
+        """Test if the types of the expressions are read from the TypeMap."""
+        result = MypyBuild.infer_types({"__main__": (None, "a = ''\na.join(b)")})
+        assert result["__main__"][("Name", 2, 0, "a")] == '"builtins.str"'
+        assert result["__main__"][("Name", 2, 7, "b")] == '"Any"'
+        assert result["__main__"][("Call", 2, 0)] == '"builtins.str"'
+
+    def test_infer_types_multiple_modules(self):
+        """Test if the imports between modules in the same build are resolved."""
+        result = MypyBuild.infer_types(
+            {
+                "proj.a": ("proj/a.py", "def make() -> str: ..."),
+                "proj.b": ("proj/b.py", "from proj.a import make\ns = make()\ns.strip()"),
+            }
+        )
+        assert result["proj.b"][("Name", 3, 0, "s")] == '"builtins.str"'
+        assert ("Name", 3, 0, "s") not in result["proj.a"]
+
+    def test_infer_types_invalid_syntax(self):
+        """Test if nothing is inferred from code with invalid syntax."""
+        assert MypyBuild.infer_types({"__main__": (None, "print 'a'")}) is None
+
+    def test_infer_types_invalid_syntax_multiple_modules(self):
+        """Test if a module with invalid syntax is left out of a build with other modules."""
+        result = MypyBuild.infer_types(
+            {"valid": ("valid.py", "a = ''\na.join([])"), "invalid": ("invalid.py", "print 'a'")}
+        )
+        assert list(result) == ["valid"]
+        assert result["valid"][("Name", 2, 0, "a")] == '"builtins.str"'
+
+    def test_node_key(self):
+        """Test if the keys of astroid nodes are the keys of the matching mypy expressions."""
+        code = "a = b.c(d)[0]"
+        expression_types = MypyBuild.infer_types({"__main__": (None, code)})["__main__"]
+        subscript = astroid.extract_node(code).value
+        for node in (subscript, subscript.value, subscript.value.func, subscript.value.func.expr):
+            assert MypyBuild.node_key(node) in expression_types
+        assert MypyBuild.node_key(subscript.slice) is None
@@ -0,0 +1,150 @@
+"""Class which tests the ProjectTypeInference utils class."""
+import mypy.api
+import pytest
+from astroid import MANAGER
+
+from dslinter.utils.project_type_inference import ProjectTypeInference
+from dslinter.utils.type_inference import ModuleTypeInference, TypeInference
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+
+
+class TestProjectTypeInference:
+    """Class which tests the ProjectTypeInference utils class."""
+
+    @pytest.fixture(autouse=True)
+    def force(self, monkeypatch):
+        """Infer the types in all modules, also in the ones which do not import pandas."""
+        monkeypatch.setattr(ModuleTypeInference, "force", True)
+
+    def test_infer_project_types(self, tmp_path, monkeypatch):
+        """Test if the types of all modules are inferred with a single mypy run."""
+        package = tmp_path / "proj"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "helper.py").write_text(
+            "import pandas as pd\n\ndef make() -> pd.DataFrame:\n    return pd.DataFrame()\n"
+        )
+        (package / "use.py").write_text("from proj.helper import make\ndf = make()\ndf.dropna()\n")
+        mypy_runs = []
+        run = mypy.api.run
+
+        def counting_run(args):
+            mypy_runs.append(args)
+            return run(args)
+
+        monkeypatch.setattr(mypy.api, "run", counting_run)
+        ProjectTypeInference.infer_project_types(
+            [
+                ("proj", str(package / "__init__.py")),
+                ("proj.helper", str(package / "helper.py")),
+                ("proj.use", str(package / "use.py")),
+            ]
+        )
+        assert len(mypy_runs) == 1
+
+        # The prepared types are used without running mypy again.
+        monkeypatch.setattr(mypy.api, "run", None)
+        module = next(
+            module for module in ModuleTypeInference._prepared if module.name == "proj.use"
+        )
+        types = ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER)
+        assert types == {module.body[-1].value: '"pandas.core.frame.DataFrame"'}
+        ModuleTypeInference.clear()
+
+    def test_infer_project_types_invalid_syntax(self, tmp_path):
+        """Test if a module with invalid syntax does not stop the inference of the other modules."""
+        (tmp_path / "valid.py").write_text("a = ''\na.join([])\n")
+        (tmp_path / "invalid.py").write_text("a = ''\na.join([])\nprint 'a'\n")
+        ProjectTypeInference.infer_project_types(
+            [("valid", str(tmp_path / "valid.py")), ("invalid", str(tmp_path / "invalid.py"))]
+        )
+        assert [module.name for module in ModuleTypeInference._prepared] == ["valid"]
+        ModuleTypeInference.clear()
+
+    def test_infer_project_types_build(self, tmp_path):
+        """Test if the imports between the modules are resolved with the build backend."""
+        (tmp_path / "helper.py").write_text(
+            "import pandas as pd\n\ndef make() -> pd.DataFrame:\n    return pd.DataFrame()\n"
+        )
+        (tmp_path / "use.py").write_text("from helper import make\ndf = make()\ndf.dropna()\n")
+        TypeInference.backend = "build"
+        try:
+            ProjectTypeInference.infer_project_types(
+                [("helper", str(tmp_path / "helper.py")), ("use", str(tmp_path / "use.py"))]
+            )
+            module = next(
+                module for module in ModuleTypeInference._prepared if module.name == "use"
+            )
+            types = ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER)
+            assert types == {module.body[-1].value: '"pandas.core.frame.DataFrame"'}
+        finally:
+            TypeInference.backend = "mypy"
+            ModuleTypeInference.clear()
+
+    def test_infer_project_types_build_invalid_syntax(self, tmp_path):
+        """Test if a module with invalid syntax does not stop the build of the other modules."""
+        (tmp_path / "valid.py").write_text("a = ''\na.join([])\n")
+        (tmp_path / "invalid.py").write_text("a = ''\na.join([])\nprint 'a'\n")
+        TypeInference.backend = "build"
+        try:
+            ProjectTypeInference.infer_project_types(
+                [("valid", str(tmp_path / "valid.py")), ("invalid", str(tmp_path / "invalid.py"))]
+            )
+            assert [module.name for module in ModuleTypeInference._prepared] == ["valid"]
+        finally:
+            TypeInference.backend = "mypy"
+            ModuleTypeInference.clear()
+
+    @pytest.mark.parametrize("backend", ["mypy", "build"])
+    def test_infer_project_types_imported_module_changed(self, tmp_path, monkeypatch, backend):
+        """Test if the cached types of a module are not used when a module it imports changes."""
+        cache = tmp_path / "cache"
+        monkeypatch.setattr(TypeInference, "backend", backend)
+        monkeypatch.setattr(TypeInferenceCache, "enabled", True)
+        monkeypatch.setattr(TypeInferenceCache, "directory", str(cache))
+        monkeypatch.setattr(TypeInferenceCache, "_size", None)
+        name = "changed_" + backend
+        package = tmp_path / name
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "helper.py").write_text(
+            "import pandas as pd\n\ndef make() -> pd.DataFrame:\n    return pd.DataFrame()\n"
+        )
+        code = f"from {name}.helper import make\ndf = make()\ndf.dropna()\n"
+        (package / "use.py").write_text(code)
+        file_descriptors = [
+            (name, str(package / "__init__.py")),
+            (name + ".helper", str(package / "helper.py")),
+            (name + ".use", str(package / "use.py")),
+        ]
+
+        def infer_use_types() -> dict:
+            ProjectTypeInference.infer_project_types(file_descriptors)
+            module = next(
+                module for module in ModuleTypeInference._prepared if module.name == name + ".use"
+            )
+            types = ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER)
+            # The modules are parsed again in the next run.
+            ModuleTypeInference.clear()
+            for modname, _ in file_descriptors:
+                MANAGER.astroid_cache.pop(modname, None)
+            return types
+
+        try:
+            assert list(infer_use_types().values()) == ['"pandas.core.frame.DataFrame"']
+            assert list(infer_use_types().values()) == ['"pandas.core.frame.DataFrame"']
+            (package / "helper.py").write_text("def make() -> str:\n    return ''\n")
+            assert list(infer_use_types().values()) == ['"builtins.str"']
+        finally:
+            ModuleTypeInference.clear()
+
+    def test_infer_project_types_not_needed(self, tmp_path, monkeypatch):
+        """Test if modules which do not use pandas or pyspark are left out."""
+        monkeypatch.setattr(ModuleTypeInference, "force", False)
+        (tmp_path / "plain.py").write_text("a = ''\na.join([])\n")
+        (tmp_path / "frames.py").write_text("import pandas as pd\npd.DataFrame().abs()\n")
+        ProjectTypeInference.infer_project_types(
+            [("plain", str(tmp_path / "plain.py")), ("frames", str(tmp_path / "frames.py"))]
+        )
+        assert [module.name for module in ModuleTypeInference._prepared] == ["frames"]
+        ModuleTypeInference.clear()
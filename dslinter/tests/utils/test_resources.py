@@ -0,0 +1,54 @@
+"""Class which tests the Resources utils class."""
+import pytest
+
+from dslinter.utils.resources import Resources
+
+
+class TestResources:
+    """Class which tests the Resources utils class."""
+
+    LIBRARY = "scikitlearn"
+
+    def test_get_manifest(self):
+        """Test whether every learning algorithm of a library is in exactly one of its shards."""
+        manifest = Resources.get_manifest()
+        assert set(manifest) == {"pytorch", "scikitlearn", "tensorflow"}
+        assert Resources.get_library_imports(self.LIBRARY) == ["sklearn"]
+        shards = manifest[self.LIBRARY]["shards"]
+        assert shards["sklearn.ensemble"]["file"] == "sklearn.ensemble.pickle"
+        assert "RandomForestClassifier" in shards["sklearn.ensemble"]["classes"]
+        classes = [name for shard in shards.values() for name in shard["classes"]]
+        assert sorted(classes) == sorted(Resources.get_hyperparameters(self.LIBRARY))
+
+    def test_get_hyperparameter_registry(self):
+        """Test whether the registry indexes the classes and keywords of the knowledge base."""
+        hyperparameters = Resources.get_hyperparameters(self.LIBRARY)
+        registry = Resources.get_hyperparameter_registry(self.LIBRARY)
+        assert registry.classes == frozenset(hyperparameters)
+        assert len(registry) == len(hyperparameters)
+        assert "RandomForestClassifier" in registry and "NotAnEstimator" not in registry
+        assert registry["RandomForestClassifier"]["keywords"] == frozenset(
+            hyperparameters["RandomForestClassifier"]["keywords"]
+        )
+        positional = hyperparameters["RandomForestClassifier"]["positional"]
+        assert registry["RandomForestClassifier"]["positional"] == positional
+
+    def test_get_hyperparameter_registry_lazily(self, monkeypatch):
+        """Test if a shard is read once, when one of its classes is looked up, and read-only."""
+        monkeypatch.setattr(Resources, "_registries", {})
+        read = []
+        read_shard = Resources.read_shard
+        monkeypatch.setattr(
+            Resources, "read_shard", lambda file: read.append(file) or read_shard(file)
+        )
+        registry = Resources.get_hyperparameter_registry(self.LIBRARY)
+        assert Resources.get_hyperparameter_registry(self.LIBRARY) is registry
+        assert "RandomForestClassifier" in registry
+        assert read == []
+        assert registry["RandomForestClassifier"] is registry["RandomForestClassifier"]
+        assert registry["GradientBoostingClassifier"]["positional"] > 0
+        assert read == ["sklearn.ensemble.pickle"]
+        with pytest.raises(TypeError):
+            registry["RandomForestClassifier"]["positional"] = 0
+        with pytest.raises(KeyError):
+            registry["NotAnEstimator"]  # pylint: disable=pointless-statement
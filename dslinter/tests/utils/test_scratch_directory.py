@@ -0,0 +1,31 @@
+"""Class which tests the ScratchDirectory utils class."""
+import os
+
+from dslinter.utils.scratch_directory import ScratchDirectory
+
+
+class TestScratchDirectory:
+    """Class which tests the ScratchDirectory utils class."""
+
+    def test_get(self, tmp_path, monkeypatch):
+        """Test if the same private directory is returned within a process."""
+        monkeypatch.chdir(tmp_path)
+        path = ScratchDirectory.get()
+        assert os.path.isdir(path)
+        assert not path.startswith(str(tmp_path))
+        assert ScratchDirectory.get("mypy_cache") == os.path.join(path, "mypy_cache")
+        assert os.path.isdir(os.path.join(path, "mypy_cache"))
+
+    def test_get_forked(self, monkeypatch):
+        """Test if a forked process gets its own directory and keeps the one of its parent."""
+        path = ScratchDirectory.get()
+        # Restore the directory of this process afterwards, so it is still removed at exit.
+        monkeypatch.setattr(ScratchDirectory, "_path", path)
+        monkeypatch.setattr(ScratchDirectory, "_pid", os.getpid())
+        monkeypatch.setattr(os, "getpid", lambda: -1)
+        ScratchDirectory.remove()
+        assert os.path.isdir(path)
+        child_path = ScratchDirectory.get()
+        assert child_path != path
+        ScratchDirectory.remove()
+        assert not os.path.exists(child_path)
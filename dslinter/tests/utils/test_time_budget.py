@@ -0,0 +1,53 @@
+"""Class which tests the TimeBudget utils class."""
+import os
+import signal
+import time
+
+import pytest
+
+from dslinter.utils.time_budget import TimeBudget, TimeBudgetAborted, TimeBudgetExceeded
+
+
+def _fail():
+    raise ValueError("failed")
+
+
+def _unpicklable():
+    return lambda: None
+
+
+def _die():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+class TestTimeBudget:
+    """Class which tests the TimeBudget utils class."""
+
+    def test_call(self):
+        """Test if the result of a function which finishes within the budget is returned."""
+        assert TimeBudget.call(10, sorted, [3, 1, 2]) == [1, 2, 3]
+
+    def test_call_without_budget(self):
+        """Test if a function is called in this process when there is no budget."""
+        called = []
+        TimeBudget.call(0, called.append, 1)
+        assert called == [1]
+
+    def test_call_exception(self):
+        """Test if an exception raised by the function is raised again."""
+        with pytest.raises(ValueError, match="failed"):
+            TimeBudget.call(10, _fail)
+
+    def test_call_exceeded(self):
+        """Test if a function which does not finish within the budget is stopped."""
+        start = time.monotonic()
+        with pytest.raises(TimeBudgetExceeded):
+            TimeBudget.call(0.1, time.sleep, 30)
+        assert time.monotonic() - start < 10
+
+    def test_call_aborted(self):
+        """Test if a process which stops without a result is handled like an exceeded budget."""
+        with pytest.raises(TimeBudgetAborted):
+            TimeBudget.call(10, _die)
+        with pytest.raises(TimeBudgetExceeded):
+            TimeBudget.call(10, _unpicklable)
@@ -1,7 +1,15 @@
 """Class which tests the TypeInference utils class."""
+import os
+
+import time
+
 import astroid
+from astroid import MANAGER
 
-from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.mypy_daemon import MypyDaemon
+from dslinter.utils.time_budget import TimeBudget
+from dslinter.utils.type_inference import ModuleTypeInference, TypeInference
+from dslinter.utils.type_inference_prefetch import TypeInferencePrefetch
 
 
 class TestTypeInference:
@@ -43,6 +51,24 @@ class TestTypeInference:
         result = TypeInference.run_mypy("a: str = 5")
         assert result.splitlines()[1] == "Found 1 error in 1 file (checked 1 source file)"
 
+    def test_run_mypy_no_files_in_cwd(self, tmp_path, monkeypatch):
+        """Test if mypy runs without writing files to the current working directory."""
+        monkeypatch.chdir(tmp_path)
+        assert TypeInference.run_mypy("a = 5") == "Success: no issues found in 1 source file\n"
+        assert os.listdir(str(tmp_path)) == []
+
+    def test_run_mypy_daemon(self):
+        """Test if the daemon backend reports what a fresh mypy run does on consecutive modules."""
+        TypeInference.backend = "daemon"
+        try:
+            assert TypeInference.run_mypy("a = 5").startswith("Success: no issues found")
+            result = TypeInference.run_mypy("a: str = 5")
+            assert "error: Incompatible types in assignment" in result.splitlines()[0]
+            assert result.splitlines()[1].startswith("Found 1 error in 1 file")
+        finally:
+            TypeInference.backend = "mypy"
+            MypyDaemon.stop()
+
     def test_parse_mypy_result(self):
         """Test if the parse_mypy_result method returns the correct type."""
         mypy_result = "<string>:1: note: Revealed type is 'builtins.int'"
@@ -63,6 +89,44 @@ class TestTypeInference:
         result = TypeInference.combine_nodes_with_inferred_types(nodes, types)
         assert result == {nodes[0]: types[0][1]}
 
+    def test_combine_nodes_with_inferred_types_same_line(self):
+        """Test if multiple calls on the same line get the types of that line in order."""
+        module = astroid.parse("a.b(); c.d(); e.f()\ng.h()")
+        nodes = [expr.value for expr in module.body]
+        types = [(1, "a_type"), (1, "c_type"), (2, "g_type"), (1, "e_type")]
+        result = TypeInference.combine_nodes_with_inferred_types(nodes, types)
+        assert result == dict(zip(nodes, ["a_type", "c_type", "e_type", "g_type"]))
+
+    def test_combine_nodes_with_inferred_types_linear(self, monkeypatch):
+        """Test if the line of every node is determined only once, whatever the number of types."""
+        module = astroid.parse("\n".join(f"a{i} = b.c(); d.e()" for i in range(100)))
+        nodes = list(module.nodes_of_class(astroid.Call))
+        types = [(i // 2 + 1, f"type{i}") for i in range(len(nodes))]
+        calls = []
+        line_to_add_call = TypeInference.line_to_add_call
+        monkeypatch.setattr(
+            TypeInference,
+            "line_to_add_call",
+            lambda node: calls.append(node) or line_to_add_call(node),
+        )
+
+        result = TypeInference.combine_nodes_with_inferred_types(nodes, types)
+        assert len(calls) == len(nodes)
+        assert list(result.values()) == [type_inferred for _, type_inferred in types]
+
+    def test_combine_requests_with_inferred_types_same_line(self):
+        """Test if calls of multiple requests on the same line get their types in order."""
+        call = astroid.extract_node("a.b(c.d())")
+        inner_call = call.args[0]
+        requests = {"receiver": None, "argument": None}
+        revealed = [("receiver", inner_call), ("receiver", call), ("argument", call)]
+        types = [(1, "c_type"), (1, "a_type"), (1, "arg_type")]
+        result = TypeInference.combine_requests_with_inferred_types(requests, revealed, types)
+        assert result == {
+            "receiver": {inner_call: "c_type", call: "a_type"},
+            "argument": {call: "arg_type"},
+        }
+
     def test_add_reveal_type_calls_block(self):
         """Test if the reveal_type() call is added to the body of a block statement."""
         code = "y = ''\nfor x in y.join([]):\n\tpass"
@@ -79,3 +143,136 @@ class TestTypeInference:
     #     result = TypeInference.infer_types(module_node, node_type, lambda x: x.func.expr.name)
     #
     #     assert result == {module_node.body[1].iter: "builtins.str"}
+
+
+    def test_infer_types_build(self):
+        """Test if the build backend infers the types of multiple calls on the same line."""
+        TypeInference.backend = "build"
+        try:
+            module = astroid.parse(
+                "a = ''\nb = a.strip(); a.join([])\nfor c in a.split():\n    print(c)"
+            )
+            result = TypeInference.infer_types(
+                module, astroid.Call, lambda node: node.func.expr.name
+            )
+            assert result == {
+                module.body[1].value: '"builtins.str"',
+                module.body[2].value: '"builtins.str"',
+                module.body[3].iter: '"builtins.str"',
+            }
+        finally:
+            TypeInference.backend = "mypy"
+
+
+    def test_infer_requested_types_from_assignments(self):
+        """Test if DataFrames created by pandas functions are recognized from their assignments."""
+        code = "import pandas as pd\nfrom pandas import concat\n"
+        code += "a = pd.read_csv('a.csv')\nb = concat([a])\nc = []\na.abs()\nb.abs()\nc.copy()"
+        module = astroid.parse(code)
+        requests = {"receiver": (astroid.Call, lambda node: node.func.expr.name)}
+        types = TypeInference.infer_requested_types_from_assignments(module, requests)["receiver"]
+        assert types == {
+            module.body[-3].value: '"pandas.core.frame.DataFrame"',
+            module.body[-2].value: '"pandas.core.frame.DataFrame"',
+        }
+
+
+class TestModuleTypeInference:
+    """Class which tests the ModuleTypeInference utils class."""
+
+    def test_get_types_single_mypy_run(self, monkeypatch):
+        """Test if mypy runs once per module for all registered requests."""
+        mypy_runs = []
+        run_mypy = TypeInference.run_mypy
+
+        def counting_run_mypy(code):
+            mypy_runs.append(code)
+            return run_mypy(code)
+
+        monkeypatch.setattr(TypeInference, "run_mypy", counting_run_mypy)
+        monkeypatch.setattr(ModuleTypeInference, "force", True)
+        monkeypatch.setattr(ModuleTypeInference, "_requests", dict(ModuleTypeInference._requests))
+        ModuleTypeInference.register("call-argument", astroid.Call, lambda node: node.args[0].name)
+        module = astroid.parse("a = ''\nb = 5\na.join(b)")
+        call = module.body[-1].value
+
+        receiver_types = ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER)
+        argument_types = ModuleTypeInference.get_types(module, "call-argument")
+        assert len(mypy_runs) == 1
+        assert receiver_types == {call: '"builtins.str"'}
+        assert argument_types == {call: '"builtins.int"'}
+
+        ModuleTypeInference.get_types(
+            astroid.parse("a = ''\na.join([])"), ModuleTypeInference.CALL_RECEIVER
+        )
+        assert len(mypy_runs) == 2
+        ModuleTypeInference.clear()
+
+    def test_get_types_not_needed(self, monkeypatch):
+        """Test if mypy is not ran on a module which does not use pandas or pyspark."""
+        monkeypatch.setattr(TypeInference, "run_mypy", None)
+        module = astroid.parse("import numpy as np\na = np.zeros(1)\na.sum()")
+        assert ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER) == {}
+        ModuleTypeInference.clear()
+
+    def test_release(self, monkeypatch):
+        """Test if the prepared and cached types of a module are dropped after it is checked."""
+        monkeypatch.setattr(TypeInference, "run_mypy", None)
+        prepared = astroid.parse("import pandas as pd")
+        module = astroid.parse("import numpy as np")
+        ModuleTypeInference.prepare(prepared, {ModuleTypeInference.CALL_RECEIVER: {}})
+        ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER)
+        ModuleTypeInference.release(prepared)
+        ModuleTypeInference.release(module)
+        assert ModuleTypeInference._prepared == {}  # pylint: disable=protected-access
+        assert ModuleTypeInference._module is None  # pylint: disable=protected-access
+
+    def test_needs_inference(self, monkeypatch):
+        """Test if inference is needed for modules using pandas or pyspark, imported or not."""
+        needs_inference = ModuleTypeInference.needs_inference
+        assert needs_inference(astroid.parse("import pandas as pd"))
+        assert needs_inference(astroid.parse("def f():\n    import pandas.core.frame"))
+        assert needs_inference(astroid.parse("from pyspark.sql import DataFrame"))
+        assert needs_inference(astroid.parse("from utils import *\npd.concat([])"))
+        assert not needs_inference(astroid.parse("import numpy\nfrom .pandas import x"))
+        monkeypatch.setattr(ModuleTypeInference, "force", True)
+        assert needs_inference(astroid.parse("import numpy"))
+
+    def test_get_types_exceeded(self, monkeypatch):
+        """Test if types are guessed from assignments when mypy exceeds the time budget."""
+        if not TimeBudget.is_supported():
+            return
+        monkeypatch.setattr(TypeInference, "timeout", 0.1)
+        monkeypatch.setattr(TypeInference, "run_mypy", lambda code: time.sleep(30))
+        module = astroid.parse("import pandas as pd\ndf = pd.read_csv('data.csv')\ndf.abs()")
+        call = module.body[-1].value
+        assert ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER) == {
+            call: '"pandas.core.frame.DataFrame"'
+        }
+        assert ModuleTypeInference.pop_degraded(module)
+        assert not ModuleTypeInference.pop_degraded(module)
+        ModuleTypeInference.clear()
+
+    def test_get_types_prefetched(self, tmp_path, monkeypatch):
+        """Test if the types of a module come from the mypy run started before it is checked."""
+        if not TypeInferencePrefetch.is_supported():
+            return
+        path = tmp_path / "prefetched.py"
+        path.write_text("import pandas as pd\ndf = pd.DataFrame()\ndf.abs()\n")
+        (tmp_path / "numpy_only.py").write_text("import numpy as np\n")
+        files = [("prefetched", str(path)), ("numpy_only", str(tmp_path / "numpy_only.py"))]
+        assert [run[0] for run in ModuleTypeInference.upcoming_runs(files)] == [str(path)]
+
+        TypeInferencePrefetch.start(1, ModuleTypeInference.upcoming_runs(files))
+        try:
+            # mypy is ran by the forked process only.
+            monkeypatch.setattr(TypeInference, "run_mypy", None)
+            module = MANAGER.ast_from_file(str(path), "prefetched", source=True)
+            call = module.body[-1].value
+            types = ModuleTypeInference.get_types(module, ModuleTypeInference.CALL_RECEIVER)
+            assert types[call] == '"pandas.core.frame.DataFrame"'
+        finally:
+            TypeInferencePrefetch.stop()
+            MANAGER.astroid_cache.pop("prefetched", None)
+            MANAGER.astroid_cache.pop("numpy_only", None)
+            ModuleTypeInference.clear()
@@ -0,0 +1,104 @@
+"""Class which tests the TypeInferenceCache utils class."""
+import json
+import os
+
+import astroid
+import pytest
+from astroid import MANAGER
+
+from dslinter.utils.type_inference import TypeInference
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+
+
+class TestTypeInferenceCache:
+    """Class which tests the TypeInferenceCache utils class."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self, tmp_path):
+        """Enable the cache in a temporary directory for every test."""
+        directory = TypeInferenceCache.directory
+        max_size = TypeInferenceCache.max_size
+        TypeInferenceCache.configure(True, str(tmp_path), max_size)
+        yield
+        TypeInferenceCache.configure(False, directory, max_size)
+
+    def test_get_put(self):
+        """Test if the types stored for some code are returned for the same code only."""
+        assert TypeInferenceCache.get("a = 5; reveal_type(a)") is None
+        TypeInferenceCache.put("a = 5; reveal_type(a)", [(1, '"builtins.int"')])
+        assert TypeInferenceCache.get("a = 5; reveal_type(a)") == [(1, '"builtins.int"')]
+        assert TypeInferenceCache.get("a = 6; reveal_type(a)") is None
+        assert TypeInferenceCache.get("a = 5; reveal_type(a)", "project:a") is None
+
+    def test_disabled(self, tmp_path):
+        """Test if nothing is stored when the cache is disabled."""
+        TypeInferenceCache.configure(False, str(tmp_path), TypeInferenceCache.max_size)
+        TypeInferenceCache.put("a = 5; reveal_type(a)", [(1, '"builtins.int"')])
+        assert TypeInferenceCache.get("a = 5; reveal_type(a)") is None
+        assert os.listdir(str(tmp_path)) == []
+
+    def test_environment(self, monkeypatch):
+        """Test if an entry is not used anymore when the versions of mypy or the stubs change."""
+        TypeInferenceCache.put("a = 5; reveal_type(a)", [(1, '"builtins.int"')])
+        monkeypatch.setattr(TypeInferenceCache, "_environment", "mypy==0.0")
+        assert TypeInferenceCache.get("a = 5; reveal_type(a)") is None
+
+    def test_evict_least_recently_used(self, tmp_path):
+        """Test if the least recently used entries are removed when the cache is too large."""
+        types = [(1, '"builtins.int"')]
+        TypeInferenceCache.configure(True, str(tmp_path), 3 * len(json.dumps(types)))
+        for i in range(3):
+            TypeInferenceCache.put(str(i), types)
+        for i, path in enumerate(TypeInferenceCache._entry_path(str(i), "") for i in range(3)):
+            os.utime(path, (i, i))
+        TypeInferenceCache.get("0")
+        TypeInferenceCache.put("3", types)
+        cached = [TypeInferenceCache.get(str(i)) is not None for i in range(4)]
+        assert cached == [True, False, True, True]
+
+    def test_infer_types_cached(self, monkeypatch):
+        """Test if mypy is not ran again for code which is type checked before."""
+        mypy_runs = []
+        run_mypy = TypeInference.run_mypy
+
+        def counting_run_mypy(code):
+            mypy_runs.append(code)
+            return run_mypy(code)
+
+        monkeypatch.setattr(TypeInference, "run_mypy", counting_run_mypy)
+        for _ in range(2):
+            module = astroid.parse("a = ''\na.join([])")
+            result = TypeInference.infer_types(
+                module, astroid.Call, lambda node: node.func.expr.name
+            )
+            assert result == {module.body[1].value: '"builtins.str"'}
+        assert len(mypy_runs) == 1
+
+    @pytest.mark.parametrize("backend", ["mypy", "build"])
+    def test_infer_types_imported_module_changed(self, tmp_path, monkeypatch, backend):
+        """Test if the cached types of a module are not used when a module it imports changes."""
+        # mypy finds the local modules in the working directory.
+        directory = tmp_path / "project"
+        directory.mkdir()
+        monkeypatch.chdir(directory)
+        monkeypatch.setattr(TypeInference, "backend", backend)
+        name = "changed_" + backend
+        helper = directory / f"{name}_helper.py"
+        helper.write_text(
+            "import pandas as pd\n\ndef make() -> pd.DataFrame:\n    return pd.DataFrame()\n"
+        )
+        path = directory / f"{name}.py"
+        path.write_text(f"from {name}_helper import make\ndf = make()\ndf.dropna()\n")
+
+        def infer_types() -> list:
+            # The modules are parsed again in the next run.
+            for modname in (name, name + "_helper"):
+                MANAGER.astroid_cache.pop(modname, None)
+            module = MANAGER.ast_from_file(str(path), name, source=True)
+            expr = lambda node: node.func.expr.name
+            return list(TypeInference.infer_types(module, astroid.Call, expr).values())
+
+        assert infer_types() == ['"pandas.core.frame.DataFrame"']
+        assert infer_types() == ['"pandas.core.frame.DataFrame"']
+        helper.write_text("def make() -> str:\n    return ''\n")
+        assert infer_types() == ['"builtins.str"']
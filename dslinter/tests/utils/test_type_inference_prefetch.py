@@ -0,0 +1,62 @@
+"""Class which tests the TypeInferencePrefetch utils class."""
+import os
+
+import pytest
+
+from dslinter.utils.time_budget import TimeBudgetExceeded
+from dslinter.utils.type_inference_prefetch import TypeInferencePrefetch
+
+
+def run_in_process(code: str) -> tuple:
+    """Return the code and the process it is ran in."""
+    return code, os.getpid()
+
+
+def exceed_budget(code: str):
+    """Raise like mypy does when it exceeds the time budget."""
+    raise TimeBudgetExceeded(code)
+
+
+class TestTypeInferencePrefetch:
+    """Class which tests the TypeInferencePrefetch utils class."""
+
+    def test_result_not_started(self):
+        """Test whether the function is called in this process when nothing is prefetched."""
+        assert TypeInferencePrefetch.result("a.py", run_in_process, "a") == ("a", os.getpid())
+        assert TypeInferencePrefetch.result(None, run_in_process, "a") == ("a", os.getpid())
+
+    def test_result(self):
+        """Test whether the runs are submitted in a window and used by the modules they match."""
+        if not TypeInferencePrefetch.is_supported():
+            return
+        runs = [(f"{name}.py", run_in_process, name) for name in "abcde"]
+        taken = []
+        TypeInferencePrefetch.start(1, (taken.append(run) or run for run in runs))
+        try:
+            assert len(taken) == TypeInferencePrefetch.RUNS_PER_PROCESS
+
+            code, pid = TypeInferencePrefetch.result("a.py", run_in_process, "a")
+            assert code == "a" and pid != os.getpid()
+            TypeInferencePrefetch.release("a.py")
+            assert len(taken) == TypeInferencePrefetch.RUNS_PER_PROCESS + 1
+
+            # The code of the module changed after its run is submitted, so its result is not used.
+            result = TypeInferencePrefetch.result("b.py", run_in_process, "changed")
+            assert result == ("changed", os.getpid())
+            # Runs of modules which are checked without running mypy are dropped.
+            TypeInferencePrefetch.release("c.py")
+            assert len(taken) == len(runs)
+        finally:
+            TypeInferencePrefetch.stop()
+        assert TypeInferencePrefetch.result("d.py", run_in_process, "d") == ("d", os.getpid())
+
+    def test_result_exceeded(self):
+        """Test whether a run which exceeds the time budget raises in this process."""
+        if not TypeInferencePrefetch.is_supported():
+            return
+        TypeInferencePrefetch.start(1, [("a.py", exceed_budget, "a")])
+        try:
+            with pytest.raises(TimeBudgetExceeded):
+                TypeInferencePrefetch.result("a.py", exceed_budget, "a")
+        finally:
+            TypeInferencePrefetch.stop()
@@ -0,0 +1,107 @@
+"""Utility module for the facts about the assignments in a module."""
+from typing import Callable, Dict, List, Optional
+
+import astroid
+
+from dslinter.utils.ast import ASTUtil
+
+
+class AssignmentFacts:
+    """
+    Utility class for the facts about the assignments in a module.
+
+    The Assign nodes of a module are walked once. For every variable, the origins of the values
+    assigned to it are recorded in order: the dotted name of the called function, e.g.,
+    'pd.read_csv', or 'const'. The views used by the checkers, e.g., the most recent origin of every
+    variable, are derived from these facts when they are first requested and shared until another
+    module is requested.
+    """
+
+    # Origin of a constant value.
+    CONST = "const"
+
+    _module: Optional[astroid.Module] = None
+    _facts: Dict[str, List[str]] = {}
+    _views: Dict[str, Dict] = {}
+
+    @staticmethod
+    def get(module: astroid.Module) -> Dict[str, List[str]]:
+        """
+        Get the ordered origins of the values assigned to every variable in a module.
+
+        :param module: Module to get the facts of.
+        :return: Dict with the variable names as keys and the origins of their assigned values as
+            values.
+        """
+        if module is not AssignmentFacts._module:
+            AssignmentFacts._module = module
+            AssignmentFacts._facts = AssignmentFacts._collect(module)
+            AssignmentFacts._views = {}
+        return AssignmentFacts._facts
+
+    @staticmethod
+    def view(
+        module: astroid.Module, name: str, derive: Callable[[Dict[str, List[str]]], Dict]
+    ) -> Dict:
+        """
+        Get a view on the facts of a module, deriving it when it is requested for the first time.
+
+        :param module: Module to get the view of.
+        :param name: Name of the view.
+        :param derive: Function which derives the view from the facts.
+        :return: The view, which is shared and must not be changed.
+        """
+        facts = AssignmentFacts.get(module)
+        if name not in AssignmentFacts._views:
+            AssignmentFacts._views[name] = derive(facts)
+        return AssignmentFacts._views[name]
+
+    @staticmethod
+    def call_origin(call: astroid.Call) -> str:
+        """
+        Get the dotted name of the function called by a Call node, e.g., 'tf.random.uniform'.
+
+        :param call: Call node to get the origin of.
+        :return: Dotted name, which is incomplete or empty when the function is not a chain of
+            names.
+        """
+        func = call.func
+        full_type = ""
+        if hasattr(func, "attrname"):
+            full_type = "." + func.attrname + full_type
+        while hasattr(func, "expr"):
+            func = func.expr
+            if hasattr(func, "attrname"):
+                full_type = "." + func.attrname + full_type
+        if hasattr(func, "name"):
+            full_type = func.name + full_type
+        return full_type
+
+    @staticmethod
+    def clear():
+        """Drop the facts and views of the last module."""
+        AssignmentFacts._module = None
+        AssignmentFacts._facts = {}
+        AssignmentFacts._views = {}
+
+    @staticmethod
+    def _collect(module: astroid.Module) -> Dict[str, List[str]]:
+        """
+        Walk the Assign nodes of a module once and record the origins of the values of the names.
+
+        :param module: Module to walk.
+        :return: Dict with the variable names as keys and the origins of their assigned values as
+            values.
+        """
+        facts: Dict[str, List[str]] = {}
+        for node in ASTUtil.search_indexed_nodes(module, astroid.Assign):
+            if isinstance(node.value, astroid.Const):
+                origin = AssignmentFacts.CONST
+            elif isinstance(node.value, astroid.Call):
+                origin = AssignmentFacts.call_origin(node.value)
+            else:
+                continue
+            for target in node.targets:
+                if hasattr(target, "name"):
+                    facts.setdefault(target.name, []).append(origin)
+        return facts
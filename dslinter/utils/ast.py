@@ -1,27 +1,175 @@
 """Utility module for working with the Abstract Syntax Tree (AST)."""
-from typing import List, Optional, Tuple, Union
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import astroid
 
 
 class ASTUtil:
-    """Utility class for working with the Abstract Syntax Tree (AST)."""
+    """
+    Utility class for working with the Abstract Syntax Tree (AST).
+
+    The nodes of the module which is checked are indexed in one walk over its tree: per node class
+    in the order of search_nodes, per line number, and with the body parent of every node. The index
+    is kept until another module is indexed or it is cleared when the module is left.
+    """
+
+    _index_module: Optional[astroid.Module] = None
+    # Nodes per node class, children before their parent like search_nodes.
+    _nodes_by_class: Dict[type, List[astroid.node_classes.NodeNG]] = {}
+    # Position of every node in that order and the position of the first node in its subtree.
+    _positions: Dict[astroid.node_classes.NodeNG, int] = {}
+    _first_positions: Dict[astroid.node_classes.NodeNG, int] = {}
+    _nodes_by_line: Dict[int, List[astroid.node_classes.NodeNG]] = {}
+    _body_parents: Dict[astroid.node_classes.NodeNG, astroid.node_classes.NodeNG] = {}
+    # Nodes found per searched type with their positions, for every type which has been searched.
+    _found: Dict[
+        Union[type, Tuple[type, ...]], Tuple[List[astroid.node_classes.NodeNG], List[int]]
+    ] = {}
 
     # pylint: disable = line-too-long
     @staticmethod
-    def search_nodes(node: astroid.node_classes.NodeNG, type_searched: type) -> List[astroid.node_classes.NodeNG]:
+    def search_nodes(
+        node: astroid.node_classes.NodeNG, type_searched: Union[type, Tuple[type, ...]]
+    ) -> Iterator[astroid.node_classes.NodeNG]:
         """
-        Search recursively for all nodes of a certain type.
+        Search for all nodes of a certain type, including the node itself.
+
+        The tree is walked with a stack instead of recursion, so deeply nested code does not exceed
+        the recursion limit. The nodes are yielded while walking, children before their parent, so
+        the search stops as soon as the caller stops iterating.
 
         :param node: Node which is visited.
-        :param type_searched: Type of node where is searched for.
+        :param type_searched: Type of node where is searched for, or a Tuple of types.
+        :return: Iterator over the nodes found.
+        """
+        stack = [(node, iter(node.get_children()))]
+        while stack:
+            current, children = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                stack.append((child, iter(child.get_children())))
+            else:
+                stack.pop()
+                if isinstance(current, type_searched):
+                    yield current
+
+    @staticmethod
+    def index_module(module: astroid.Module):
         """
-        found: List = []
-        for child in node.get_children():
-            found += ASTUtil.search_nodes(child, type_searched)
+        Index the nodes of a module in one walk over its tree, unless it is indexed already.
 
-        if isinstance(node, type_searched):
-            found.append(node)
-        return found
+        :param module: Module to index.
+        """
+        if module is ASTUtil._index_module:
+            return
+        nodes_by_class: Dict[type, List[astroid.node_classes.NodeNG]] = {}
+        positions = {}
+        first_positions = {}
+        nodes_by_line: Dict[int, List[astroid.node_classes.NodeNG]] = {}
+        body_parents = {module: module}
+        stack = [(module, iter(module.get_children()))]
+        while stack:
+            current, children = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                first_positions[child] = len(positions)
+                body_parents[child] = child if hasattr(child, "body") else body_parents[current]
+                stack.append((child, iter(child.get_children())))
+            else:
+                stack.pop()
+                positions[current] = len(positions)
+                nodes_by_class.setdefault(type(current), []).append(current)
+                if current.lineno is not None:
+                    nodes_by_line.setdefault(current.lineno, []).append(current)
+        first_positions[module] = 0
+
+        ASTUtil._index_module = module
+        ASTUtil._nodes_by_class = nodes_by_class
+        ASTUtil._positions = positions
+        ASTUtil._first_positions = first_positions
+        ASTUtil._nodes_by_line = nodes_by_line
+        ASTUtil._body_parents = body_parents
+        ASTUtil._found = {}
+
+    @staticmethod
+    def clear_index():
+        """Drop the index of the last module, e.g., when it is left."""
+        ASTUtil._index_module = None
+        ASTUtil._nodes_by_class = {}
+        ASTUtil._positions = {}
+        ASTUtil._first_positions = {}
+        ASTUtil._nodes_by_line = {}
+        ASTUtil._body_parents = {}
+        ASTUtil._found = {}
+
+    @staticmethod
+    def search_indexed_nodes(
+        node: astroid.node_classes.NodeNG, type_searched: Union[type, Tuple[type, ...]]
+    ) -> List[astroid.node_classes.NodeNG]:
+        """
+        Search for all nodes of a type in the index of the module of a node, indexed when needed.
+
+        The result is the same as the one of search_nodes, but only the first search for a type
+        walks over the index. Other searches take time in the order of the number of nodes found.
+
+        :param node: Node to search in, including the node itself.
+        :param type_searched: Type of node where is searched for, or a Tuple of types.
+        :return: List of the nodes found, children before their parent.
+        """
+        if node not in ASTUtil._positions:
+            ASTUtil.index_module(node.root())
+        if type_searched not in ASTUtil._found:
+            found = []
+            for node_class, nodes in ASTUtil._nodes_by_class.items():
+                if issubclass(node_class, type_searched):
+                    found += nodes
+            found.sort(key=ASTUtil._positions.__getitem__)
+            positions = [ASTUtil._positions[found_node] for found_node in found]
+            ASTUtil._found[type_searched] = (found, positions)
+        found, positions = ASTUtil._found[type_searched]
+        if node is ASTUtil._index_module:
+            return list(found)
+        start = bisect_left(positions, ASTUtil._first_positions[node])
+        end = bisect_right(positions, ASTUtil._positions[node])
+        return found[start:end]
+
+    @staticmethod
+    def position_of(node: astroid.node_classes.NodeNG) -> int:
+        """
+        Get the position of a node in the index of its module, indexing the module when needed.
+
+        :param node: Node to get the position of.
+        :return: Position of the node, children come before their parent like in search_nodes.
+        """
+        if node not in ASTUtil._positions:
+            ASTUtil.index_module(node.root())
+        return ASTUtil._positions[node]
+
+    @staticmethod
+    def scope_range(node: astroid.node_classes.NodeNG) -> Tuple[int, int]:
+        """
+        Get the positions of the nodes in the subtree of a node, indexing its module when needed.
+
+        :param node: Node to get the range of.
+        :return: Tuple with the first and the last position, which is the position of the node.
+        """
+        if node not in ASTUtil._positions:
+            ASTUtil.index_module(node.root())
+        return ASTUtil._first_positions[node], ASTUtil._positions[node]
+
+    @staticmethod
+    def search_nodes_on_line(
+        module: astroid.Module, line: int
+    ) -> List[astroid.node_classes.NodeNG]:
+        """
+        Search for all nodes which start on a line of a module, indexing it when needed.
+
+        :param module: Module to search in.
+        :param line: Line number.
+        :return: List of the nodes found, children before their parent.
+        """
+        ASTUtil.index_module(module)
+        return list(ASTUtil._nodes_by_line.get(line, []))
 
     @staticmethod
     def get_source_code(node: astroid.Module) -> str:
@@ -52,6 +200,8 @@ class ASTUtil:
         :param node: Node to search the parent of the body block of.
         :return: Parent node of the body block.
         """
+        if node in ASTUtil._body_parents:
+            return ASTUtil._body_parents[node]
         if hasattr(node, "body"):
             return node
         return ASTUtil.search_body_parent(node.parent)
@@ -99,7 +249,35 @@ class ASTUtil:
 
 
 class AssignUtil:
-    """Utility class for working with (Ann)Assign nodes."""
+    """
+    Utility class for working with (Ann)Assign nodes.
+
+    The definitions and uses of names in the module which is checked are indexed once: the values
+    assigned to every name in the body of the module, the parameters of every function, the
+    innermost function every Name node is part of and the calls per function name and per attribute
+    name. The index is kept until another module is indexed or it is cleared when the module is
+    left.
+    """
+
+    # Kinds of parameters.
+    POSITIONAL = "positional"
+    VARARG = "vararg"
+    KEYWORD_ONLY = "keyword-only"
+
+    _def_use_module: Optional[astroid.Module] = None
+    _module_values: Dict[str, List[astroid.node_classes.NodeNG]] = {}
+    # Kind and position of every parameter per function. The position of a variadic parameter is the
+    # number of positional parameters before it.
+    _parameters: Dict[astroid.FunctionDef, Dict[str, Tuple[str, int]]] = {}
+    _enclosing_functions: Dict[astroid.Name, Optional[astroid.FunctionDef]] = {}
+    # Calls to a name and calls to an attribute, with their positions in the index of ASTUtil.
+    _calls_by_name: Dict[str, Tuple[List[astroid.Call], List[int]]] = {}
+    _calls_by_attribute: Dict[str, List[Tuple[astroid.Call, int]]] = {}
+    # First and last position of the functions and the scopes they are defined in.
+    _scope_ranges: Dict[astroid.node_classes.NodeNG, Tuple[int, int]] = {}
+    # Calls to a function with the number of arguments which are passed implicitly, e.g., 'self',
+    # and their positions.
+    _call_sites: Dict[astroid.FunctionDef, List[Tuple[astroid.Call, int, int]]] = {}
 
     @staticmethod
     def is_target(name: str, assign: Union[astroid.Assign, astroid.AnnAssign]):
@@ -127,77 +305,236 @@ class AssignUtil:
         :return: Value nodes which are assigned to the name from the Name node.
         """
         name = name_node.name
-        function_with_arg, idx = AssignUtil._name_is_arg_from_function(name, name_node)
-        if function_with_arg is not None:
-            return AssignUtil._function_arg_values(function_with_arg, name, idx)
+        if name_node not in AssignUtil._enclosing_functions:
+            AssignUtil.index_def_use(name_node.root())
+        if name_node in AssignUtil._enclosing_functions:
+            function = AssignUtil._enclosing_functions[name_node]
+        else:
+            function = AssignUtil._search_enclosing_function(name_node)
+        if function is not None and name in AssignUtil._parameters.get(function, {}):
+            kind, position = AssignUtil._parameters[function][name]
+            return AssignUtil._function_arg_values(function, name, kind, position)
 
-        return AssignUtil._assign_values_in_body_of_parents(name, name_node)
+        # Only the assignments in the body of the module are taken into account.
+        return list(AssignUtil._module_values.get(name, []))
 
     @staticmethod
-    def _assign_values_in_body_of_parents(
-        name: str, node: astroid.node_classes.NodeNG
-    ) -> List[astroid.node_classes.NodeNG]:
+    def index_def_use(module: astroid.Module):
         """
-        Search for the value of the assignment to the name of a Name node in body of parents.
+        Index the definitions and uses of the names in a module, unless it is indexed already.
 
-        :param name: Name to look for.
-        :param node: Node of which is searched in the body of its parents.
-        :return: The value node of the assignment or None when it is not found.
+        :param module: Module to index.
         """
-        values = []
-        body_block = ASTUtil.search_body(node)
-        for child in body_block:
-            if isinstance(child, (astroid.AnnAssign, astroid.Assign)) \
-                    and AssignUtil.is_target(name, child):
-                values.append(child.value)
-        if hasattr(node, "parent") and node.parent is not None:
-            return AssignUtil._assign_values_in_body_of_parents(name, node.parent)
-        return values
+        if module is AssignUtil._def_use_module:
+            return
+        module_values: Dict[str, List[astroid.node_classes.NodeNG]] = {}
+        for child in getattr(module, "body", []):
+            if isinstance(child, (astroid.AnnAssign, astroid.Assign)):
+                targets = child.targets if isinstance(child, astroid.Assign) else [child.target]
+                for name in {target.name for target in targets if hasattr(target, "name")}:
+                    module_values.setdefault(name, []).append(child.value)
+
+        parameters = {}
+        enclosing_functions: Dict[astroid.Name, Optional[astroid.FunctionDef]] = {}
+        scope_ranges = {}
+        # Functions are found before the functions they are in, so a Name gets the innermost one.
+        for function in ASTUtil.search_indexed_nodes(module, astroid.FunctionDef):
+            parameters[function] = AssignUtil._parameters_of(function)
+            for name_node in ASTUtil.search_indexed_nodes(function, astroid.Name):
+                enclosing_functions.setdefault(name_node, function)
+            for scope in (function, function.parent):
+                scope_ranges[scope] = ASTUtil.scope_range(scope)
+        for name_node in ASTUtil.search_indexed_nodes(module, astroid.Name):
+            enclosing_functions.setdefault(name_node, None)
+
+        AssignUtil._def_use_module = module
+        AssignUtil._module_values = module_values
+        AssignUtil._parameters = parameters
+        AssignUtil._enclosing_functions = enclosing_functions
+        AssignUtil._index_calls(module)
+        AssignUtil._scope_ranges = scope_ranges
+        AssignUtil._call_sites = {}
 
     @staticmethod
-    def _name_is_arg_from_function(
-        name: str, node: astroid.node_classes.NodeNG
-    ) -> Tuple[Optional[astroid.FunctionDef], int]:
+    def _index_calls(module: astroid.Module):
         """
-        Get the FunctionDef the name is part of (if it exists).
+        Index the calls in a module per name of the function or the attribute which is called.
 
-        :param name: Name to look for.
-        :param node: Node to look for FunctionDef nodes in.
-        :return: FunctionDef with arg 'name' or None when not found and the position of the arg.
+        :param module: Module to index.
         """
-        if isinstance(node, astroid.FunctionDef):
-            for idx, arg in enumerate(node.args.args):
-                if hasattr(arg, "name") and arg.name == name:
-                    return node, idx
-            return None, -1
-        if hasattr(node, "parent"):
-            return AssignUtil._name_is_arg_from_function(name, node.parent)
-        return None, -1
+        calls_by_name: Dict[str, Tuple[List[astroid.Call], List[int]]] = {}
+        calls_by_attribute: Dict[str, List[Tuple[astroid.Call, int]]] = {}
+        for call in ASTUtil.search_indexed_nodes(module, astroid.Call):
+            if hasattr(call.func, "name"):
+                calls, positions = calls_by_name.setdefault(call.func.name, ([], []))
+                calls.append(call)
+                positions.append(ASTUtil.position_of(call))
+            elif isinstance(call.func, astroid.Attribute):
+                calls = calls_by_attribute.setdefault(call.func.attrname, [])
+                calls.append((call, ASTUtil.position_of(call)))
+        AssignUtil._calls_by_name = calls_by_name
+        AssignUtil._calls_by_attribute = calls_by_attribute
+
+    @staticmethod
+    def clear_index():
+        """Drop the definitions and uses of the last module, e.g., when it is left."""
+        AssignUtil._def_use_module = None
+        AssignUtil._module_values = {}
+        AssignUtil._parameters = {}
+        AssignUtil._enclosing_functions = {}
+        AssignUtil._calls_by_name = {}
+        AssignUtil._calls_by_attribute = {}
+        AssignUtil._scope_ranges = {}
+        AssignUtil._call_sites = {}
+
+    @staticmethod
+    def _parameters_of(function: astroid.FunctionDef) -> Dict[str, Tuple[str, int]]:
+        """
+        Get the kinds and positions of the parameters of a function, except for '**kwargs'.
+
+        :param function: FunctionDef node to get the parameters of.
+        :return: Dict with the parameter names as keys and (kind, position) Tuples as values.
+        """
+        parameters: Dict[str, Tuple[str, int]] = {}
+        posonlyargs = getattr(function.args, "posonlyargs", None) or []
+        positional = posonlyargs + (function.args.args or [])
+        for idx, arg in enumerate(positional):
+            if hasattr(arg, "name"):
+                parameters.setdefault(arg.name, (AssignUtil.POSITIONAL, idx))
+        if function.args.vararg is not None:
+            parameters.setdefault(function.args.vararg, (AssignUtil.VARARG, len(positional)))
+        for arg in function.args.kwonlyargs or []:
+            parameters.setdefault(arg.name, (AssignUtil.KEYWORD_ONLY, -1))
+        return parameters
+
+    @staticmethod
+    def _search_enclosing_function(
+        node: astroid.node_classes.NodeNG,
+    ) -> Optional[astroid.FunctionDef]:
+        """
+        Search the innermost FunctionDef a node is part of.
+
+        :param node: Node to search the function of.
+        :return: FunctionDef or None when the node is not part of a function.
+        """
+        while node is not None and not isinstance(node, astroid.FunctionDef):
+            node = getattr(node, "parent", None)
+        return node
 
     # noinspection PyUnresolvedReferences
     @staticmethod
-    def _function_arg_values(node: astroid.FunctionDef, arg_name: str, arg_position: int):
+    def _function_arg_values(
+        function: astroid.FunctionDef, arg_name: str, kind: str, position: int
+    ):
         """
         Search the values a certain argument of a function gets assigned.
 
-        Calls to the function will be searched for in the parent of the FunctionDef node.
-
-        :param node: FunctionDef node which contains the argument.
+        :param function: FunctionDef node which contains the argument.
         :param arg_name: Name of the argument.
-        :param arg_position: Position of the argument.
-        :return: All values this argument gets assigned.
+        :param kind: Kind of the argument.
+        :param position: Position of the argument.
+        :return: All values this argument gets assigned, all extra positional arguments for '*args'.
         """
         values = []
-        for call_node in ASTUtil.search_nodes(node.parent, astroid.Call):
-            if hasattr(call_node.func, "name") and call_node.func.name == node.name:
-                if call_node.args is not None and len(call_node.args) > arg_position:
-                    values.append(call_node.args[arg_position])
-                if call_node.keywords is not None:
-                    keyword = ASTUtil.retrieve_keyword_from_list(call_node.keywords, arg_name)
-                    if keyword is not None:
-                        values.append(keyword.value)
+        first, last = AssignUtil._scope_ranges[function]
+        for call_node, implicit, call_position in AssignUtil._function_call_sites(function):
+            call_values = []
+            args = call_node.args or []
+            index = position - implicit
+            if kind == AssignUtil.VARARG:
+                call_values = [
+                    arg for arg in args[max(index, 0) :] if not isinstance(arg, astroid.Starred)
+                ]
+            elif kind == AssignUtil.POSITIONAL and 0 <= index < len(args):
+                # The position of the argument is unknown after an unpacked sequence.
+                if not any(isinstance(arg, astroid.Starred) for arg in args[: index + 1]):
+                    call_values.append(args[index])
+            if kind != AssignUtil.VARARG and call_node.keywords is not None:
+                keyword = ASTUtil.retrieve_keyword_from_list(call_node.keywords, arg_name)
+                if keyword is not None:
+                    call_values.append(keyword.value)
+            if first <= call_position <= last:
+                # A recursive call which passes the argument on does not assign it another value.
+                call_values = [
+                    value for value in call_values if getattr(value, "name", None) != arg_name
+                ]
+            values += call_values
         return values
 
+    @staticmethod
+    def _function_call_sites(function: astroid.FunctionDef) -> List[Tuple[astroid.Call, int, int]]:
+        """
+        Search the calls to a function in the indexed module.
+
+        A function is called by its name in the scope it is defined in. A method is called as an
+        attribute of 'self' or 'cls' in its class, of its class, of an instance created by a call to
+        its class, or of a variable which is assigned such an instance in the module.
+
+        :param function: FunctionDef node to search the calls to.
+        :return: List of (Call node, number of implicit arguments, position in the index) Tuples.
+        """
+        if function in AssignUtil._call_sites:
+            return AssignUtil._call_sites[function]
+        scope = function.parent
+        if isinstance(scope, astroid.ClassDef):
+            call_sites = AssignUtil._method_call_sites(function, scope)
+        else:
+            calls, positions = AssignUtil._calls_by_name.get(function.name, ([], []))
+            first, last = AssignUtil._scope_ranges[scope]
+            start, end = bisect_left(positions, first), bisect_right(positions, last)
+            call_sites = [(calls[idx], 0, positions[idx]) for idx in range(start, end)]
+        AssignUtil._call_sites[function] = call_sites
+        return call_sites
+
+    @staticmethod
+    def _method_call_sites(
+        function: astroid.FunctionDef, scope: astroid.ClassDef
+    ) -> List[Tuple[astroid.Call, int, int]]:
+        """
+        Search the calls to a method in the indexed module, like _function_call_sites.
+
+        :param function: FunctionDef node of the method.
+        :param scope: ClassDef node the method is defined in.
+        :return: List of (Call node, number of implicit arguments, position in the index) Tuples.
+        """
+        decorator_nodes = function.decorators.nodes if function.decorators else []
+        decorators = {getattr(node, "name", None) for node in decorator_nodes}
+        bound_implicit = 0 if "staticmethod" in decorators else 1
+        unbound_implicit = 1 if "classmethod" in decorators else 0
+        first, last = AssignUtil._scope_ranges[scope]
+        call_sites = []
+        for call_node, call_position in AssignUtil._calls_by_attribute.get(function.name, []):
+            receiver = call_node.func.expr
+            if isinstance(receiver, astroid.Name) and receiver.name == scope.name:
+                call_sites.append((call_node, unbound_implicit, call_position))
+            elif (
+                isinstance(receiver, astroid.Name)
+                and receiver.name in ("self", "cls")
+                and first <= call_position <= last
+            ) or AssignUtil._is_instance_of(receiver, scope.name):
+                call_sites.append((call_node, bound_implicit, call_position))
+        return call_sites
+
+    @staticmethod
+    def _is_instance_of(expr: astroid.node_classes.NodeNG, class_name: str) -> bool:
+        """
+        Evaluate whether an expression is an instance of a class: a call to the class or a variable
+        which is assigned such a call in the module.
+
+        :param expr: Expression to evaluate.
+        :param class_name: Name of the class.
+        :return: True when the expression is an instance of the class.
+        """
+        values = (
+            AssignUtil._module_values.get(expr.name, [])
+            if isinstance(expr, astroid.Name)
+            else [expr]
+        )
+        return any(
+            isinstance(value, astroid.Call) and getattr(value.func, "name", None) == class_name
+            for value in values
+        )
+
     @staticmethod
     def get_assigned_target_names(node: astroid.node_classes.NodeNG) -> List[str]:
         """
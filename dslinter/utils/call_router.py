@@ -0,0 +1,117 @@
+"""Utility module for routing Call nodes to the checkers which handle the called function."""
+import functools
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional
+
+import astroid
+from pylint.checkers import BaseChecker
+from pylint.lint import PyLinter
+
+
+class Routes(NamedTuple):
+    """Routes of a linter."""
+
+    # Routed checkers with enabled messages.
+    checkers: FrozenSet[BaseChecker]
+    # Names of the called functions with the visit_call methods which handle them, in the order
+    # pylint calls them in.
+    handlers: Dict[str, List[Callable]]
+
+
+class CallRouter:
+    """
+    Utility class for routing Call nodes to the checkers which handle the called function.
+
+    Most checkers only handle calls to a few functions or methods, e.g., 'merge' or 'fit'. Such a
+    checker declares these names in CALL_NAMES and decorates its visit_call with routed. The routed
+    checker which pylint calls first for a Call node works out the name of the called function once
+    and runs the visit_call of every enabled checker which declared that name. For the other routed
+    checkers, the node is already routed and their visit_call returns immediately.
+    """
+
+    # Routes of the last linter.
+    _linter: Optional[PyLinter] = None
+    _routes: Optional[Routes] = None
+    _routed_call: Optional[astroid.Call] = None
+    _call: Optional[astroid.Call] = None
+    _name: Optional[str] = None
+
+    @staticmethod
+    def call_name(call: astroid.Call) -> Optional[str]:
+        """
+        Get the name of the function called by a Call node, e.g., 'fit' for 'model.fit(x, y)'.
+
+        :param call: Call node to get the name of.
+        :return: Name of the function or method, or None when the function is not called by its
+            name.
+        """
+        if call is not CallRouter._call:
+            func = call.func
+            if isinstance(func, astroid.Attribute):
+                name = func.attrname
+            elif isinstance(func, astroid.Name):
+                name = func.name
+            else:
+                name = None
+            CallRouter._call = call
+            CallRouter._name = name
+        return CallRouter._name
+
+    @staticmethod
+    def routed(visit_call: Callable) -> Callable:
+        """
+        Decorate the visit_call of a checker, so it only runs for calls to the names in CALL_NAMES.
+
+        :param visit_call: visit_call method of a checker.
+        :return: Method which routes a Call node it sees first to the checkers which handle it.
+        """
+
+        @functools.wraps(visit_call)
+        def route(checker: BaseChecker, call: astroid.Call):
+            if call is CallRouter._routed_call:
+                return
+            CallRouter._routed_call = call
+            routes = CallRouter._routes
+            if checker.linter is not CallRouter._linter or checker not in routes.checkers:
+                routes = CallRouter._add_routes(checker)
+            for handler in routes.handlers.get(CallRouter.call_name(call), ()):
+                handler(call)
+
+        route.routed_visit_call = visit_call
+        return route
+
+    @staticmethod
+    def clear():
+        """Drop the routes and the last Call node, so the next module creates the routes again."""
+        CallRouter._linter = None
+        CallRouter._routes = None
+        CallRouter._routed_call = None
+        CallRouter._call = None
+        CallRouter._name = None
+
+    @staticmethod
+    def _add_routes(checker: BaseChecker) -> Routes:
+        """
+        Create the routes of the linter of a checker, from the checker and the enabled routed ones.
+
+        :param checker: Routed checker which sees a Call node.
+        :return: Routes of the linter.
+        """
+        linter = checker.linter
+        # Other linters, e.g., the one of pylint's checker tests, only know the checker itself.
+        checkers = [
+            other
+            for other in (linter.get_checkers() if isinstance(linter, PyLinter) else [])
+            if hasattr(getattr(other, "visit_call", None), "routed_visit_call")
+            and any(linter.is_message_enabled(msgid) for msgid in other.msgs)
+        ]
+        if checker not in checkers:
+            checkers.append(checker)
+        handlers: Dict[str, List[Callable]] = {}
+        for other in checkers:
+            handler = functools.partial(other.visit_call.routed_visit_call, other)
+            for name in other.CALL_NAMES:
+                handlers.setdefault(name, []).append(handler)
+        routes = Routes(frozenset(checkers), handlers)
+        CallRouter._linter = linter
+        CallRouter._routes = routes
+        return routes
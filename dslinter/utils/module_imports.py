@@ -0,0 +1,203 @@
+"""Utility module for the libraries imported by a module."""
+import functools
+from typing import Callable, Dict, FrozenSet, Optional, Set, Tuple
+
+import astroid
+
+from dslinter.utils.ast import ASTUtil
+
+
+class ModuleImports:
+    """
+    Utility class for the libraries imported by a module.
+
+    The names of the modules imported by a module are collected once and shared by all checkers.
+    Both 'import x' and 'from x import y' count, also when they are nested in a function or a try
+    statement. The names bound by these imports, including their aliases, and the star-imported
+    modules are collected in the same walk, so checkers look up which library a name comes from
+    instead of walking the imports themselves. A checker which only applies to some libraries
+    declares their names in LIBRARIES and decorates its visit and leave methods with
+    requires_libraries, so they do nothing in modules which import none of these libraries.
+    """
+
+    _module: Optional[astroid.Module] = None
+    _imported: FrozenSet[str] = frozenset()
+    _packages: FrozenSet[str] = frozenset()
+    # Names bound by the imports, with the qualified names they are imported as.
+    _names: Dict[str, str] = {}
+    _star_modules: Tuple[str, ...] = ()
+    _libraries: Dict[Tuple[str, ...], bool] = {}
+
+    @staticmethod
+    def get(module: astroid.Module) -> FrozenSet[str]:
+        """
+        Get the names of the modules imported by a module, e.g., 'torch.nn' for 'import torch.nn'.
+
+        :param module: Module to get the imports of.
+        :return: Set of the names of the imported modules.
+        """
+        if module is not ModuleImports._module:
+            ModuleImports._index(module)
+        return ModuleImports._imported
+
+    @staticmethod
+    def _index(module: astroid.Module):
+        """
+        Collect the imported modules, the names bound by imports and the star-imported modules.
+
+        :param module: Module to index.
+        """
+        imported = set()
+        names = {}
+        star_modules = []
+        # Imports are statements, so only statements and the cases of match statements are walked,
+        # in the order of the source.
+        stack = [module]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, astroid.Import):
+                for name, alias in node.names:
+                    imported.add(name)
+                    # 'import torch.nn' binds 'torch', 'import torch.nn as nn' binds 'nn'.
+                    names[alias or name.split(".")[0]] = name if alias else name.split(".")[0]
+            elif isinstance(node, astroid.ImportFrom):
+                if node.modname:
+                    imported.add(node.modname)
+                for name, alias in node.names:
+                    if name == "*":
+                        star_modules.append(node.modname)
+                    else:
+                        names[alias or name] = node.modname + "." + name if node.modname else name
+            else:
+                stack.extend(
+                    child
+                    for child in reversed(list(node.get_children()))
+                    if child.is_statement or isinstance(child, astroid.MatchCase)
+                )
+        ModuleImports._module = module
+        ModuleImports._imported = frozenset(imported)
+        ModuleImports._packages = frozenset(name.split(".")[0] for name in imported)
+        ModuleImports._names = names
+        ModuleImports._star_modules = tuple(star_modules)
+        ModuleImports._libraries = {}
+
+    @staticmethod
+    def imports_package(node: astroid.node_classes.NodeNG, package: str) -> bool:
+        """
+        Check whether the module of a node imports a package, e.g., 'tensorflow', or a submodule.
+
+        :param node: Node in the module to check.
+        :param package: Name of the top-level package.
+        :return: True when the package is imported.
+        """
+        ModuleImports.get(node.root())
+        return package in ModuleImports._packages
+
+    @staticmethod
+    def resolve(node: astroid.node_classes.NodeNG, name: str) -> Optional[str]:
+        """
+        Get the qualified name a name is imported as in the module of a node, e.g., 'torch.nn.ReLU'.
+
+        When a name is bound by several imports, the last one in the module counts.
+
+        :param node: Node in the module which uses the name.
+        :param name: Name to resolve.
+        :return: Qualified name, or None when the name is not bound by an import.
+        """
+        ModuleImports.get(node.root())
+        return ModuleImports._names.get(name)
+
+    @staticmethod
+    def from_library(
+        node: astroid.node_classes.NodeNG, name: str, libraries: Tuple[str, ...]
+    ) -> bool:
+        """
+        Check whether a name in the module of a node is imported from one of the libraries.
+
+        A name which is not bound by an import can come from a star-import, so it is from one of the
+        libraries when the module star-imports one of their modules.
+
+        :param node: Node in the module which uses the name.
+        :param name: Name to check, e.g., 'SGD'.
+        :param libraries: Names of the top-level packages of the libraries, e.g.,
+            ('tf', 'tensorflow').
+        :return: True when the name is imported from one of the libraries.
+        """
+        qualified = ModuleImports.resolve(node, name)
+        if qualified is not None:
+            return qualified.split(".")[0] in libraries
+        return any(module.split(".")[0] in libraries for module in ModuleImports._star_modules)
+
+    @staticmethod
+    def imports_library(node: astroid.node_classes.NodeNG, libraries: Tuple[str, ...]) -> bool:
+        """
+        Check whether the module of a node imports one of the libraries.
+
+        Like has_import, a library is imported when its name is part of an imported module's name.
+
+        :param node: Node in the module to check.
+        :param libraries: Names of the libraries, e.g., ('tensorflow',).
+        :return: True when one of the libraries is imported.
+        """
+        imported = ModuleImports.get(node.root())
+        if libraries not in ModuleImports._libraries:
+            ModuleImports._libraries[libraries] = any(
+                library in name for library in libraries for name in imported
+            )
+        return ModuleImports._libraries[libraries]
+
+    @staticmethod
+    def importable_modules(module: astroid.Module) -> Set[str]:
+        """
+        Get the names of the modules a module can import, e.g., to follow the imports between files.
+
+        Unlike get, relative imports are resolved. Importing a module also imports the packages it
+        is in, and 'from package import name' can import the module package.name.
+
+        :param module: Module to get the imports of.
+        :return: Set of the names of the modules which can be imported.
+        """
+        imported = set()
+        for node in ASTUtil.search_nodes(module, (astroid.Import, astroid.ImportFrom)):
+            if isinstance(node, astroid.Import):
+                imported.update(name for name, _ in node.names)
+                continue
+            try:
+                modname = module.relative_to_absolute_name(node.modname, node.level)
+            except astroid.TooManyLevelsError:
+                continue
+            imported.add(modname)
+            imported.update(f"{modname}.{name}" if modname else name for name, _ in node.names)
+        packages = {
+            ".".join(name.split(".")[:depth])
+            for name in imported
+            for depth in range(1, name.count(".") + 1)
+        }
+        return imported | packages
+
+    @staticmethod
+    def requires_libraries(visit: Callable) -> Callable:
+        """
+        Decorate a visit or leave method of a checker to run only in modules importing LIBRARIES.
+
+        :param visit: Method of a checker which is called with a node.
+        :return: Method which does nothing in modules without the libraries.
+        """
+
+        @functools.wraps(visit)
+        def visit_when_imported(checker, node: astroid.node_classes.NodeNG):
+            if ModuleImports.imports_library(node, checker.LIBRARIES):
+                return visit(checker, node)
+            return None
+
+        return visit_when_imported
+
+    @staticmethod
+    def clear():
+        """Drop the imports of the last module, so nothing is kept for the next one."""
+        ModuleImports._module = None
+        ModuleImports._imported = frozenset()
+        ModuleImports._packages = frozenset()
+        ModuleImports._names = {}
+        ModuleImports._star_modules = ()
+        ModuleImports._libraries = {}
@@ -0,0 +1,48 @@
+"""Utility module for the lifecycle of the per-module caches of the plugin."""
+import astroid
+
+from dslinter.utils.assignment_facts import AssignmentFacts
+from dslinter.utils.ast import ASTUtil, AssignUtil
+from dslinter.utils.call_router import CallRouter
+from dslinter.utils.module_imports import ModuleImports
+from dslinter.utils.type_inference import ModuleTypeInference
+from dslinter.utils.type_inference_prefetch import TypeInferencePrefetch
+
+
+class ModuleLifecycle:
+    """
+    Utility class for the lifecycle of the per-module caches of the plugin.
+
+    The caches of the utility classes are filled for a module when a checker first needs them while
+    the module is checked, and they hold nodes of that module. All of them are released by
+    TypeInferenceChecker, which leaves the modules after the other checkers of the plugin, so the
+    plugin does not keep any module tree reachable during long runs. Prefetching mypy runs for the
+    next modules fills the caches with these modules, so this is done before the caches are
+    released. TypeInferenceChecker is walked for every module, also when its message and report are
+    disabled.
+    """
+
+    @staticmethod
+    def release(module: astroid.Module):
+        """
+        Release everything the caches hold for a module.
+
+        :param module: Module which is checked.
+        """
+        TypeInferencePrefetch.release(module.file)
+        ASTUtil.clear_index()
+        AssignUtil.clear_index()
+        AssignmentFacts.clear()
+        CallRouter.clear()
+        ModuleImports.clear()
+        ModuleTypeInference.release(module)
+
+    @staticmethod
+    def clear():
+        """Release everything the caches hold, e.g., when the linter is done with all modules."""
+        ASTUtil.clear_index()
+        AssignUtil.clear_index()
+        AssignmentFacts.clear()
+        CallRouter.clear()
+        ModuleImports.clear()
+        ModuleTypeInference.clear()
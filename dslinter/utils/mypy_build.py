@@ -0,0 +1,131 @@
+"""Utility module for reading inferred types from the TypeMap of a mypy build."""
+from typing import Dict, List, Optional, Tuple
+
+import astroid
+from mypy import build
+from mypy.errors import CompileError
+from mypy.main import process_options
+from mypy.modulefinder import BuildSource
+from mypy.nodes import CallExpr, Expression, IndexExpr, MemberExpr, NameExpr
+from mypy.traverser import TraverserVisitor
+
+from dslinter.utils.scratch_directory import ScratchDirectory
+
+
+class MypyBuild:
+    """
+    Utility class which drives the mypy build API and reads the types from its TypeMap.
+
+    The source code is not rewritten and no output of mypy is parsed. An expression in mypy's tree
+    is matched to an astroid node by its kind, its position and its name, which are the same in both
+    trees. Names, attributes, calls and subscripts are supported.
+    """
+
+    @staticmethod
+    def infer_types(
+        sources: Dict[str, Tuple[Optional[str], str]]
+    ) -> Optional[Dict[str, Dict[Tuple, str]]]:
+        """
+        Infer the types of all supported expressions in one or more modules in one mypy build.
+
+        :param sources: Dict with the module names as keys and (path, source code) Tuples as values.
+            The code is never read from the path, but mypy needs a different path for every module
+            in the build. The path can be None when there is a single module.
+        :return: Dict with the module names as keys and Dicts with the expression keys and their
+            inferred types as values, or None when the code cannot be type checked, e.g., because of
+            a syntax error. Modules which cannot be type checked are left out when there are
+            multiple.
+        """
+        _, options = process_options(["-c", ""], require_targets=False)
+        options.export_types = True
+        # The trees are needed to know which expressions belong to which module.
+        options.preserve_asts = True
+        options.cache_dir = ScratchDirectory.get("mypy_cache")
+        build_sources = [
+            BuildSource(path, module_name, code) for module_name, (path, code) in sources.items()
+        ]
+        result = None
+        while result is None:
+            try:
+                result = build.build(build_sources, options)
+            except CompileError as error:
+                # A module with invalid syntax stops the whole build, so it is left out and mypy is
+                # ran again.
+                remaining = [
+                    source for source in build_sources if source.module != error.module_with_blocker
+                ]
+                if len(remaining) in (0, len(build_sources)):
+                    return None
+                build_sources = remaining
+
+        types_per_module = {}
+        for source in build_sources:
+            collector = _ExpressionCollector()
+            result.files[source.module].accept(collector)
+            expression_types = {}
+            for expression in collector.expressions:
+                if expression in result.types:
+                    # The outermost expression is kept when two expressions have the same key.
+                    expression_types.setdefault(
+                        MypyBuild.mypy_expression_key(expression), f'"{result.types[expression]}"'
+                    )
+            types_per_module[source.module] = expression_types
+        return types_per_module
+
+    @staticmethod
+    def mypy_expression_key(expression: Expression) -> Tuple:
+        """
+        Get the key of an expression in mypy's tree.
+
+        :param expression: Name, member, call or index expression.
+        :return: Tuple with the kind, the line number, the column and the name if any.
+        """
+        if isinstance(expression, NameExpr):
+            return "Name", expression.line, expression.column, expression.name
+        if isinstance(expression, MemberExpr):
+            return "Attribute", expression.line, expression.column, expression.name
+        if isinstance(expression, CallExpr):
+            return "Call", expression.line, expression.column
+        return "Subscript", expression.line, expression.column
+
+    @staticmethod
+    def node_key(node: astroid.node_classes.NodeNG) -> Optional[Tuple]:
+        """
+        Get the key of an astroid node, which is the key of the matching expression in mypy's tree.
+
+        :param node: Node to get the key of.
+        :return: Tuple with the kind, the line number, the column and the name if any, or None if
+            the kind of node is not supported.
+        """
+        if isinstance(node, astroid.Name):
+            return "Name", node.lineno, node.col_offset, node.name
+        if isinstance(node, astroid.Attribute):
+            return "Attribute", node.lineno, node.col_offset, node.attrname
+        if isinstance(node, astroid.Call):
+            return "Call", node.lineno, node.col_offset
+        if isinstance(node, astroid.Subscript):
+            return "Subscript", node.lineno, node.col_offset
+        return None
+
+
+class _ExpressionCollector(TraverserVisitor):
+    """Visitor collecting the supported expressions in mypy's tree of a module, outermost first."""
+
+    def __init__(self):
+        super().__init__()
+        self.expressions: List[Expression] = []
+
+    def visit_name_expr(self, o: NameExpr):
+        self.expressions.append(o)
+
+    def visit_member_expr(self, o: MemberExpr):
+        self.expressions.append(o)
+        super().visit_member_expr(o)
+
+    def visit_call_expr(self, o: CallExpr):
+        self.expressions.append(o)
+        super().visit_call_expr(o)
+
+    def visit_index_expr(self, o: IndexExpr):
+        self.expressions.append(o)
+        super().visit_index_expr(o)
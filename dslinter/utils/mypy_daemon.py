@@ -0,0 +1,92 @@
+"""Utility module for running mypy in a long-lived, in-process daemon."""
+import os
+import shutil
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from dslinter.utils.scratch_directory import ScratchDirectory
+
+if TYPE_CHECKING:
+    from mypy.dmypy_server import Server
+
+
+class MypyDaemon:
+    """
+    Utility class which keeps one warm mypy build manager for the whole pylint run.
+
+    The first check loads typeshed and the installed stubs (e.g., data-science-types and
+    pyspark-stubs). Later checks reuse the loaded state and only process the changed code.
+    With parallel pylint jobs, every job process keeps its own build manager.
+    """
+
+    # Imports which stay part of every check, so their stubs are never pruned from the build.
+    WARM_UP_CODE = "import pandas\nimport pyspark.sql\n"
+
+    _server: Optional["Server"] = None
+    _directory: Optional[str] = None
+    _checks = 0
+
+    @staticmethod
+    def check(code: str) -> Tuple[str, str]:
+        """
+        Run mypy on some code with the warm build manager.
+
+        The code is always written to the same file. A new file per module would make mypy
+        reprocess all stubs depending on the removed module, while a changed file is cheap.
+
+        :param code: Code to run mypy on.
+        :return: Normal report and error report written by mypy.
+        """
+        try:
+            MypyDaemon.start()
+        except Exception as ex:  # pylint: disable=broad-except
+            MypyDaemon.stop()
+            return "", str(ex)
+        warm_up_path = os.path.join(MypyDaemon._directory, "_tmp_dslinter_warm_up.py")
+        path = os.path.join(MypyDaemon._directory, "_tmp_dslinter.py")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(code)
+        # mypy only looks for changes when the size or the mtime in seconds differs.
+        MypyDaemon._checks += 1
+        os.utime(path, (MypyDaemon._checks, MypyDaemon._checks))
+        try:
+            result = MypyDaemon._server.cmd_check(
+                [warm_up_path, path], is_tty=False, terminal_width=80
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            # The state of the build manager cannot be trusted anymore, start a new one next time.
+            MypyDaemon.stop()
+            return "", str(ex)
+        return result.get("out", ""), result.get("err", "")
+
+    @staticmethod
+    def start():
+        """Start the build manager and load the stubs, if this is not done yet."""
+        if MypyDaemon._server is not None:
+            if MypyDaemon._directory == ScratchDirectory.get("daemon"):
+                return
+            # The build manager is inherited from the process this one is forked from, e.g., the
+            # main process of parallel pylint jobs. Its files belong to that process, so every job
+            # keeps a build manager of its own.
+            MypyDaemon._server = None
+            MypyDaemon._directory = None
+        # Importing the daemon imports mypy's build, which slows down every pylint start otherwise.
+        from mypy.dmypy_server import (  # pylint: disable=import-outside-toplevel
+            Server,
+            process_start_options,
+        )
+
+        # The status file is only used when the server is daemonized, which is never done here.
+        MypyDaemon._server = Server(process_start_options([], allow_sources=False), os.devnull)
+        MypyDaemon._directory = ScratchDirectory.get("daemon")
+        warm_up_path = os.path.join(MypyDaemon._directory, "_tmp_dslinter_warm_up.py")
+        with open(warm_up_path, "w", encoding="utf-8") as file:
+            file.write(MypyDaemon.WARM_UP_CODE)
+        MypyDaemon._server.cmd_check([warm_up_path], is_tty=False, terminal_width=80)
+
+    @staticmethod
+    def stop():
+        """Stop the build manager, so the loaded state can be garbage collected."""
+        if MypyDaemon._directory is not None:
+            shutil.rmtree(MypyDaemon._directory, ignore_errors=True)
+        MypyDaemon._server = None
+        MypyDaemon._directory = None
@@ -0,0 +1,240 @@
+"""Utility module for inferring the types of all linted modules with a single mypy build."""
+import os
+import shutil
+import tempfile
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import astroid
+import mypy.api
+
+from dslinter.utils.ast import ASTUtil
+from dslinter.utils.scratch_directory import ScratchDirectory
+from dslinter.utils.time_budget import TimeBudget, TimeBudgetExceeded
+from dslinter.utils.type_inference import ModuleTypeInference, TypeInference
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+
+
+class ProjectTypeInference:
+    """
+    Utility class for inferring the types of all linted modules with a single mypy build.
+
+    All modules are type checked together, so imports between the linted modules are resolved
+    once and the stubs are loaded once. The results are handed to ModuleTypeInference before the
+    checkers run.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    @staticmethod
+    def infer_project_types(file_descriptors: Iterable[Tuple[str, str]]):
+        """
+        Infer the types of all registered requests in all modules with a single mypy build.
+
+        Modules which cannot be part of the build are inferred per module when they are visited.
+        This is also the case for all modules when the build exceeds the time budget of all modules
+        together.
+
+        :param file_descriptors: (module name, file path) Tuples of the modules which will be
+            linted.
+        """
+        modules = {}
+        for module in ModuleTypeInference.modules_needing_inference(file_descriptors):
+            # Of two modules with the same name, the second is inferred on its own.
+            modules.setdefault(module.name, module)
+        if TypeInference.backend == "build":
+            ProjectTypeInference._infer_types_with_build(list(modules.values()))
+        else:
+            ProjectTypeInference._infer_types_with_reveal_type_calls(list(modules.values()))
+
+    @staticmethod
+    def _requested_nodes(
+        module: astroid.Module, requests: Dict[str, Tuple[type, Callable]]
+    ) -> List[Tuple]:
+        """
+        Get the nodes of all requests in a module.
+
+        :param module: Module to search in.
+        :param requests: Dict with the request kinds as keys and (node type, expression) Tuples as
+            values.
+        :return: List of (request kind, node, expression) Tuples.
+        """
+        return [
+            (kind, node, expr)
+            for kind, (node_type, expr) in requests.items()
+            for node in ASTUtil.search_nodes(module, node_type)
+        ]
+
+    @staticmethod
+    def _infer_types_with_build(modules: List[astroid.Module]):
+        """
+        Infer the types of the requests in all modules by reading the TypeMap of one mypy build.
+
+        :param modules: Modules to infer the types of.
+        """
+        # mypy's build API takes long to import, so it is only imported when it is used.
+        from dslinter.utils.mypy_build import MypyBuild  # pylint: disable=import-outside-toplevel
+
+        requests = ModuleTypeInference.get_requests()
+        sources = {
+            module.name: (module.file, ASTUtil.get_source_code(module)) for module in modules
+        }
+        contexts = TypeInferenceCache.contexts(
+            "build-project", modules, {name: code for name, (_, code) in sources.items()}
+        )
+        types_per_module = {}
+        for module in modules:
+            entries = TypeInferenceCache.get(sources[module.name][1], contexts[module.name])
+            if entries is not None:
+                types_per_module[module.name] = {entry[:-1]: entry[-1] for entry in entries}
+        if len(types_per_module) < len(modules):
+            # All modules are part of the build, so the imports of the changed modules resolve.
+            try:
+                built = TimeBudget.call(
+                    TypeInference.timeout * len(sources), MypyBuild.infer_types, sources
+                )
+            except TimeBudgetExceeded:
+                # The other modules are inferred one by one, each within its own budget.
+                built = None
+            for module_name, expression_types in (built or {}).items():
+                TypeInferenceCache.put(
+                    sources[module_name][1],
+                    [key + (inferred_type,) for key, inferred_type in expression_types.items()],
+                    contexts[module_name],
+                )
+                types_per_module[module_name] = expression_types
+
+        for module in modules:
+            if module.name in types_per_module:
+                ModuleTypeInference.prepare(
+                    module,
+                    TypeInference.combine_requests_with_expression_types(
+                        requests,
+                        ProjectTypeInference._requested_nodes(module, requests),
+                        types_per_module[module.name],
+                    ),
+                )
+
+    @staticmethod
+    def _infer_types_with_reveal_type_calls(modules: List[astroid.Module]):
+        """
+        Infer the types of the requests in all modules with one mypy run on their instrumented code.
+
+        The instrumented sources are written to a scratch directory mirroring their module names.
+
+        :param modules: Modules to infer the types of.
+        """
+        requests = ModuleTypeInference.get_requests()
+        directory = tempfile.mkdtemp(prefix="project", dir=ScratchDirectory.get())
+        try:
+            # [name of the module, (instrumented code, revealed (request kind, node) Tuples)]
+            instrumented_codes = {
+                module.name: TypeInference.add_requested_reveal_type_calls(
+                    ASTUtil.get_source_code(module),
+                    ProjectTypeInference._requested_nodes(module, requests),
+                )
+                for module in modules
+            }
+            contexts = TypeInferenceCache.contexts(
+                "project", modules, {name: code for name, (code, _) in instrumented_codes.items()}
+            )
+            # [path in the scratch directory, (module, revealed (request kind, node) Tuples, code,
+            # cache context)]
+            instrumented = {}
+            for module in modules:
+                mypy_code, revealed = instrumented_codes[module.name]
+                # Cached modules are still written, so the imports of the other modules resolve.
+                path = ProjectTypeInference._mirror_path(directory, module)
+                ProjectTypeInference._write(path, mypy_code)
+                types = TypeInferenceCache.get(mypy_code, contexts[module.name])
+                if types is not None:
+                    ModuleTypeInference.prepare(
+                        module,
+                        TypeInference.combine_requests_with_inferred_types(
+                            requests, revealed, types
+                        ),
+                    )
+                    continue
+                instrumented[path] = (module, revealed, mypy_code, contexts[module.name])
+
+            if len(instrumented) == 0:
+                return
+            try:
+                timeout = TypeInference.timeout * len(instrumented)
+                types_per_file = TimeBudget.call(
+                    timeout, ProjectTypeInference._run_mypy, list(instrumented)
+                )
+            except TimeBudgetExceeded:
+                return  # The modules are inferred one by one, each within its own budget.
+            for path, types in types_per_file.items():
+                module, revealed, mypy_code, context = instrumented[path]
+                TypeInferenceCache.put(mypy_code, types, context)
+                ModuleTypeInference.prepare(
+                    module,
+                    TypeInference.combine_requests_with_inferred_types(requests, revealed, types),
+                )
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    @staticmethod
+    def _mirror_path(directory: str, module: astroid.Module) -> str:
+        """
+        Get the path of a module in the scratch directory, based on its module name.
+
+        :param directory: Scratch directory.
+        :param module: Module to get the path for.
+        :return: Path of the module in the scratch directory.
+        """
+        parts = module.name.split(".")
+        if module.package:
+            parts.append("__init__")
+        for depth in range(1, len(parts)):
+            # Packages in between which are not linted themselves still need an __init__.py.
+            init_path = os.path.join(directory, *parts[:depth], "__init__.py")
+            if not os.path.exists(init_path):
+                ProjectTypeInference._write(init_path, "")
+        return os.path.join(directory, *parts) + ".py"
+
+    @staticmethod
+    def _write(path: str, code: str):
+        """
+        Write code to a file, creating its directories when needed.
+
+        :param path: Path of the file.
+        :param code: Code to write.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(code)
+
+    @staticmethod
+    def _run_mypy(paths: List[str]) -> Dict[str, List[Tuple[int, str]]]:
+        """
+        Run mypy on all files at once.
+
+        A file with invalid syntax stops the whole build, so it is left out and mypy is ran again.
+
+        :param paths: Paths of the files to run mypy on.
+        :return: Dict with the paths of the files which are type checked as keys and lists of
+            (line number, inferred type) Tuples as values.
+        """
+        paths = list(paths)
+        while len(paths) > 0:
+            result = mypy.api.run(["--cache-dir", ScratchDirectory.get("mypy_cache")] + paths)
+            if result[1] != "":
+                return {}
+            types_per_file: Dict[str, List[Tuple[int, str]]] = {path: [] for path in paths}
+            faulty_path = None
+            revealed_type_indicator = ": note: Revealed type is "
+            for line in result[0].splitlines():
+                if revealed_type_indicator in line:
+                    location, inferred_type = line.split(revealed_type_indicator, 1)
+                    path, line_number = location.rsplit(":", 1)
+                    path = os.path.abspath(path)
+                    if path in types_per_file:
+                        types_per_file[path].append((int(line_number), inferred_type))
+                elif ": error: invalid syntax" in line:
+                    faulty_path = os.path.abspath(line.split(":")[0])
+            if faulty_path is None or faulty_path not in paths:
+                return types_per_file
+            paths.remove(faulty_path)
+        return {}
@@ -1,33 +1,150 @@
 """Utility module for reading resources."""
 
+import json
 import pickle
-from typing import Dict, List, Union
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Union
 
-from pkg_resources import resource_stream
+try:
+    from importlib.resources import files
+except ImportError:  # Python 3.7 and 3.8
+    files = None
+    from importlib.resources import open_binary
+
+
+class HyperparameterRegistry:
+    """
+    Immutable view on the hyperparameters of a library in the knowledge base.
+
+    The names of the learning algorithms come from the manifest. The shard of a submodule is only
+    read when one of its learning algorithms is looked up for the first time. Every learning
+    algorithm maps to a read-only Dict with the keys 'positional' and 'keywords', like in the
+    shards, but its keywords are a frozenset.
+    """
+
+    def __init__(self, shards: Dict[str, List[str]], read_shard: Callable[[str], Dict]):
+        """
+        Create a registry of the shards of a library.
+
+        :param shards: Dict with the files of the shards as keys and the names of their learning
+            algorithms as values.
+        :param read_shard: Function which reads a shard from its file.
+        """
+        self._files: Dict[str, str] = {
+            name: file for file, names in shards.items() for name in names
+        }
+        self.classes: FrozenSet[str] = frozenset(self._files)
+        self._read_shard = read_shard
+        self._parameters: Dict[str, Mapping[str, Union[int, FrozenSet[str]]]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.classes
+
+    def __getitem__(self, name: str) -> Mapping[str, Union[int, FrozenSet[str]]]:
+        if name not in self._parameters:
+            for shard_name, parameters in self._read_shard(self._files[name]).items():
+                keywords = frozenset(parameters["keywords"])
+                self._parameters[shard_name] = MappingProxyType(
+                    {"positional": parameters["positional"], "keywords": keywords}
+                )
+        return self._parameters[name]
+
+    def __len__(self) -> int:
+        return len(self.classes)
 
 
 class Resources:
     """Utility class for reading resources."""
 
-    __RESOURCES_PACKAGE = "dslinter.resources"
+    __HYPERPARAMETERS_PACKAGE = "dslinter.resources.hyperparameters"
+    __MANIFEST = "manifest.json"
+
+    # Manifest of the knowledge base and the registries loaded in this process, per library.
+    _manifest: Optional[Dict[str, Dict]] = None
+    _registries: Dict[str, HyperparameterRegistry] = {}
+
+    @staticmethod
+    def get_manifest() -> Dict[str, Dict]:
+        """
+        Get the manifest of the hyperparameters knowledge base, which is read once per process.
+
+        :return: Dict with the libraries as keys. Each value is a Dict containing the keys 'imports'
+            and 'shards' containing the names of the modules the library is imported as and a Dict
+            with the submodules as keys and their 'file' and 'classes' as values respectively.
+        """
+        manifest = Resources._manifest
+        if manifest is None:
+            data = Resources.read_binary(Resources.__HYPERPARAMETERS_PACKAGE, Resources.__MANIFEST)
+            manifest = Resources._manifest = json.loads(data)
+        return manifest
 
     @staticmethod
-    def get_hyperparameters(hyperparameter_resource) -> Dict[str, Dict[str, Union[int, List[str]]]]:
+    def get_library_imports(library: str) -> List[str]:
         """
-        Get the hyperparameters resource.
+        Get the names of the top-level modules a library in the knowledge base is imported as.
 
-        :return: Dict with every learning algorithm from scikit-learn as keys. Each value is a Dict
+        :param library: Name of the library, e.g., 'scikitlearn'.
+        :return: List of module names, e.g., ['sklearn'].
+        """
+        return Resources.get_manifest()[library]["imports"]
+
+    @staticmethod
+    def get_hyperparameters(library: str) -> Dict[str, Dict[str, Union[int, List[str]]]]:
+        """
+        Get the hyperparameters of a library.
+
+        All shards of the library are read from disk on every call. Use get_hyperparameter_registry
+        to read them once and only when they are needed.
+
+        :param library: Name of the library, e.g., 'scikitlearn'.
+        :return: Dict with every learning algorithm from the library as keys. Each value is a Dict
         containing the keys 'positional' and 'keywords' containing its amount of keywords and a list
         with the names of its keywords respectively.
         """
-        return Resources.read_pickle(hyperparameter_resource)
+        hyperparameters = {}
+        for shard in Resources.get_manifest()[library]["shards"].values():
+            hyperparameters.update(Resources.read_shard(shard["file"]))
+        return hyperparameters
+
+    @staticmethod
+    def get_hyperparameter_registry(library: str) -> HyperparameterRegistry:
+        """
+        Get the hyperparameters of a library as a registry, created once per process when needed.
+
+        Creating the registry only reads the manifest. Its shards are read when their learning
+        algorithms are looked up.
+
+        :param library: Name of the library, e.g., 'scikitlearn'.
+        :return: Immutable registry of the learning algorithms of the library.
+        """
+        if library not in Resources._registries:
+            shards = Resources.get_manifest()[library]["shards"].values()
+            Resources._registries[library] = HyperparameterRegistry(
+                {shard["file"]: shard["classes"] for shard in shards}, Resources.read_shard
+            )
+        return Resources._registries[library]
+
+    @staticmethod
+    def read_shard(file: str) -> Dict[str, Dict[str, Union[int, List[str]]]]:
+        """
+        Read a shard of the hyperparameters knowledge base from disk.
+
+        :param file: File name of the shard, as in the manifest.
+        :return: Dict with the learning algorithms of the shard as keys and their hyperparameters as
+            values.
+        """
+        return pickle.loads(Resources.read_binary(Resources.__HYPERPARAMETERS_PACKAGE, file))
 
     @staticmethod
-    def read_pickle(file):
+    def read_binary(package: str, file: str) -> bytes:
         """
-        Read a pickled object from disk.
+        Read a file in a resource package.
 
-        :param file: File name of the pickle in the resource package.
-        :return: Deserialized object.
+        :param package: Name of the package.
+        :param file: File name in the package.
+        :return: Contents of the file.
         """
-        return pickle.load(resource_stream(Resources.__RESOURCES_PACKAGE, file))
+        if files is None:
+            with open_binary(package, file) as stream:
+                return stream.read()
+        return files(package).joinpath(file).read_bytes()
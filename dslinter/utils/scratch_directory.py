@@ -0,0 +1,60 @@
+"""Utility module for the private scratch directory of a process."""
+import atexit
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+
+class ScratchDirectory:
+    """
+    Utility class for the private scratch directory of a process.
+
+    Files mypy needs are written here instead of the current working directory, which can be read
+    only or on a slow network filesystem. Every process gets its own directory, so parallel pylint
+    jobs never race on the same files. tmpfs is preferred when it is available.
+    """
+
+    # Directory backed by memory on most Linux systems.
+    TMPFS = "/dev/shm"
+
+    _path: Optional[str] = None
+    _pid: Optional[int] = None
+
+    @staticmethod
+    def get(name: str = "") -> str:
+        """
+        Get the scratch directory of this process, creating it when needed.
+
+        :param name: Name of a subdirectory to get, which is created as well.
+        :return: Path of the (sub)directory.
+        """
+        if ScratchDirectory._path is None or ScratchDirectory._pid != os.getpid():
+            # A forked process must not share or remove the directory of its parent.
+            tmpfs = ScratchDirectory.TMPFS
+            parent = tmpfs if os.path.isdir(tmpfs) and os.access(tmpfs, os.W_OK | os.X_OK) else None
+            ScratchDirectory._path = tempfile.mkdtemp(prefix="dslinter", dir=parent)
+            ScratchDirectory._pid = os.getpid()
+            atexit.register(ScratchDirectory.remove)
+        path = os.path.join(ScratchDirectory._path, name) if name else ScratchDirectory._path
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def inherit():
+        """
+        Use the scratch directory of the parent in a short-lived forked process.
+
+        The forked process must exit without running the exit handlers, so the directory is only
+        removed by the parent.
+        """
+        if ScratchDirectory._path is not None:
+            ScratchDirectory._pid = os.getpid()
+
+    @staticmethod
+    def remove():
+        """Remove the scratch directory of this process with everything in it."""
+        if ScratchDirectory._path is not None and ScratchDirectory._pid == os.getpid():
+            shutil.rmtree(ScratchDirectory._path, ignore_errors=True)
+            ScratchDirectory._path = None
+            ScratchDirectory._pid = None
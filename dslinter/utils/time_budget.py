@@ -0,0 +1,132 @@
+"""Utility module for running a function within a wall-clock time budget."""
+import os
+import pickle
+import select
+import signal
+import sys
+import time
+from typing import Any, Callable
+
+from dslinter.utils.scratch_directory import ScratchDirectory
+
+
+class TimeBudgetExceeded(Exception):
+    """Raised when a function does not finish within its time budget."""
+
+
+class TimeBudgetAborted(TimeBudgetExceeded):
+    """
+    Raised when the process running a function stops without a result it can hand over.
+
+    The callers handle it like an exceeded budget, e.g., when the process is killed because it runs
+    out of memory.
+    """
+
+
+class TimeBudget:
+    """
+    Utility class for running a function within a wall-clock time budget.
+
+    mypy cannot be interrupted while it runs in the same process, so the function is ran in a forked
+    process which is killed when the budget is exceeded. A forked process starts with everything the
+    parent has loaded, e.g., a warm mypy daemon. Where fork is not available, the budget is not
+    enforced.
+    """
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Check whether a time budget can be enforced on this platform.
+
+        :return: True when processes can be forked.
+        """
+        return hasattr(os, "fork")
+
+    @staticmethod
+    def call(timeout: float, function: Callable, *args) -> Any:
+        """
+        Call a function and wait at most a number of seconds for its result.
+
+        :param timeout: Budget in seconds. When it is 0 or less, the function is called without a
+            budget.
+        :param function: Function to call.
+        :param args: Arguments to call the function with. The result must be picklable.
+        :return: The result of the function.
+        :raises TimeBudgetExceeded: When the function does not finish within the budget.
+        :raises TimeBudgetAborted: When the process running the function stops without a result, or
+            the result cannot be pickled.
+        """
+        if timeout <= 0 or not TimeBudget.is_supported():
+            return function(*args)
+
+        # The child is killed before it could remove a scratch directory of its own.
+        ScratchDirectory.get()
+        read_fd, write_fd = os.pipe()
+        # Output buffered before the fork would otherwise be written by both processes.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            TimeBudget._run_child(read_fd, write_fd, function, args)
+
+        os.close(write_fd)
+        chunks = []
+        exceeded = False
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                ready = (
+                    select.select([read_fd], [], [], max(remaining, 0))[0] if remaining > 0 else []
+                )
+                if not ready:
+                    exceeded = True
+                    break
+                chunk = os.read(read_fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(read_fd)
+            if exceeded:
+                os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+
+        if exceeded:
+            raise TimeBudgetExceeded(f"{function.__name__} did not finish within {timeout} seconds")
+        if len(chunks) == 0:
+            raise TimeBudgetAborted(f"{function.__name__} stopped without a result")
+        succeeded, result = pickle.loads(b"".join(chunks))
+        if not succeeded:
+            raise result
+        return result
+
+    @staticmethod
+    def _run_child(read_fd: int, write_fd: int, function: Callable, args: tuple):
+        """
+        Run the function in the forked process, write the pickled result to the pipe and exit.
+
+        :param read_fd: End of the pipe the parent reads from.
+        :param write_fd: End of the pipe the result is written to.
+        :param function: Function to call.
+        :param args: Arguments to call the function with.
+        """
+        try:
+            os.close(read_fd)
+            ScratchDirectory.inherit()
+            try:
+                result = (True, function(*args))
+            except Exception as ex:  # pylint: disable=broad-except
+                result = (False, ex)
+            try:
+                data = pickle.dumps(result)
+            except Exception as ex:  # pylint: disable=broad-except
+                error = TimeBudgetAborted(
+                    f"{function.__name__} has a result which cannot be pickled: {ex}"
+                )
+                data = pickle.dumps((False, error))
+            with os.fdopen(write_fd, "wb") as file:
+                file.write(data)
+        finally:
+            # Skip the exit handlers of the parent, e.g., removing its scratch directory.
+            os._exit(0)  # pylint: disable=protected-access
@@ -1,17 +1,45 @@
 """Utility module for type inference."""
-import os
-from typing import Callable, Dict, List, Tuple
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import astroid
 import mypy.api
+from astroid import MANAGER
 
+from dslinter.utils.assignment_facts import AssignmentFacts
 from dslinter.utils.ast import ASTUtil
-import uuid
+from dslinter.utils.mypy_daemon import MypyDaemon
+from dslinter.utils.scratch_directory import ScratchDirectory
+from dslinter.utils.time_budget import TimeBudget, TimeBudgetExceeded
+from dslinter.utils.type_inference_cache import TypeInferenceCache
+from dslinter.utils.type_inference_prefetch import TypeInferencePrefetch
 
 
 class TypeInference:
     """Utility class for type inference."""
 
+    # Backends to run mypy with: a fresh mypy run per module, a warm in-process daemon or the mypy
+    # build API, from which the types are read without adding reveal_type() calls.
+    BACKENDS = ("mypy", "daemon", "build")
+    backend = "mypy"
+
+    # Wall-clock budget in seconds for running mypy on a module, 0 for no budget.
+    timeout = 0.0
+
+    # Functions of pandas which create a DataFrame, to guess types when mypy exceeds the budget.
+    DATAFRAME_FACTORIES = (
+        "DataFrame",
+        "concat",
+        "merge",
+        "read_csv",
+        "read_excel",
+        "read_json",
+        "read_parquet",
+        "read_pickle",
+        "read_sql",
+        "read_table",
+    )
+
     #pylint: disable = line-too-long
     @staticmethod
     def infer_types(module: astroid.Module, node_type: type, expr: Callable) -> Dict[astroid.node_classes.NodeNG, str]:
@@ -25,12 +53,52 @@ class TypeInference:
         :return: All nodes in the module of type 'node_type' with the inferred type of the attribute
             accessible with the expression 'expr'.
         """
-        nodes = ASTUtil.search_nodes(module, node_type)
-        source_code = ASTUtil.get_source_code(module)
-        mypy_code = TypeInference.add_reveal_type_calls(source_code, nodes, expr)
-        mypy_result = TypeInference.run_mypy(mypy_code)
+        return TypeInference.infer_requested_types(module, {"": (node_type, expr)})[""]
+
+    @staticmethod
+    def infer_requested_types(
+        module: astroid.Module, requests: Dict[str, Tuple[type, Callable]]
+    ) -> Dict[str, Dict[astroid.node_classes.NodeNG, str]]:
+        """
+        Infer the types for multiple requests in a module with a single mypy run.
+
+        :param module: The module node where all nodes are located in.
+        :param requests: Dict with the request kinds as keys and (node type, expression) Tuples as
+            values, like the 'node_type' and 'expr' arguments of infer_types.
+        :return: Dict with the request kinds as keys and the nodes with their inferred types as
+            values.
+        :raises TimeBudgetExceeded: When mypy does not finish within the budget.
+        """
+        function, mypy_code, requested_nodes, revealed = TypeInference.prepare_mypy_run(
+            module, requests
+        )
+        context = TypeInferenceCache.module_context(
+            module, "build" if TypeInference.backend == "build" else ""
+        )
+        if TypeInference.backend == "build":
+            expression_types = TypeInference._get_cached_expression_types(mypy_code, context)
+            if expression_types is None:
+                expression_types = TypeInferencePrefetch.result(module.file, function, mypy_code)
+                if expression_types is not None:
+                    TypeInferenceCache.put(
+                        mypy_code,
+                        [key + (inferred_type,) for key, inferred_type in expression_types.items()],
+                        context,
+                    )
+            return TypeInference.combine_requests_with_expression_types(
+                requests, requested_nodes, expression_types or {}
+            )
+        mypy_types = TypeInferenceCache.get(mypy_code, context)
+        if mypy_types is not None:
+            return TypeInference.combine_requests_with_inferred_types(
+                requests, revealed, mypy_types
+            )
+        mypy_result = TypeInferencePrefetch.result(module.file, function, mypy_code)
         try:
             mypy_types = TypeInference.parse_mypy_result(mypy_result)
+            if mypy_result != "":
+                # An empty result means mypy failed, which can be different on the next run.
+                TypeInferenceCache.put(mypy_code, mypy_types, context)
         except SyntaxError as ex:
             mypy_code_split = mypy_code.splitlines()
             faulty_code = mypy_code_split[int(ex.lineno) - 1]
@@ -38,15 +106,125 @@ class TypeInference:
                 original_code = faulty_code.split("; reveal_type(")[0]
                 mypy_code_split[int(ex.lineno) - 1] = original_code
                 mypy_types = TypeInference.parse_mypy_result("\n".join(mypy_code_split))
-                return TypeInference.combine_nodes_with_inferred_types(nodes, mypy_types)
             else:
                 print(
                     "Skipping type checking of module {}: {}. Line {}: {}".format(
                         module.name, ex.msg, ex.lineno, faulty_code
                     )
                 )
-                return {}
-        return TypeInference.combine_nodes_with_inferred_types(nodes, mypy_types)
+                mypy_types = []
+        return TypeInference.combine_requests_with_inferred_types(requests, revealed, mypy_types)
+
+    @staticmethod
+    def prepare_mypy_run(
+        module: astroid.Module, requests: Dict[str, Tuple[type, Callable]]
+    ) -> Tuple[
+        Callable[[str], Any],
+        str,
+        List[Tuple[str, astroid.node_classes.NodeNG, Callable]],
+        List[Tuple],
+    ]:
+        """
+        Prepare the mypy run which infers the types for multiple requests in a module.
+
+        :param module: The module node where all nodes are located in.
+        :param requests: Dict with the request kinds as keys and (node type, expression) Tuples as
+            values.
+        :return: Function running mypy, the code to run it on, the requested (request kind, node,
+            expression) Tuples and, unless the build backend is used, the nodes of which the types
+            are revealed.
+        """
+        requested_nodes = []
+        for kind, (node_type, expr) in requests.items():
+            for node in ASTUtil.search_indexed_nodes(module, node_type):
+                requested_nodes.append((kind, node, expr))
+        source_code = ASTUtil.get_source_code(module)
+        if TypeInference.backend == "build":
+            function = TypeInference.infer_expression_types_with_budget
+            return function, source_code, requested_nodes, []
+        mypy_code, revealed = TypeInference.add_requested_reveal_type_calls(
+            source_code, requested_nodes
+        )
+        return TypeInference.run_mypy_with_budget, mypy_code, requested_nodes, revealed
+
+    @staticmethod
+    def infer_expression_types_with_budget(code: str) -> Optional[Dict[Tuple, str]]:
+        """
+        Infer the types of all expressions in some code within the time budget.
+
+        :param code: Code to infer the types of.
+        :return: Dict with the keys of the expressions, as created by MypyBuild, and their inferred
+            types, or None when the build fails.
+        :raises TimeBudgetExceeded: When mypy does not finish within the budget.
+        """
+        return TimeBudget.call(TypeInference.timeout, TypeInference.infer_expression_types, code)
+
+    @staticmethod
+    def infer_expression_types(code: str) -> Optional[Dict[Tuple, str]]:
+        """
+        Infer the types of all expressions in some code by reading the TypeMap of a mypy build.
+
+        :param code: Code to infer the types of.
+        :return: Dict with the keys of the expressions, as created by MypyBuild, and their inferred
+            types, or None when the build fails.
+        """
+        # mypy's build API takes long to import, so it is only imported when it is used.
+        from dslinter.utils.mypy_build import MypyBuild  # pylint: disable=import-outside-toplevel
+
+        types_per_module = MypyBuild.infer_types({"__main__": (None, code)})
+        if types_per_module is None:
+            return None
+        return types_per_module["__main__"]
+
+    @staticmethod
+    def _get_cached_expression_types(code: str, context: str) -> Optional[Dict[Tuple, str]]:
+        """
+        Get the types of all expressions in some code from the cache.
+
+        :param code: Code the types are inferred of.
+        :param context: Cache context of the code.
+        :return: Dict with the keys of the expressions and their inferred types, or None if the code
+            is not cached.
+        """
+        entries = TypeInferenceCache.get(code, context)
+        if entries is None:
+            return None
+        return {entry[:-1]: entry[-1] for entry in entries}
+
+    @staticmethod
+    def combine_requests_with_expression_types(
+        requests: Dict[str, Tuple[type, Callable]],
+        requested_nodes: List[Tuple[str, astroid.node_classes.NodeNG, Callable]],
+        expression_types: Dict[Tuple, str],
+    ) -> Dict[str, Dict[astroid.node_classes.NodeNG, str]]:
+        """
+        Create a Dict per request kind with the nodes and the inferred types of their expressions.
+
+        :param requests: Dict with the request kinds as keys and (node type, expression) Tuples as
+            values.
+        :param requested_nodes: List of (request kind, node, expression) Tuples.
+        :param expression_types: Dict with the keys of the expressions and their inferred types.
+        :return: Dict with the request kinds as keys and the nodes with their inferred types as
+            values.
+        """
+        from dslinter.utils.mypy_build import MypyBuild  # pylint: disable=import-outside-toplevel
+
+        nodes_with_types = {kind: {} for kind in requests}
+        for kind, node, expr in requested_nodes:
+            try:
+                expression = expr(node)
+            except:  # pylint: disable = bare-except
+                continue  # The attribute from the expression is not found. Continue.
+            # The expression is the source code of a node in the subtree of the requested node.
+            for child in node.nodes_of_class(
+                (astroid.Name, astroid.Attribute, astroid.Call, astroid.Subscript)
+            ):
+                if child.as_string() == expression:
+                    key = MypyBuild.node_key(child)
+                    if key in expression_types:
+                        nodes_with_types[kind][node] = expression_types[key]
+                    break
+        return nodes_with_types
 
     @staticmethod
     def add_reveal_type_calls(code: str, nodes: List, expr: Callable) -> str:
@@ -59,19 +237,38 @@ class TypeInference:
             inferred on. E.g., lambda node: node.func.expr.name
         :return: Code including the calls.
         """
+        mypy_code, _ = TypeInference.add_requested_reveal_type_calls(
+            code, [("", node, expr) for node in nodes]
+        )
+        return mypy_code
+
+    @staticmethod
+    def add_requested_reveal_type_calls(
+        code: str, requested_nodes: List[Tuple[str, astroid.node_classes.NodeNG, Callable]]
+    ) -> Tuple[str, List[Tuple[str, astroid.node_classes.NodeNG]]]:
+        """
+        Add reveal_type() calls for the nodes of multiple requests to source code.
+
+        :param code: Code to add calls to.
+        :param requested_nodes: List of (request kind, node, expression) Tuples.
+        :return: Code including the calls and the (request kind, node) Tuples for which a call is
+            added, in the order the calls are added.
+        """
         lines = code.splitlines()
-        for node in nodes:
+        revealed = []
+        for kind, node, expr in requested_nodes:
             try:
                 line_no = TypeInference.line_to_add_call(node) - 1
                 lines[line_no] += "; reveal_type({})".format(expr(node))
                 if lines[line_no].strip()[0] == ";":
                     # If the call is added to a new line, remove the semicolon.
                     lines[line_no] = lines[line_no].strip()[1:]
+                revealed.append((kind, node))
             # except AttributeError:
             except:
                 pass  # The attribute from the expression is not found. Continue.
 
-        return "\n".join(lines)
+        return "\n".join(lines), revealed
 
     @staticmethod
     def line_to_add_call(node: astroid.node_classes.NodeNG):
@@ -98,6 +295,23 @@ class TypeInference:
             return TypeInference.line_to_add_call(node.parent.body[0])
         return node.tolineno
 
+    @staticmethod
+    def run_mypy_with_budget(code: str) -> str:
+        """
+        Run mypy on some code within the time budget.
+
+        :param code: Code to run mypy on.
+        :return: Normal report written to sys.stdout by mypy.
+        :raises TimeBudgetExceeded: When mypy does not finish within the budget.
+        """
+        if TypeInference.backend == "daemon" and TypeInference.timeout > 0:
+            # Load the stubs in this process, so every run in a forked process starts warm.
+            try:
+                MypyDaemon.start()
+            except Exception:  # pylint: disable=broad-except
+                MypyDaemon.stop()
+        return TimeBudget.call(TypeInference.timeout, TypeInference.run_mypy, code)
+
     @staticmethod
     def run_mypy(code: str) -> str:
         """
@@ -106,13 +320,12 @@ class TypeInference:
         :param code: Code to run mypy on.
         :return: Normal report written to sys.stdout by mypy.
         """
-        id1 = str(uuid.uuid1())
-        _tmp_dslinter_file = "_tmp_dslinter"+id1+".py"
-        file = open(_tmp_dslinter_file, "w", encoding="utf-8")
-        file.write(code)
-        file.close()
-        result = mypy.api.run([_tmp_dslinter_file])
-        os.remove(_tmp_dslinter_file)
+        if TypeInference.backend == "daemon":
+            result = MypyDaemon.check(code)
+        else:
+            # The code is passed as program text and the mypy cache is kept in the scratch directory
+            # of this process, so nothing is written to the current working directory.
+            result = mypy.api.run(["--cache-dir", ScratchDirectory.get("mypy_cache"), "-c", code])
 
         if result[1] != '':
             # raise Exception("Running mypy resulted in an error: " + result[1])
@@ -151,15 +364,107 @@ class TypeInference:
         :param types: List of (line number, inferred type) Tuples.
         :return: Dict with nodes and their inferred types.
         """
-        unseen_types = types.copy()
-        nodes_with_types = {}
+        matched_types = TypeInference._match_types_by_line(nodes, types)
+        return {
+            node: type_inferred
+            for node, type_inferred in zip(nodes, matched_types)
+            if type_inferred is not None
+        }
+
+    @staticmethod
+    def combine_requests_with_inferred_types(
+        requests: Dict[str, Tuple[type, Callable]],
+        revealed: List[Tuple[str, astroid.node_classes.NodeNG]],
+        types: List[Tuple[int, str]],
+    ) -> Dict[str, Dict[astroid.node_classes.NodeNG, str]]:
+        """
+        Create a Dict per request kind with nodes and their inferred types.
+
+        :param requests: Requests for which the types are inferred.
+        :param revealed: (request kind, node) Tuples in the order the reveal_type() calls are added.
+        :param types: List of (line number, inferred type) Tuples.
+        :return: Dict with the request kinds as keys and the nodes with their inferred types as
+            values.
+        """
+        requests_with_types: Dict[str, Dict[astroid.node_classes.NodeNG, str]] = {
+            kind: {} for kind in requests
+        }
+        matched_types = TypeInference._match_types_by_line([node for _, node in revealed], types)
+        for (kind, node), type_inferred in zip(revealed, matched_types):
+            if type_inferred is not None:
+                requests_with_types[kind][node] = type_inferred
+        return requests_with_types
+
+    @staticmethod
+    def _match_types_by_line(
+        nodes: List[astroid.node_classes.NodeNG], types: List[Tuple[int, str]]
+    ) -> List[Optional[str]]:
+        """
+        Match nodes with the types inferred on the line their reveal_type() call is added to.
+
+        The types are indexed by line number, so every node and type is visited once. Multiple nodes
+        on the same line get the types of that line in order.
+
+        :param nodes: Nodes in the order their reveal_type() calls are added.
+        :param types: List of (line number, inferred type) Tuples in the order mypy reported them.
+        :return: The inferred type of every node, or None if no type is left on its line.
+        """
+        types_per_line: Dict[int, Deque[str]] = {}
+        for line, type_inferred in types:
+            types_per_line.setdefault(line, deque()).append(type_inferred)
+        matched_types = []
         for node in nodes:
-            for line, type_inferred in unseen_types:
-                if TypeInference.line_to_add_call(node) == line:
-                    nodes_with_types[node] = type_inferred
-                    # Remove the tuple so multiple calls on the same line get the correct type.
-                    unseen_types.remove((line, type_inferred))
-        return nodes_with_types
+            line_types = types_per_line.get(TypeInference.line_to_add_call(node))
+            matched_types.append(line_types.popleft() if line_types else None)
+        return matched_types
+
+    @staticmethod
+    def infer_requested_types_from_assignments(
+        module: astroid.Module, requests: Dict[str, Tuple[type, Callable]]
+    ) -> Dict[str, Dict[astroid.node_classes.NodeNG, str]]:
+        """
+        Guess the types for multiple requests from the most recent assignments, without mypy.
+
+        Only DataFrames created by pandas functions are recognized, e.g., 'df = pd.read_csv(path)'.
+
+        :param module: The module node where all nodes are located in.
+        :param requests: Dict with the request kinds as keys and (node type, expression) Tuples as
+            values.
+        :return: Dict with the request kinds as keys and the nodes with their guessed types as
+            values.
+        """
+        pandas_names = {"pandas"}
+        factory_names = set()
+        for node in ASTUtil.search_nodes(module, (astroid.Import, astroid.ImportFrom)):
+            for name, alias in node.names:
+                if isinstance(node, astroid.Import) and name == "pandas":
+                    pandas_names.add(alias or name)
+                elif isinstance(node, astroid.ImportFrom) and node.modname == "pandas":
+                    if name in TypeInference.DATAFRAME_FACTORIES:
+                        factory_names.add(alias or name)
+
+        variables_with_full_types = TypeInference.infer_variable_most_recent_full_types(module)
+        requests_with_types: Dict[str, Dict[astroid.node_classes.NodeNG, str]] = {
+            kind: {} for kind in requests
+        }
+        for kind, (node_type, expr) in requests.items():
+            for node in ASTUtil.search_indexed_nodes(module, node_type):
+                try:
+                    full_type = variables_with_full_types.get(expr(node), "")
+                except:  # pylint: disable = bare-except
+                    continue  # The attribute from the expression is not found. Continue.
+                parts = full_type.split(".") if isinstance(full_type, str) else []
+                if len(parts) == 1:
+                    is_dataframe = parts[0] in factory_names
+                else:
+                    is_dataframe = (
+                        len(parts) == 2
+                        and parts[0] in pandas_names
+                        and parts[1] in TypeInference.DATAFRAME_FACTORIES
+                    )
+                if is_dataframe:
+                    requests_with_types[kind][node] = '"pandas.core.frame.DataFrame"'
+        return requests_with_types
 
     @staticmethod
     def infer_variable_most_recent_full_types(module: astroid.Module) -> Dict[str, str]:
@@ -169,64 +474,34 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
-        variables_with_full_types = {}
-        nodes = ASTUtil.search_nodes(module, astroid.Assign)
-        for node in nodes:
-            if hasattr(node, "targets"):
-                for var in node.targets:
-                    if hasattr(var, "name"):
-                        variable_name = var.name
-                        if isinstance(node.value, astroid.nodes.Const):
-                            variables_with_full_types[variable_name] = 'const'
-                        elif hasattr(node.value, "func"):
-                            call = node.value.func
-                            full_type = ""
-                            if hasattr(call, "attrname"):
-                                full_type = "." + call.attrname + full_type
-                            while hasattr(call, "expr"):
-                                call = call.expr
-                                if hasattr(call, "attrname"):
-                                    full_type = "." + call.attrname + full_type
-                            if hasattr(call, "name"):
-                                full_type = call.name + full_type
-                            variables_with_full_types[variable_name] = full_type
-
-        return variables_with_full_types
-
-    @staticmethod
-    def infer_variable_full_types(module: astroid.Module) -> Dict[str, str]:
+        return AssignmentFacts.view(
+            module,
+            "most-recent-full",
+            lambda facts: {name: origins[-1] for name, origins in facts.items()},
+        )
+
+    @staticmethod
+    def infer_variable_full_types(module: astroid.Module) -> Dict[str, List[str]]:
         """
         When there is no stub available for a library (e.g., missing tensorflow-stubs),
         use this method instead of infer_types. Infer variable type in Assign nodes.
         :param module: code module
-        :return: Dict witn variable names and their inferred type
+        :return: Dict witn variable names and their inferred types since the last constant assigned
+            to them
         """
-        variables_with_full_types = {}
-        nodes = ASTUtil.search_nodes(module, astroid.Assign)
-        for node in nodes:
-            if hasattr(node, "targets"):
-                for var in node.targets:
-                    if hasattr(var, "name"):
-                        variable_name = var.name
-                        if isinstance(node.value, astroid.nodes.Const):
-                            variables_with_full_types[variable_name] = ['const']
-                        elif hasattr(node.value, "func"):
-                            call = node.value.func
-                            full_type = ""
-                            if hasattr(call, "attrname"):
-                                full_type = "." + call.attrname + full_type
-                            while hasattr(call, "expr"):
-                                call = call.expr
-                                if hasattr(call, "attrname"):
-                                    full_type = "." + call.attrname + full_type
-                            if hasattr(call, "name"):
-                                full_type = call.name + full_type
-                            if variable_name not in variables_with_full_types:
-                                variables_with_full_types[variable_name] = [full_type]
-                            else:
-                                variables_with_full_types[variable_name].append(full_type)
-
-        return variables_with_full_types
+
+        def derive(facts: Dict[str, List[str]]) -> Dict[str, List[str]]:
+            variables_with_full_types = {}
+            for name, origins in facts.items():
+                # A constant replaces the types of the values assigned before it.
+                last_const = max(
+                    (i for i, origin in enumerate(origins) if origin == AssignmentFacts.CONST),
+                    default=0,
+                )
+                variables_with_full_types[name] = origins[last_const:]
+            return variables_with_full_types
+
+        return AssignmentFacts.view(module, "full", derive)
 
     @staticmethod
     def infer_native_variable_most_recent_types(module: astroid.Module) -> Dict[str, str]:
@@ -236,11 +511,12 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
-        variables_with_types = {}
-        variables_with_full_types = TypeInference.infer_variable_most_recent_full_types(module)
-        for k, v in variables_with_full_types.items():
-            variables_with_types[k] = v.split(".")[0]
-        return variables_with_types
+
+        def derive(_) -> Dict[str, str]:
+            variables_with_full_types = TypeInference.infer_variable_most_recent_full_types(module)
+            return {k: v.split(".")[0] for k, v in variables_with_full_types.items()}
+
+        return AssignmentFacts.view(module, "native-most-recent", derive)
 
     @staticmethod
     def infer_library_variable_most_recent_types(module: astroid.Module) -> Dict[str, str]:
@@ -250,13 +526,13 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
-        variables_with_types = {}
-        variables_with_full_types = TypeInference.infer_variable_most_recent_full_types(module)
-        for k, v in variables_with_full_types.items():
-            strings = v.split(".")
-            if len(strings) >= 2:
-                variables_with_types[k] = strings[0] + "." + strings[1]
-        return variables_with_types
+        return AssignmentFacts.view(
+            module,
+            "library-most-recent",
+            lambda _: TypeInference._library_types(
+                TypeInference.infer_variable_most_recent_full_types(module)
+            ),
+        )
 
     @staticmethod
     def infer_library_variable_first_types(module: astroid.Module) -> Dict[str, str]:
@@ -266,10 +542,227 @@ class TypeInference:
         :param module: code module
         :return: Dict witn variable names and their inferred type
         """
+
+        def derive(_) -> Dict[str, str]:
+            variables_with_full_types = TypeInference.infer_variable_full_types(module)
+            return TypeInference._library_types(
+                {k: v[0] for k, v in variables_with_full_types.items()}
+            )
+
+        return AssignmentFacts.view(module, "library-first", derive)
+
+    @staticmethod
+    def _library_types(variables_with_full_types: Dict[str, str]) -> Dict[str, str]:
+        """
+        Keep the library and the function in the full types, e.g., 'tf.constant' of 'tf.constant.x'.
+
+        :param variables_with_full_types: Dict with variable names and their full types.
+        :return: Dict with variable names and their library types, without those which are not from
+            a library.
+        """
         variables_with_types = {}
-        variables_with_full_types = TypeInference.infer_variable_full_types(module)
         for k, v in variables_with_full_types.items():
-            strings = v[0].split(".")
+            strings = v.split(".")
             if len(strings) >= 2:
                 variables_with_types[k] = strings[0] + "." + strings[1]
         return variables_with_types
+
+
+class ModuleTypeInference:
+    """
+    Module-scoped type inference service shared by all checkers.
+
+    All registered requests are inferred together with a single mypy run the first time any
+    checker asks for the types of a module. The results are cached until another module is
+    inferred.
+    """
+
+    # Request kind for the type of the object a function is called on, e.g., 'df' in 'df.abs()'.
+    CALL_RECEIVER = "call-receiver"
+
+    # Modules which do not import these libraries and do not use these names are not inferred.
+    LIBRARIES = ("pandas", "pyspark")
+    NAMES = ("pd", "DataFrame")
+
+    # Infer the types in all modules, e.g., when DataFrames are passed between modules.
+    force = False
+
+    # [request kind, (type of node, expression to extract the attribute to infer from the node)]
+    _requests: Dict[str, Tuple[type, Callable]] = {
+        CALL_RECEIVER: (astroid.Call, lambda node: node.func.expr.name),
+    }
+
+    _module: Optional[astroid.Module] = None
+
+    # [request kind, [node, inferred type]]
+    _types: Dict[str, Dict[astroid.node_classes.NodeNG, str]] = {}
+
+    # [module, [request kind, [node, inferred type]]] inferred before the module is visited.
+    _prepared: Dict[astroid.Module, Dict[str, Dict[astroid.node_classes.NodeNG, str]]] = {}
+
+    # Modules of which the types are guessed, because mypy exceeded the time budget.
+    _degraded: Set[astroid.Module] = set()
+
+    @staticmethod
+    def get_requests() -> Dict[str, Tuple[type, Callable]]:
+        """
+        Get all registered requests.
+
+        :return: Dict with the request kinds as keys and (node type, expression) Tuples as values.
+        """
+        return dict(ModuleTypeInference._requests)
+
+    @staticmethod
+    def prepare(module: astroid.Module, types: Dict[str, Dict[astroid.node_classes.NodeNG, str]]):
+        """
+        Store the types inferred before the module is visited, e.g., by a mypy run on the project.
+
+        :param module: The module node where all nodes are located in.
+        :param types: Dict with the request kinds as keys and the nodes with their inferred types
+            as values.
+        """
+        ModuleTypeInference._prepared[module] = types
+
+    @staticmethod
+    def register(kind: str, node_type: type, expr: Callable):
+        """
+        Register a request, so its types are inferred in the same mypy run as the other requests.
+
+        :param kind: Name of the request kind.
+        :param node_type: Type of node of which the type will be inferred on a certain attribute.
+        :param expr: Expression to extract the attribute from the node where the type will be
+            inferred on. E.g., lambda node: node.func.expr.name
+        """
+        ModuleTypeInference._requests[kind] = (node_type, expr)
+
+    @staticmethod
+    def get_types(module: astroid.Module, kind: str) -> Dict[astroid.node_classes.NodeNG, str]:
+        """
+        Get the inferred types of a registered request in a module.
+
+        :param module: The module node where all nodes are located in.
+        :param kind: Name of the registered request kind.
+        :return: All nodes of the request with the inferred type of their attribute.
+        """
+        if module is not ModuleTypeInference._module:
+            ModuleTypeInference._module = module
+            ModuleTypeInference._types = ModuleTypeInference._prepared.pop(module, {})
+        if kind not in ModuleTypeInference._types:
+            if not ModuleTypeInference.needs_inference(module):
+                ModuleTypeInference._types[kind] = {}
+                return ModuleTypeInference._types[kind]
+            # Kinds registered after the module is inferred will get a mypy run of their own.
+            pending = {
+                pending_kind: request
+                for pending_kind, request in ModuleTypeInference._requests.items()
+                if pending_kind not in ModuleTypeInference._types
+            }
+            try:
+                inferred = TypeInference.infer_requested_types(module, pending)
+            except TimeBudgetExceeded:
+                ModuleTypeInference._degraded.add(module)
+                inferred = TypeInference.infer_requested_types_from_assignments(module, pending)
+            ModuleTypeInference._types.update(inferred)
+        return ModuleTypeInference._types[kind]
+
+    @staticmethod
+    def pop_degraded(module: astroid.Module) -> bool:
+        """
+        Check whether the types of a module are guessed because mypy exceeded the time budget.
+
+        :param module: The module node to check.
+        :return: True when the types are guessed. The module is forgotten afterwards.
+        """
+        if module in ModuleTypeInference._degraded:
+            ModuleTypeInference._degraded.discard(module)
+            return True
+        return False
+
+    @staticmethod
+    def release(module: astroid.Module):
+        """
+        Drop the types of a module after it is checked, also when they are never requested.
+
+        :param module: The module node which is checked.
+        """
+        ModuleTypeInference._prepared.pop(module, None)
+        ModuleTypeInference._degraded.discard(module)
+        if module is ModuleTypeInference._module:
+            ModuleTypeInference._module = None
+            ModuleTypeInference._types = {}
+
+    @staticmethod
+    def needs_inference(module: astroid.Module) -> bool:
+        """
+        Check whether the types in a module can be relevant, so mypy is only ran when it is needed.
+
+        :param module: The module node to check.
+        :return: True when inference is forced or the module imports one of the libraries or uses
+            one of the names, e.g., 'import pandas as pd' or 'from pyspark.sql import DataFrame'.
+        """
+        if ModuleTypeInference.force:
+            return True
+        node_types = (astroid.Import, astroid.ImportFrom, astroid.Name)
+        for node in ASTUtil.search_nodes(module, node_types):
+            if isinstance(node, astroid.Import):
+                imported = [name for name, _ in node.names]
+            elif isinstance(node, astroid.ImportFrom):
+                imported = [node.modname] if node.level is None else []
+            elif node.name in ModuleTypeInference.NAMES:
+                return True
+            else:
+                continue
+            if any(name.split(".")[0] in ModuleTypeInference.LIBRARIES for name in imported):
+                return True
+        return False
+
+    @staticmethod
+    def modules_needing_inference(
+        file_descriptors: Iterable[Tuple[str, str]]
+    ) -> Iterator[astroid.Module]:
+        """
+        Get the modules which need type inference, before they are checked.
+
+        :param file_descriptors: (module name, file path) Tuples of the modules, in the order they
+            are checked.
+        :return: Modules which need type inference, in the same order.
+        """
+        for modname, filepath in file_descriptors:
+            try:
+                module = MANAGER.ast_from_file(filepath, modname, source=True)
+            except astroid.AstroidBuildingException:
+                continue  # pylint reports the module itself.
+            if ModuleTypeInference.needs_inference(module):
+                yield module
+
+    @staticmethod
+    def upcoming_runs(
+        file_descriptors: Iterable[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, Callable[[str], Any], str]]:
+        """
+        Get the mypy runs of modules before they are checked, e.g., to run them in the background.
+
+        The runs are the ones get_types starts when it is first called for the modules, with all
+        registered requests. Modules which do not need inference or of which the types are in the
+        cache are skipped.
+
+        :param file_descriptors: (module name, file path) Tuples of the modules, in the order they
+            are checked.
+        :return: (module file, function running mypy, code to run it on) Tuples.
+        """
+        for module in ModuleTypeInference.modules_needing_inference(file_descriptors):
+            requests = ModuleTypeInference.get_requests()
+            function, code, _, _ = TypeInference.prepare_mypy_run(module, requests)
+            context = TypeInferenceCache.module_context(
+                module, "build" if TypeInference.backend == "build" else ""
+            )
+            if TypeInferenceCache.get(code, context) is None:
+                yield module.file, function, code
+
+    @staticmethod
+    def clear():
+        """Drop the cached and prepared types."""
+        ModuleTypeInference._module = None
+        ModuleTypeInference._types = {}
+        ModuleTypeInference._prepared = {}
+        ModuleTypeInference._degraded = set()
@@ -0,0 +1,279 @@
+"""Utility module for caching the types inferred by mypy on disk."""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import astroid
+import mypy.version
+from astroid import MANAGER
+from astroid.modutils import EXT_LIB_DIRS, STD_LIB_DIRS
+
+from dslinter.utils.ast import ASTUtil
+from dslinter.utils.module_imports import ModuleImports
+
+try:
+    from importlib import metadata
+except ImportError:  # Python 3.7
+    metadata = None
+
+
+class TypeInferenceCache:
+    """
+    Utility class for caching the types inferred by mypy on disk, across pylint runs.
+
+    The cache is content addressed: the key of an entry is a hash of the instrumented source code,
+    the code of the local modules it imports, the mypy version and the versions of the installed
+    stub packages. When the size of the cache
+    exceeds its maximum, the least recently used entries are evicted.
+    """
+
+    enabled = False
+    directory = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.join("~", ".cache")), "dslinter"
+    )
+    max_size = 64 * 1024 * 1024
+
+    # Directories of the standard library and the installed packages, of which the imported modules
+    # are not part of the context of a module.
+    LIBRARY_DIRECTORIES = tuple(
+        os.path.join(os.path.abspath(directory), "") for directory in STD_LIB_DIRS | EXT_LIB_DIRS
+    )
+
+    _environment: Optional[str] = None
+    _size: Optional[int] = None
+
+    @staticmethod
+    def configure(enabled: bool, directory: str, max_size: int):
+        """
+        Configure the cache.
+
+        :param enabled: Whether inferred types are read from and written to the cache.
+        :param directory: Directory the cache is stored in.
+        :param max_size: Maximum size of the cache in bytes.
+        """
+        TypeInferenceCache.enabled = enabled
+        TypeInferenceCache.directory = directory
+        TypeInferenceCache.max_size = max_size
+        TypeInferenceCache._size = None
+
+    @staticmethod
+    def get(code: str, context: str = "") -> Optional[List[Tuple]]:
+        """
+        Get the types mypy inferred for some code from the cache.
+
+        :param code: Code mypy is ran on, including the reveal_type() calls if any.
+        :param context: Anything else the inferred types depend on, e.g., the name of the module
+            when it is type checked together with the other modules of a project.
+        :return: List of Tuples ending with an inferred type, e.g., (line number, inferred type)
+            Tuples, or None if the code is not cached.
+        """
+        path = TypeInferenceCache._entry_path(code, context)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                types = json.load(file)
+        except (OSError, ValueError):
+            return None
+        try:
+            # The modification time is the last time the entry is used.
+            os.utime(path)
+        except OSError:
+            pass
+        return [tuple(entry) for entry in types]
+
+    @staticmethod
+    def put(code: str, types: List[Tuple], context: str = ""):
+        """
+        Store the types mypy inferred for some code in the cache.
+
+        :param code: Code mypy is ran on, including the reveal_type() calls if any.
+        :param types: List of Tuples ending with an inferred type, e.g., (line number, inferred
+            type) Tuples.
+        :param context: Anything else the inferred types depend on, like in get().
+        """
+        path = TypeInferenceCache._entry_path(code, context)
+        if path is None:
+            return
+        content = json.dumps(types)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first, so a parallel run never reads a partial entry.
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        if TypeInferenceCache._size is None:
+            TypeInferenceCache._size = sum(size for _, size, _ in TypeInferenceCache._entries())
+        else:
+            TypeInferenceCache._size += len(content)
+        if TypeInferenceCache._size > TypeInferenceCache.max_size:
+            TypeInferenceCache.evict()
+
+    @staticmethod
+    def evict():
+        """Remove the least recently used entries until the cache is below its maximum size."""
+        entries = sorted(TypeInferenceCache._entries(), key=lambda entry: entry[2])
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for path, entry_size, _ in entries:
+            if size <= TypeInferenceCache.max_size:
+                break
+            try:
+                os.remove(path)
+                size -= entry_size
+            except OSError:
+                pass
+        TypeInferenceCache._size = size
+
+    @staticmethod
+    def module_context(module: astroid.Module, prefix: str) -> str:
+        """
+        Get the cache context of the types of a module which is type checked on its own.
+
+        mypy also type checks the local modules the module imports, directly or through other
+        modules, so the context holds a hash of their code, like for the modules of a project build.
+        The modules of the standard library and the installed packages are left out.
+
+        :param module: Module which is type checked.
+        :param prefix: Prefix of the context, which tells the kind of mypy run.
+        :return: Cache context of the module.
+        """
+        if not TypeInferenceCache.enabled:
+            return prefix
+        imported = TypeInferenceCache._local_imported_modules(module)
+        codes = {other.name: ASTUtil.get_source_code(other) for other in imported}
+        return TypeInferenceCache.contexts(prefix, [module] + imported, codes)[module.name]
+
+    @staticmethod
+    def contexts(
+        prefix: str, modules: List[astroid.Module], codes: Dict[str, str]
+    ) -> Dict[str, str]:
+        """
+        Get the cache contexts of modules which are type checked together.
+
+        The types of a module also depend on the other modules it imports, directly or through
+        other modules, so the context holds a hash of their code.
+
+        :param prefix: Prefix of the contexts, which tells the kind of mypy run.
+        :param modules: Modules which are type checked together.
+        :param codes: Dict with the names of the modules as keys and the code mypy checks as values.
+        :return: Dict with the names of the modules as keys and their cache contexts as values.
+        """
+        imports = {
+            module.name: ModuleImports.importable_modules(module) & set(codes)
+            for module in modules
+        }
+        contexts = {}
+        for module in modules:
+            dependencies = set()
+            stack = [module.name]
+            while stack:
+                for name in imports.get(stack.pop(), ()):
+                    if name not in dependencies:
+                        dependencies.add(name)
+                        stack.append(name)
+            digest = hashlib.sha256()
+            for name in sorted(dependencies - {module.name}):
+                digest.update("\0".join((name, codes[name], "")).encode("utf-8"))
+            contexts[module.name] = f"{prefix}:{module.name}:{digest.hexdigest()}"
+        return contexts
+
+    @staticmethod
+    def _local_imported_modules(module: astroid.Module) -> List[astroid.Module]:
+        """
+        Get the local modules a module imports, directly or through other local modules.
+
+        :param module: Module to get the imports of.
+        :return: The imported modules which are not in the standard library or an installed package.
+        """
+        modules = {module.name: module}
+        seen = {module.name}
+        stack = [module]
+        while stack:
+            importer = stack.pop()
+            for name in sorted(ModuleImports.importable_modules(importer) - seen):
+                seen.add(name)
+                try:
+                    spec = MANAGER.file_from_module_name(name, importer.file)
+                    if spec.location is None or os.path.abspath(spec.location).startswith(
+                        TypeInferenceCache.LIBRARY_DIRECTORIES
+                    ):
+                        continue
+                    imported = MANAGER.ast_from_module_name(name, importer.file)
+                except astroid.AstroidBuildingException:
+                    continue  # 'from package import name' where name is not a module.
+                modules[name] = imported
+                stack.append(imported)
+        del modules[module.name]
+        return list(modules.values())
+
+    @staticmethod
+    def _entries() -> List[Tuple[str, int, float]]:
+        """
+        Get all entries in the cache.
+
+        :return: List of (path, size, last used time) Tuples.
+        """
+        entries = []
+        directory = os.path.expanduser(TypeInferenceCache.directory)
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    @staticmethod
+    def _entry_path(code: str, context: str) -> Optional[str]:
+        """
+        Get the path of the cache entry of some code.
+
+        :param code: Code mypy is ran on.
+        :param context: Anything else the inferred types depend on.
+        :return: Path of the cache entry or None when the cache cannot be used.
+        """
+        if not TypeInferenceCache.enabled:
+            return None
+        environment = TypeInferenceCache._get_environment()
+        if environment is None:
+            return None
+        key = hashlib.sha256("\0".join((environment, context, code)).encode("utf-8")).hexdigest()
+        # Entries are spread over subdirectories, so no directory gets too many files.
+        return os.path.join(
+            os.path.expanduser(TypeInferenceCache.directory), key[:2], key + ".json"
+        )
+
+    @staticmethod
+    def _get_environment() -> Optional[str]:
+        """
+        Get the versions of mypy and the installed stub packages the inferred types depend on.
+
+        :return: The versions as string or None if the installed stub packages cannot be determined.
+        """
+        if TypeInferenceCache._environment is None and metadata is not None:
+            stubs = sorted(
+                f"{distribution.metadata['Name']}=={distribution.version}"
+                for distribution in metadata.distributions()
+                if TypeInferenceCache._is_stub_package(distribution.metadata["Name"] or "")
+            )
+            versions = [f"mypy=={mypy.version.__version__}"] + stubs
+            TypeInferenceCache._environment = ";".join(versions)
+        return TypeInferenceCache._environment
+
+    @staticmethod
+    def _is_stub_package(name: str) -> bool:
+        """
+        Check if a package provides stubs, e.g., pyspark-stubs, data-science-types or types-six.
+
+        :param name: Name of the package.
+        :return: True when the package provides stubs.
+        """
+        name = name.lower().replace("_", "-")
+        return name.endswith("-stubs") or name.endswith("-types") or name.startswith("types-")
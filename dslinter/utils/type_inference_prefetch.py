@@ -0,0 +1,137 @@
+"""Utility module for running mypy on the next modules in background processes."""
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from dslinter.utils.scratch_directory import ScratchDirectory
+from dslinter.utils.time_budget import TimeBudgetExceeded
+
+
+class TypeInferencePrefetch:
+    """
+    Utility class for running mypy on the next modules in a pool of processes while pylint checks
+    the current one.
+
+    The runs are submitted in the order pylint checks the modules, at most a window of runs ahead of
+    the module which is checked. A module only uses the result of its run when it would run mypy on
+    exactly the same code, e.g., not when a checker registered a request after the run is submitted.
+    Otherwise, or when the process running mypy fails, mypy is ran in this process like it is
+    without prefetching. The processes are forked, so they start with the configuration of this
+    process. Where fork is not available, nothing is prefetched.
+    """
+
+    # Number of runs submitted ahead per process, so a process does not wait for the next module to
+    # be submitted.
+    RUNS_PER_PROCESS = 2
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _window = 0
+
+    # (module file, function running mypy, code to run it on) of the next modules, which are not
+    # submitted yet.
+    _upcoming: Iterator[Tuple[str, Callable[[str], Any], str]] = iter(())
+
+    # [module file, (function running mypy, code to run it on, future of the result)]
+    _runs: Dict[str, Tuple[Callable[[str], Any], str, Future]] = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Check whether mypy can be ran in background processes on this platform.
+
+        :return: True when processes can be forked.
+        """
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    @staticmethod
+    def start(processes: int, runs: Iterable[Tuple[str, Callable[[str], Any], str]]):
+        """
+        Start the processes and submit the first runs.
+
+        :param processes: Number of processes running mypy.
+        :param runs: (module file, function running mypy, code to run it on) Tuples in the order the
+            modules are checked. They are only taken when they are submitted, so the modules can be
+            parsed lazily.
+        """
+        TypeInferencePrefetch.stop()
+        TypeInferencePrefetch._executor = ProcessPoolExecutor(
+            processes,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=TypeInferencePrefetch._initialize_process,
+        )
+        TypeInferencePrefetch._window = processes * TypeInferencePrefetch.RUNS_PER_PROCESS
+        TypeInferencePrefetch._upcoming = iter(runs)
+        TypeInferencePrefetch._submit_upcoming()
+
+    @staticmethod
+    def _initialize_process():
+        """Remove the scratch directory when the process exits, as it skips the exit handlers."""
+        multiprocessing.util.Finalize(None, ScratchDirectory.remove, exitpriority=0)
+
+    @staticmethod
+    def _submit_upcoming():
+        """Submit the runs of the next modules until the window is full."""
+        # The window is empty when the processes are not started.
+        while len(TypeInferencePrefetch._runs) < TypeInferencePrefetch._window:
+            try:
+                run = next(TypeInferencePrefetch._upcoming, None)
+                if run is None:
+                    return
+                path, function, code = run
+                future = TypeInferencePrefetch._executor.submit(function, code)
+            except Exception:  # pylint: disable=broad-except
+                # E.g., the pool is broken because a process is killed. The next modules run mypy
+                # themselves.
+                TypeInferencePrefetch._upcoming = iter(())
+                return
+            TypeInferencePrefetch._runs[path] = (function, code, future)
+
+    @staticmethod
+    def result(path: Optional[str], function: Callable[[str], Any], code: str) -> Any:
+        """
+        Get the result of running mypy on the code of a module, from its prefetched run when there
+        is one.
+
+        :param path: File of the module, None when it is not read from a file.
+        :param function: Function running mypy.
+        :param code: Code to run mypy on.
+        :return: What the function returns for the code.
+        :raises TimeBudgetExceeded: When mypy does not finish within the budget.
+        """
+        run = TypeInferencePrefetch._runs.pop(path, None)
+        if run is None or run[:2] != (function, code):
+            if run is not None:
+                run[2].cancel()
+            return function(code)
+        try:
+            return run[2].result()
+        except TimeBudgetExceeded:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            return function(code)
+
+    @staticmethod
+    def release(path: Optional[str]):
+        """
+        Drop the run of a module after it is checked, also when it is never used, and submit the
+        next runs.
+
+        :param path: File of the module which is checked.
+        """
+        run = TypeInferencePrefetch._runs.pop(path, None)
+        if run is not None:
+            run[2].cancel()
+        TypeInferencePrefetch._submit_upcoming()
+
+    @staticmethod
+    def stop():
+        """Cancel the runs which are not started and stop the processes."""
+        for _, _, future in TypeInferencePrefetch._runs.values():
+            future.cancel()
+        if TypeInferencePrefetch._executor is not None:
+            TypeInferencePrefetch._executor.shutdown(wait=True)
+        TypeInferencePrefetch._executor = None
+        TypeInferencePrefetch._window = 0
+        TypeInferencePrefetch._upcoming = iter(())
+        TypeInferencePrefetch._runs = {}